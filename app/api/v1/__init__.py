@@ -1,5 +1,7 @@
 from fastapi import APIRouter
 from app.api.v1.ocr import router as ocr_router
+from app.api.v1.system import router as system_router
 
 router = APIRouter()
-router.include_router(ocr_router, prefix="/ocr", tags=["OCR"])
\ No newline at end of file
+router.include_router(ocr_router, prefix="/ocr", tags=["OCR"])
+router.include_router(system_router, prefix="/system", tags=["System"])
\ No newline at end of file
@@ -1,44 +1,186 @@
-from fastapi import APIRouter, UploadFile, File, Response
+from fastapi import APIRouter, UploadFile, File, Query, Request, WebSocket
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Union
+from datetime import date
+import orjson
 import json
 import io
+import tempfile
 
-from app.models import OCRInput
-from app.services import OCRParserService
-from app.core.responses import ApiResponse, CustomException, ErrorStatus
+from app.models import OCRInput, WeighbridgeTicket
+from app.services import OCRParserService, TicketExportService, BatchValidationService, NDJSONStreamService, NearDuplicateService, LayoutTemplateService, SiteRegistry, TicketIngestService
+from app.repositories import TicketRepository
+from app.core.compression import decompress_stream, upload_encoding
+from app.core.config import settings
+from app.core.responses import ApiResponse, ApiJSONResponse, DuplexStreamingResponse, CustomException, ErrorStatus
 from app.core.utils import dict_to_csv
-from .dtos import OCRRequest, WeighbridgeResponse
+from .dtos import OCRRequest, WeighbridgeResponse, TicketPageResponse, NearbyTicketResponse
+from .websocket import OCRWebSocketSession
 
 router = APIRouter()
-parser_service = OCRParserService()
+template_service = (
+    LayoutTemplateService(settings.template_store_path, match_threshold=settings.template_match_threshold)
+    if settings.template_enabled else None
+)
+site_registry = SiteRegistry.from_file(settings.site_registry_path, max_distance_m=settings.site_max_distance_m)
+parser_service = OCRParserService(template_service=template_service, site_registry=site_registry)
+export_service = TicketExportService()
+validation_service = BatchValidationService()
+ticket_repository = TicketRepository(settings.ticket_db_path, batch_size=settings.ticket_db_batch_size)
+ingest_service = TicketIngestService(
+    parser_service,
+    validation_service,
+    ticket_repository,
+    NearDuplicateService(threshold=settings.dedup_threshold, window_sec=settings.dedup_window_sec),
+    dedup_mode=settings.dedup_mode,
+)
+
+async def _load_ocr_input(file: UploadFile) -> OCRInput:
+    """
+    업로드된 OCR 결과 파일을 검증하고 도메인 모델로 변환합니다. (.json.gz / .json.zst는 스레드풀에서 스트리밍 해제)
+    """
+    encoding = upload_encoding(file.filename)
+    if encoding is None:
+        content = await file.read()
+    else:
+        content = await run_in_threadpool(
+            decompress_stream, file.file, encoding, settings.upload_max_decompressed_bytes
+        )
+
+    try:
+        json_data = json.loads(content)
+    except json.JSONDecodeError:
+        raise CustomException(ErrorStatus.INVALID_JSON_FORMAT)
+
+    ocr_request = OCRRequest(**json_data)
+    return OCRInput(**ocr_request.model_dump())
+
+def _iter_spooled(spool: BinaryIO, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """
+    임시 파일 내용을 청크 단위로 읽고 전송이 끝나면 닫습니다. (StreamingResponse가 스레드풀에서 순회)
+    """
+    try:
+        while chunk := spool.read(chunk_size):
+            yield chunk
+    finally:
+        spool.close()
+
+def _parse_and_save(raw: Union[bytes, Dict[str, Any]]) -> WeighbridgeTicket:
+    """
+    OCR 문서(JSON bytes 또는 dict)를 검증, 파싱 후 저장합니다. (스트림/WebSocket용, 스레드풀에서 실행)
+    """
+    try:
+        if isinstance(raw, bytes):
+            ocr_request = OCRRequest.model_validate_json(raw)
+        else:
+            ocr_request = OCRRequest.model_validate(raw)
+    except ValidationError as e:
+        errors = e.errors()
+        if any(error["type"] == "json_invalid" for error in errors):
+            raise CustomException(ErrorStatus.INVALID_JSON_FORMAT)
+        loc = ".".join(str(part) for part in errors[0]["loc"]) or "body"
+        raise CustomException(ErrorStatus.VALIDATION_ERROR, message=f"{loc}: {errors[0]['msg']}")
+
+    return ingest_service.ingest(OCRInput(**ocr_request.model_dump()))
+
+stream_service = NDJSONStreamService(
+    _parse_and_save,
+    max_in_flight=settings.stream_max_in_flight,
+    max_line_bytes=settings.stream_max_line_bytes,
+)
 
 @router.post(
     "/upload-ocr",
     response_model=ApiResponse[WeighbridgeResponse],
     summary="OCR 결과 파일 업로드 파싱",
-    description="OCR 결과가 담긴 `.json` 파일을 업로드하여 계근지 정보를 파싱합니다.",
+    description="OCR 결과가 담긴 `.json` 파일(gzip `.json.gz`, zstd `.json.zst` 압축 가능)을 업로드하여 계근지 정보를 파싱하고 저장합니다.",
     response_description="파싱된 계근지 데이터"
 )
-async def upload_ocr_file(file: UploadFile = File(..., description="OCR 결과 JSON 파일")):
+async def upload_ocr_file(
+    file: UploadFile = File(..., description="OCR 결과 JSON 파일"),
+    budget_ms: Optional[float] = Query(None, gt=0, description="파싱 시간 예산 (ms). 초과 시 부분 결과와 `skipped_stages` 반환"),
+):
     """
     OCR 결과 JSON 파일을 업로드합니다.
     """
-    if not file.filename.endswith('.json'):
-        raise CustomException(ErrorStatus.INVALID_FILE_EXTENSION)
+    ocr_input = await _load_ocr_input(file)
+    ticket = await run_in_threadpool(ingest_service.ingest, ocr_input, budget_ms=budget_ms)
+    response = WeighbridgeResponse(**ticket.model_dump())
 
-    try:
-        content = await file.read()
-        json_data = json.loads(content)
-        
-        ocr_request = OCRRequest(**json_data)
-        ocr_input = OCRInput(**ocr_request.model_dump())
-        ticket = parser_service.parse(ocr_input)
-        response = WeighbridgeResponse(**ticket.model_dump())
-        
-        return ApiResponse.success_response(data=response)
-        
-    except json.JSONDecodeError:
-        raise CustomException(ErrorStatus.INVALID_JSON_FORMAT)
+    return ApiJSONResponse(ApiResponse.success_response(data=response))
+
+@router.post(
+    "/upload-ocr/batch",
+    response_model=ApiResponse[List[WeighbridgeResponse]],
+    summary="OCR 결과 파일 일괄 업로드 파싱",
+    description="여러 OCR 결과 `.json` 파일(`.json.gz`, `.json.zst` 가능)을 업로드하여 파싱 및 배치 교차 검증 후 일괄 저장합니다.",
+    response_description="파싱된 계근지 데이터 목록"
+)
+async def upload_ocr_files(files: List[UploadFile] = File(..., description="OCR 결과 JSON 파일 목록")):
+    """
+    여러 OCR 결과 JSON 파일을 업로드합니다.
+    """
+    ocr_inputs = [await _load_ocr_input(file) for file in files]
+    tickets = await run_in_threadpool(ingest_service.ingest_batch, ocr_inputs)
+
+    return ApiJSONResponse(ApiResponse.success_response(data=[WeighbridgeResponse(**t.model_dump()) for t in tickets]))
+
+@router.get(
+    "/tickets",
+    response_model=ApiResponse[TicketPageResponse],
+    summary="저장된 계근지 조회",
+    description="차량번호, 회사명, 계량소, 계량일자 범위로 저장된 계근지를 조회합니다. `next_cursor`를 `cursor`로 전달하여 다음 페이지를 조회합니다.",
+    response_description="계근지 목록 및 다음 페이지 커서"
+)
+async def find_tickets(
+    vehicle_number: Optional[str] = Query(None, description="차량번호", examples=["5405"]),
+    company_name: Optional[str] = Query(None, description="회사명"),
+    site_id: Optional[str] = Query(None, description="계량소 ID", examples=["DONGWOO-BIO"]),
+    date_from: Optional[date] = Query(None, description="계량일자 시작 (포함)", examples=["2026-02-01"]),
+    date_to: Optional[date] = Query(None, description="계량일자 끝 (포함)", examples=["2026-02-28"]),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(100, ge=1, le=1000, description="페이지 크기"),
+):
+    """
+    저장된 계근지를 Keyset 페이지네이션으로 조회합니다.
+    """
+    tickets, next_cursor = await run_in_threadpool(
+        ticket_repository.find,
+        vehicle_number=vehicle_number,
+        company_name=company_name,
+        site_id=site_id,
+        date_from=date_from.isoformat() if date_from else None,
+        date_to=date_to.isoformat() if date_to else None,
+        cursor=cursor,
+        limit=limit,
+    )
+    page = TicketPageResponse(
+        items=[WeighbridgeResponse(**t.model_dump()) for t in tickets],
+        next_cursor=next_cursor,
+    )
+    return ApiJSONResponse(ApiResponse.success_response(data=page))
+
+@router.get(
+    "/tickets/nearby",
+    response_model=ApiResponse[List[NearbyTicketResponse]],
+    summary="반경 내 계근지 조회",
+    description="지정한 좌표로부터 `radius_m` 이내에서 계량된 계근지를 가까운 순으로 조회합니다.",
+    response_description="거리순 계근지 목록"
+)
+async def find_nearby_tickets(
+    latitude: float = Query(..., ge=-90, le=90, description="위도", examples=[37.105317]),
+    longitude: float = Query(..., ge=-180, le=180, description="경도", examples=[127.375673]),
+    radius_m: float = Query(1000.0, gt=0, le=100_000, description="반경 (m)"),
+    limit: int = Query(100, ge=1, le=1000, description="최대 조회 건수"),
+):
+    """
+    좌표 기준 반경 내 계근지를 조회합니다.
+    """
+    found = await run_in_threadpool(ticket_repository.find_nearby, latitude, longitude, radius_m, limit=limit)
+    items = [NearbyTicketResponse(**ticket.model_dump(), distance_m=round(distance, 1)) for ticket, distance in found]
+    return ApiJSONResponse(ApiResponse.success_response(data=items))
 
 @router.post(
     "/export/csv",
@@ -50,59 +192,113 @@ async def export_ocr_to_csv(file: UploadFile = File(..., description="OCR 결과
     """
     OCR 결과 JSON 파일을 받아 파싱된 데이터를 CSV 파일로 반환합니다.
     """
-    if not file.filename.endswith('.json'):
-        raise CustomException(ErrorStatus.INVALID_FILE_EXTENSION)
+    # Validation & Parsing
+    ocr_input = await _load_ocr_input(file)
+    ticket = parser_service.parse(ocr_input)
+    response_dto = WeighbridgeResponse(**ticket.model_dump())
 
-    try:
-        content = await file.read()
-        json_data = json.loads(content)
-        
-        # Validation & Parsing
-        ocr_request = OCRRequest(**json_data)
-        ocr_input = OCRInput(**ocr_request.model_dump())
-        ticket = parser_service.parse(ocr_input)
-        response_dto = WeighbridgeResponse(**ticket.model_dump())
-        
-        # DTO를 dict로 변환 후 CSV 문자열 생성
-        csv_content = dict_to_csv(response_dto.model_dump())
-        
-        return StreamingResponse(
-            io.StringIO(csv_content),
-            media_type="text/csv",
-            headers={"Content-Disposition": "attachment; filename=weighbridge_ticket.csv"}
-        )
-    except json.JSONDecodeError:
-        raise CustomException(ErrorStatus.INVALID_JSON_FORMAT)
+    # DTO를 dict로 변환 후 CSV 문자열 생성
+    csv_content = dict_to_csv(response_dto.model_dump())
+
+    return StreamingResponse(
+        io.StringIO(csv_content),
+        media_type="text/csv",
+        headers={"Content-Disposition": "attachment; filename=weighbridge_ticket.csv"}
+    )
 
 @router.post(
     "/export/json",
     summary="파싱 결과 JSON 파일 다운로드",
     description="OCR 결과 JSON 파일을 업로드하여 파싱 후 JSON 파일로 다운로드합니다.",
-    response_class=Response
+    response_class=ApiJSONResponse
 )
 async def export_ocr_to_json(file: UploadFile = File(..., description="OCR 결과 JSON 파일")):
     """
     OCR 결과 JSON 파일을 받아 파싱된 데이터를 JSON 파일로 반환합니다.
     """
-    if not file.filename.endswith('.json'):
-        raise CustomException(ErrorStatus.INVALID_FILE_EXTENSION)
+    # Validation & Parsing
+    ocr_input = await _load_ocr_input(file)
+    ticket = parser_service.parse(ocr_input)
+    response_dto = WeighbridgeResponse(**ticket.model_dump())
 
+    return ApiJSONResponse(
+        response_dto.model_dump(exclude_none=True),
+        indent=True,
+        headers={"Content-Disposition": "attachment; filename=weighbridge_ticket.json"}
+    )
+
+@router.post(
+    "/export/parquet",
+    summary="파싱 결과 Parquet 다운로드 (배치)",
+    description="여러 OCR 결과 JSON 파일을 업로드하여 파싱 및 배치 교차 검증 후 컬럼 포맷(Parquet) 파일로 다운로드합니다.",
+    response_class=StreamingResponse
+)
+async def export_ocr_to_parquet(files: List[UploadFile] = File(..., description="OCR 결과 JSON 파일 목록")):
+    """
+    여러 OCR 결과 JSON 파일을 받아 파싱된 데이터를 하나의 Parquet 파일로 반환합니다.
+    """
+    # 업로드를 하나씩 읽어 바로 파싱 (원본 OCR 문서를 동시에 보관하지 않고 파싱된 티켓만 유지)
+    tickets = []
+    for file in files:
+        ocr_input = await _load_ocr_input(file)
+        tickets.append(await run_in_threadpool(parser_service.parse, ocr_input))
+
+    # 배치 단위 교차 검증 (차량별 공차 편차, 시간 순서 등) 후 이상치는 uncertain 표시
+    tickets = validation_service.validate(tickets)
+
+    # row group 단위로 기록, 결과가 크면 메모리 대신 임시 파일에 보관 후 청크 단위로 전송
+    spool = tempfile.SpooledTemporaryFile(max_size=settings.export_spool_max_bytes)
     try:
-        content = await file.read()
-        json_data = json.loads(content)
-        
-        # Validation & Parsing
-        ocr_request = OCRRequest(**json_data)
-        ocr_input = OCRInput(**ocr_request.model_dump())
-        ticket = parser_service.parse(ocr_input)
-        response_dto = WeighbridgeResponse(**ticket.model_dump())
-        
-        json_content = response_dto.model_dump_json(indent=2, exclude_none=True)
-        
-        return Response(
-            content=json_content,
-            media_type="application/json",
-            headers={"Content-Disposition": "attachment; filename=weighbridge_ticket.json"}
-        )
-    except json.JSONDecodeError:
-        raise CustomException(ErrorStatus.INVALID_JSON_FORMAT)
+        await run_in_threadpool(export_service.write_parquet, iter(tickets), spool)
+    except BaseException:
+        spool.close()
+        raise
+    del tickets
+    spool.seek(0)
+
+    return StreamingResponse(
+        _iter_spooled(spool),
+        media_type="application/vnd.apache.parquet",
+        headers={"Content-Disposition": "attachment; filename=weighbridge_tickets.parquet"}
+    )
+
+@router.post(
+    "/stream/ndjson",
+    summary="OCR 결과 NDJSON 스트림 파싱",
+    description=(
+        "한 줄에 OCR 결과 JSON 1건씩 담긴 NDJSON 본문(chunked 전송 가능)을 받아, "
+        "문서가 파싱되는 즉시 결과를 NDJSON 한 줄씩 스트리밍합니다. "
+        "결과는 완료 순서로 전송되며 `seq`(요청 내 문서 순번, 0부터)로 원본 문서와 매칭합니다."
+    ),
+    response_class=DuplexStreamingResponse,
+)
+async def stream_ocr_ndjson(request: Request):
+    """
+    연결 하나로 연속된 OCR 결과를 파싱합니다. (문서 단위 에러는 해당 줄의 에러 응답으로 전달)
+    """
+    async def results():
+        async for seq, result in stream_service.process(request.stream()):
+            if isinstance(result, CustomException):
+                envelope = ApiResponse.error_response(code=result.error_status.code, message=result.message, data=result.data)
+            else:
+                envelope = ApiResponse.success_response(data=WeighbridgeResponse(**result.model_dump()))
+            yield orjson.dumps({"seq": seq, **envelope.model_dump()}) + b"\n"
+
+    return DuplexStreamingResponse(results(), media_type="application/x-ndjson")
+
+@router.websocket("/ws")
+async def ocr_websocket(websocket: WebSocket):
+    """
+    계량소 단말용 WebSocket 세션
+
+    - 요청: `{"id": "<상관관계 ID>", "payload": <OCRRequest>}`
+    - 응답: `{"id": "<상관관계 ID>", "success": ..., "status_code": ..., "message": ..., "data": <WeighbridgeResponse>}`
+    """
+    await websocket.accept()
+    session = OCRWebSocketSession(
+        websocket,
+        _parse_and_save,
+        max_in_flight=settings.ws_max_in_flight,
+        idle_timeout=settings.ws_idle_timeout,
+    )
+    await session.run()
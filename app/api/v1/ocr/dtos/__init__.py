@@ -1,2 +1,2 @@
 from .request import OCRRequest, OCRPageDto, OCRWordDto
-from .response import WeighbridgeResponse
\ No newline at end of file
+from .response import WeighbridgeResponse, TicketPageResponse, NearbyTicketResponse
\ No newline at end of file
@@ -1,10 +1,11 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 
 class WeighbridgeResponse(BaseModel):
     """
     계근지 파싱 결과 응답 DTO
     """
+    ticket_id: Optional[int] = Field(None, description="저장된 티켓 ID", json_schema_extra={"example": 1})
     company_name: Optional[str] = Field(None, description="추출된 회사명", json_schema_extra={"example": "정우리사이클링 (주)"})
     product_name: Optional[str] = Field(None, description="추출된 제품명", json_schema_extra={"example": "고철"})
     vehicle_number: Optional[str] = Field(None, description="차량번호 (숫자 4자리 또는 전체 번호)", json_schema_extra={"example": "5405"})
@@ -19,10 +20,17 @@ class WeighbridgeResponse(BaseModel):
     
     confidence_score: float = Field(0.0, description="OCR 엔진 신뢰도 점수", json_schema_extra={"example": 0.9108})
     uncertain: bool = Field(False, description="데이터 불확실성 여부 (검토 필요 시 True)", json_schema_extra={"example": False})
+    skipped_stages: List[str] = Field(default_factory=list, description="처리 시간 예산 초과로 건너뛴 파싱 단계 (부분 결과)", json_schema_extra={"example": []})
+    duplicate_of: Optional[int] = Field(None, description="근사 중복(같은 계근지 재촬영)으로 판정된 원본 티켓 ID", json_schema_extra={"example": None})
+
+    latitude: Optional[float] = Field(None, description="계량 위치 위도", json_schema_extra={"example": 37.105317})
+    longitude: Optional[float] = Field(None, description="계량 위치 경도", json_schema_extra={"example": 127.375673})
+    site_id: Optional[str] = Field(None, description="가장 가까운 등록 계량소 ID", json_schema_extra={"example": "DONGWOO-BIO"})
 
     model_config = {
         "json_schema_extra": {
             "example": {
+                "ticket_id": 1,
                 "company_name": "정우리사이클링 (주)",
                 "vehicle_number": "5405",
                 "date": "2026-02-01",
@@ -32,7 +40,27 @@ class WeighbridgeResponse(BaseModel):
                 "empty_weight": 13950,
                 "net_weight": 130,
                 "confidence_score": 0.9108,
-                "uncertain": False
+                "uncertain": False,
+                "skipped_stages": [],
+                "duplicate_of": None,
+                "latitude": 37.105317,
+                "longitude": 127.375673,
+                "site_id": "DONGWOO-BIO"
             }
         }
     }
+
+
+class TicketPageResponse(BaseModel):
+    """
+    저장된 계근지 조회 결과 (Keyset 페이지네이션) 응답 DTO
+    """
+    items: List[WeighbridgeResponse] = Field(default_factory=list, description="조회된 계근지 목록")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+
+
+class NearbyTicketResponse(WeighbridgeResponse):
+    """
+    반경 조회 결과 응답 DTO (질의 좌표로부터의 거리 포함)
+    """
+    distance_m: float = Field(..., description="질의 좌표로부터의 대원 거리 (m)", json_schema_extra={"example": 42.7})
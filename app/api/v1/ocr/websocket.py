@@ -0,0 +1,99 @@
+import asyncio
+from typing import Any, Callable, Dict, Optional
+
+import orjson
+from fastapi import WebSocket, WebSocketDisconnect
+from loguru import logger
+from starlette.concurrency import run_in_threadpool
+
+from app.core.responses import ApiResponse, CustomException, ErrorStatus
+from app.models import WeighbridgeTicket
+from .dtos import WeighbridgeResponse
+
+# 유휴 타임아웃 시 종료 코드 (1001: Going Away)
+IDLE_CLOSE_CODE = 1001
+
+
+class OCRWebSocketSession:
+    """
+    단말 하나와의 WebSocket 세션
+
+    - 메시지마다 상관관계 ID(id)를 응답에 그대로 포함 (완료 순서로 응답)
+    - 처리 중인 메시지가 max_in_flight에 도달하면 다음 메시지를 읽지 않음 (Backpressure)
+    - 처리 중인 메시지 없이 idle_timeout 동안 수신이 없으면 세션 종료
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        handler: Callable[[Dict[str, Any]], WeighbridgeTicket],
+        max_in_flight: int = 4,
+        idle_timeout: float = 60.0,
+    ):
+        self.websocket = websocket
+        self.handler = handler
+        self.max_in_flight = max_in_flight
+        self.idle_timeout = idle_timeout
+
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._send_lock = asyncio.Lock()
+        self._tasks = set()
+
+    async def run(self):
+        try:
+            while True:
+                await self._slots.acquire()
+                try:
+                    message = await asyncio.wait_for(self.websocket.receive(), timeout=self.idle_timeout)
+                except asyncio.TimeoutError:
+                    self._slots.release()
+                    if self._tasks:
+                        continue
+                    logger.info(f"WebSocket idle timeout ({self.idle_timeout}s), closing session")
+                    await self.websocket.close(code=IDLE_CLOSE_CODE, reason="idle timeout")
+                    return
+
+                if message["type"] == "websocket.disconnect":
+                    raise WebSocketDisconnect(message.get("code", 1000))
+
+                raw = message.get("text")
+                if raw is None:
+                    raw = message.get("bytes") or b""
+                task = asyncio.create_task(self._handle(raw))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+        except WebSocketDisconnect:
+            logger.debug("WebSocket client disconnected")
+        finally:
+            for task in list(self._tasks):
+                task.cancel()
+
+    async def _handle(self, raw):
+        correlation_id: Optional[Any] = None
+        try:
+            try:
+                message = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                raise CustomException(ErrorStatus.INVALID_JSON_FORMAT)
+            if isinstance(message, dict):
+                correlation_id = message.get("id")
+            if not isinstance(message, dict) or not isinstance(message.get("payload"), dict):
+                raise CustomException(ErrorStatus.VALIDATION_ERROR, message="payload: OCRRequest 객체가 필요합니다.")
+
+            ticket = await run_in_threadpool(self.handler, message["payload"])
+            envelope = ApiResponse.success_response(data=WeighbridgeResponse(**ticket.model_dump()))
+        except CustomException as e:
+            envelope = ApiResponse.error_response(code=e.error_status.code, message=e.message, data=e.data)
+        except Exception as e:
+            logger.exception(e)
+            status = ErrorStatus.INTERNAL_SERVER_ERROR
+            envelope = ApiResponse.error_response(code=status.code, message=status.message)
+
+        try:
+            async with self._send_lock:
+                await self.websocket.send_text(orjson.dumps({"id": correlation_id, **envelope.model_dump()}).decode())
+        except (WebSocketDisconnect, RuntimeError):
+            # 응답 전송 전에 세션이 종료된 경우
+            pass
+        finally:
+            self._slots.release()
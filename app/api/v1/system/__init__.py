@@ -0,0 +1 @@
+from .controller import router
\ No newline at end of file
@@ -0,0 +1,149 @@
+import hmac
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse
+
+from app.core.config import settings
+from app.core.memory import (
+    AllocationStat, RequestPeakStat, SnapshotInfo, allocation_tracer, read_process_memory,
+)
+from app.core.metrics import metrics
+from app.core.responses import ApiResponse, ApiJSONResponse, CustomException, ErrorStatus
+from .dtos import MemoryStatusResponse
+
+
+def _require_admin(x_admin_token: Optional[str] = Header(None, description="관리자 API 토큰")):
+    """
+    X-Admin-Token 헤더를 검증합니다. (ADMIN_TOKEN 미설정 시 항상 거부)
+    """
+    if not settings.admin_token or not x_admin_token or not hmac.compare_digest(
+        x_admin_token.encode(), settings.admin_token.encode()
+    ):
+        raise CustomException(ErrorStatus.ADMIN_UNAUTHORIZED)
+
+
+def _require_tracing():
+    if not allocation_tracer.is_tracing:
+        raise CustomException(ErrorStatus.MEMORY_TRACE_DISABLED)
+
+
+router = APIRouter()
+admin_router = APIRouter(prefix="/memory", dependencies=[Depends(_require_admin)])
+
+GroupBy = Literal["module", "caller", "lineno", "filename"]
+
+@router.get(
+    "/metrics",
+    summary="서비스 메트릭 조회",
+    description="파싱 처리 시간 예산 초과 횟수 등 프로세스 단위 메트릭을 Prometheus 텍스트 포맷으로 반환합니다.",
+    response_class=PlainTextResponse
+)
+async def get_metrics():
+    """
+    Prometheus 텍스트 포맷 메트릭을 반환합니다.
+    """
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+@admin_router.get(
+    "",
+    response_model=ApiResponse[MemoryStatusResponse],
+    summary="[관리자] 메모리 사용량 조회",
+    description="워커 프로세스의 RSS / PSS와 tracemalloc 추적 중인 할당량을 반환합니다. `X-Admin-Token` 헤더가 필요합니다.",
+)
+async def get_memory_status():
+    """
+    현재 워커의 메모리 사용량과 할당 추적 상태를 반환합니다.
+    """
+    tracing = allocation_tracer.is_tracing
+    current, peak = allocation_tracer.traced_memory() if tracing else (0, 0)
+    response = MemoryStatusResponse(
+        process=read_process_memory(), tracing=tracing, traced_current=current, traced_peak=peak
+    )
+    return ApiJSONResponse(ApiResponse.success_response(data=response))
+
+@admin_router.post(
+    "/snapshots",
+    response_model=ApiResponse[SnapshotInfo],
+    summary="[관리자] 할당 스냅샷 생성",
+    description=(
+        "tracemalloc 스냅샷을 생성합니다. 최근 스냅샷만 보관되며(`MEMORY_TRACE_MAX_SNAPSHOTS`), "
+        "두 스냅샷의 ID로 할당 증감을 비교할 수 있습니다."
+    ),
+)
+async def create_memory_snapshot(label: Optional[str] = Query(None, max_length=100, description="스냅샷 설명")):
+    """
+    현재 시점의 할당 스냅샷을 생성합니다.
+    """
+    _require_tracing()
+    # 스냅샷 생성 / 집계는 힙 크기에 비례하여 수 초 걸릴 수 있으므로 이벤트 루프를 막지 않도록 스레드풀에서 실행
+    info = await run_in_threadpool(allocation_tracer.take_snapshot, label)
+    return ApiJSONResponse(ApiResponse.success_response(data=info))
+
+@admin_router.get(
+    "/snapshots",
+    response_model=ApiResponse[List[SnapshotInfo]],
+    summary="[관리자] 할당 스냅샷 목록",
+)
+async def list_memory_snapshots():
+    """
+    보관 중인 스냅샷 목록을 반환합니다.
+    """
+    return ApiJSONResponse(ApiResponse.success_response(data=allocation_tracer.snapshots()))
+
+@admin_router.get(
+    "/snapshots/{snapshot_id}/top",
+    response_model=ApiResponse[List[AllocationStat]],
+    summary="[관리자] 할당량 상위 위치",
+    description=(
+        "스냅샷의 할당량 상위 위치를 반환합니다. `group=module`은 `app.services.ocr`, `app.api.v1.ocr`, `spacy`를 "
+        "구분하고 나머지는 최상위 패키지 단위로 집계합니다. `group=caller`는 numpy / pydantic 등 라이브러리 내부 할당을 "
+        "호출 스택에서 가장 가까운 위 모듈로 귀속합니다. (`MEMORY_TRACE_FRAMES` > 1 필요)"
+    ),
+)
+async def get_memory_top(
+    snapshot_id: int,
+    group: GroupBy = Query("module", description="집계 기준"),
+    limit: int = Query(20, ge=1, le=500),
+):
+    """
+    스냅샷의 할당량 상위 위치를 반환합니다.
+    """
+    stats = await run_in_threadpool(allocation_tracer.top, snapshot_id, group, limit)
+    return ApiJSONResponse(ApiResponse.success_response(data=stats))
+
+@admin_router.get(
+    "/diff",
+    response_model=ApiResponse[List[AllocationStat]],
+    summary="[관리자] 스냅샷 간 할당 증감",
+    description="`base` 스냅샷 대비 `target` 스냅샷의 할당 증감 상위 위치를 반환합니다. `target`을 생략하면 현재 시점과 비교합니다. (이 경우 스냅샷은 보관되지 않음)",
+)
+async def get_memory_diff(
+    base: int = Query(..., description="기준 스냅샷 ID"),
+    target: Optional[int] = Query(None, description="비교 스냅샷 ID"),
+    group: GroupBy = Query("module", description="집계 기준"),
+    limit: int = Query(20, ge=1, le=500),
+):
+    """
+    두 스냅샷 간 할당 증감을 반환합니다.
+    """
+    if target is None:
+        _require_tracing()
+    stats = await run_in_threadpool(allocation_tracer.diff, base, target, group, limit)
+    return ApiJSONResponse(ApiResponse.success_response(data=stats))
+
+@admin_router.get(
+    "/requests",
+    response_model=ApiResponse[List[RequestPeakStat]],
+    summary="[관리자] 경로별 요청 최대 할당량",
+    description="메모리 추적 활성화 이후 경로별 요청 처리 중 최대 할당량(bytes)을 반환합니다. 동시에 처리된 요청은 측정에서 제외됩니다.",
+)
+async def get_request_peaks():
+    """
+    경로별 요청 최대 할당량을 반환합니다.
+    """
+    _require_tracing()
+    return ApiJSONResponse(ApiResponse.success_response(data=allocation_tracer.request_peaks()))
+
+router.include_router(admin_router)
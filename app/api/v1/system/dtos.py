@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+
+from app.core.memory import ProcessMemory
+
+
+class MemoryStatusResponse(BaseModel):
+    """
+    프로세스 메모리와 tracemalloc 추적 상태 (traced_*: bytes)
+    """
+    process: ProcessMemory
+    tracing: bool
+    traced_current: int = Field(0, description="현재 추적 중인 할당량")
+    traced_peak: int = Field(0, description="추적 시작(또는 마지막 peak 초기화) 이후 최대 할당량")
@@ -0,0 +1,111 @@
+import gzip
+import zlib
+from typing import BinaryIO, Optional
+
+import zstandard
+
+from app.core.responses import CustomException, ErrorStatus
+
+# 업로드 파일 확장자 -> 압축 방식 (None = 비압축)
+UPLOAD_EXTENSIONS = {
+    ".json": None,
+    ".json.gz": "gzip",
+    ".json.zst": "zstd",
+}
+
+# 응답 압축 지원 방식 (우선순위 순)
+CONTENT_CODINGS = ("zstd", "gzip")
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def upload_encoding(filename: Optional[str]) -> Optional[str]:
+    """
+    업로드 파일명의 확장자로 압축 방식을 판별합니다. (지원하지 않는 확장자면 FILE_001)
+    """
+    name = (filename or "").lower()
+    for extension, encoding in UPLOAD_EXTENSIONS.items():
+        if name.endswith(extension):
+            return encoding
+    raise CustomException(ErrorStatus.INVALID_FILE_EXTENSION)
+
+
+def decompress_stream(
+    fileobj: BinaryIO,
+    encoding: str,
+    max_bytes: int,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> bytes:
+    """
+    압축 파일을 chunk_size 단위로 해제합니다.
+    해제된 크기가 max_bytes를 넘는 즉시 중단하므로 압축 폭탄도 max_bytes + chunk_size 이상 메모리를 쓰지 않습니다.
+    """
+    if encoding == "gzip":
+        reader = gzip.GzipFile(fileobj=fileobj, mode="rb")
+    elif encoding == "zstd":
+        reader = zstandard.ZstdDecompressor().stream_reader(fileobj, read_across_frames=True)
+    else:
+        raise ValueError(f"Unsupported encoding: {encoding}")
+
+    chunks = []
+    total = 0
+    try:
+        with reader:
+            while chunk := reader.read(chunk_size):
+                total += len(chunk)
+                if total > max_bytes:
+                    raise CustomException(ErrorStatus.DECOMPRESSED_TOO_LARGE)
+                chunks.append(chunk)
+    except (OSError, EOFError, zlib.error, zstandard.ZstdError):
+        raise CustomException(ErrorStatus.INVALID_COMPRESSED_FILE)
+    return b"".join(chunks)
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """
+    Accept-Encoding 헤더에서 지원하는 압축 방식을 선택합니다. (q=0은 거부로 처리)
+    """
+    accepted = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip()] = quality
+
+    best, best_quality = None, 0.0
+    for coding in CONTENT_CODINGS:
+        quality = accepted.get(coding, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+class StreamCompressor:
+    """
+    응답 본문 스트리밍 압축기
+
+    compress()는 입력 청크를 압축한 뒤 블록 경계까지 flush 하므로
+    NDJSON / CSV 스트림에서도 청크 단위로 클라이언트가 바로 해제할 수 있습니다.
+    """
+
+    def __init__(self, encoding: str, level: Optional[int] = None):
+        self.encoding = encoding
+        if encoding == "gzip":
+            self._compressor = zlib.compressobj(6 if level is None else level, zlib.DEFLATED, 31)
+        elif encoding == "zstd":
+            self._compressor = zstandard.ZstdCompressor(level=3 if level is None else level).compressobj()
+        else:
+            raise ValueError(f"Unsupported encoding: {encoding}")
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "gzip":
+            return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+        return self._compressor.compress(data) + self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        return self._compressor.compress(data) + self._compressor.flush()
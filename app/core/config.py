@@ -0,0 +1,73 @@
+from typing import List, Literal, Optional
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+class Settings(BaseSettings):
+    """
+    애플리케이션 설정 (환경 변수 또는 .env 파일로 재정의 가능)
+    """
+    # --- 서버 (Launcher) ---
+    host: str = Field("0.0.0.0", description="바인딩 호스트")
+    port: int = Field(8000, description="바인딩 포트")
+    workers: int = Field(4, description="워커 프로세스 수")
+    memory_report_interval: float = Field(30.0, description="워커 메모리 리포트 주기 (초, 0이면 비활성화)")
+
+    # --- 메모리 진단 (Allocation Trace) ---
+    admin_token: Optional[str] = Field(None, description="관리자 API 토큰 (X-Admin-Token 헤더, 미설정 시 관리자 API 비활성화)")
+    memory_trace_enabled: bool = Field(False, description="tracemalloc 할당 추적 사용 여부 (진단용, 할당마다 추가 비용 발생)")
+    memory_trace_frames: int = Field(10, description="할당마다 저장할 호출 스택 깊이 (caller 집계에 필요, 클수록 추적 비용 증가)")
+    memory_trace_max_snapshots: int = Field(8, description="메모리에 보관할 최대 스냅샷 수")
+
+    # --- 파싱 (Parser) ---
+    parse_budget_ms: float = Field(2000.0, description="요청당 파싱 시간 예산 (ms, 0이면 제한 없음)")
+
+    # --- 레이아웃 템플릿 (Template Cache) ---
+    template_enabled: bool = Field(True, description="레이아웃 템플릿 캐시 사용 여부")
+    template_store_path: str = Field("data/templates.json", description="학습된 레이아웃 템플릿 저장 파일 경로")
+    template_match_threshold: float = Field(0.6, description="템플릿 지문 일치 판정 최소 유사도 (Jaccard, 0~1)")
+
+    # --- 계량소 (Site Registry) ---
+    site_registry_path: str = Field("data/sites.json", description="등록 계량소 목록 JSON 파일 경로")
+    site_max_distance_m: float = Field(1000.0, description="티켓 좌표를 계량소로 판정하는 최대 거리 (m)")
+
+    # --- 저장소 (Persistence) ---
+    ticket_db_path: str = Field("data/tickets.db", description="계근지 저장소 SQLite 파일 경로")
+    ticket_db_batch_size: int = Field(1000, description="일괄 저장 시 트랜잭션당 행 수")
+
+    # --- 내보내기 (Export) ---
+    export_spool_max_bytes: int = Field(8 * 1024 * 1024, description="Parquet 내보내기 결과를 메모리에 보관할 최대 크기 (bytes, 초과 시 임시 파일로 전환)")
+
+    # --- 스트리밍 (NDJSON) ---
+    stream_max_in_flight: int = Field(8, description="스트림 연결당 동시 처리 문서 수")
+    stream_max_line_bytes: int = Field(10 * 1024 * 1024, description="스트림 문서(한 줄) 최대 크기 (bytes)")
+
+    # --- WebSocket ---
+    ws_max_in_flight: int = Field(4, description="세션당 동시 처리 메시지 수")
+    ws_idle_timeout: float = Field(60.0, description="세션 유휴 타임아웃 (초)")
+
+    # --- 중복 탐지 (Near-duplicate) ---
+    dedup_mode: Literal["off", "flag", "skip"] = Field("flag", description="중복 처리 방식 (off: 사용 안 함, flag: 파싱 후 duplicate_of 표시, skip: 파싱 없이 원본 반환)")
+    dedup_threshold: float = Field(0.7, description="중복 판정 최소 유사도 (추정 Jaccard, 0~1)")
+    dedup_window_sec: float = Field(3600.0, description="중복 비교 대상 시간 창 (초)")
+
+    # --- 요청 속도 제한 (Rate Limit) ---
+    rate_limit_enabled: bool = Field(True, description="클라이언트별 요청 속도 제한 사용 여부")
+    rate_limit_api_key_header: str = Field("X-API-Key", description="클라이언트 식별용 API Key 헤더 (없으면 IP 기준)")
+    rate_limit_api_keys: List[str] = Field(default_factory=list, description="클라이언트별 버킷을 부여할 API Key 목록 (JSON 배열, 목록에 없는 키는 IP 기준)")
+    rate_limit_parse_rps: float = Field(20.0, description="파싱 경로 초당 허용 요청 수")
+    rate_limit_parse_burst: float = Field(40.0, description="파싱 경로 순간 최대 요청 수")
+    rate_limit_export_rps: float = Field(2.0, description="내보내기 경로 초당 허용 요청 수")
+    rate_limit_export_burst: float = Field(10.0, description="내보내기 경로 순간 최대 요청 수")
+    rate_limit_max_clients: int = Field(100_000, description="메모리에 유지할 최대 클라이언트 버킷 수")
+
+    # --- 압축 (Compression) ---
+    upload_max_decompressed_bytes: int = Field(50 * 1024 * 1024, description="압축 업로드 파일의 최대 해제 크기 (bytes, 압축 폭탄 방지)")
+    compression_enabled: bool = Field(True, description="Accept-Encoding 기반 응답 압축 사용 여부")
+    compression_min_size: int = Field(1024, description="압축을 적용할 최소 응답 크기 (bytes)")
+    compression_gzip_level: int = Field(6, description="gzip 압축 레벨 (1~9)")
+    compression_zstd_level: int = Field(3, description="zstd 압축 레벨 (1~22)")
+
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+settings = Settings()
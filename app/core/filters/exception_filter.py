@@ -1,23 +1,22 @@
 from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from loguru import logger
 
 # 패키지 레벨 Import 사용 (app.core.responses.__init__.py를 경유)
-from app.core.responses import ApiResponse, ErrorStatus, CustomException
+from app.core.responses import ApiResponse, ApiJSONResponse, ErrorStatus, CustomException
 
 async def custom_exception_filter(request: Request, exc: CustomException):
     """
     [Core] CustomException 처리 핸들러
     """
     logger.warning(f"CustomException: {exc.error_status.code} - {exc.message} (Path: {request.url.path})")
-    return JSONResponse(
+    return ApiJSONResponse(
         status_code=exc.error_status.http_status,
         content=ApiResponse.error_response(
             code=exc.error_status.code,
             message=exc.message,
             data=exc.data
-        ).model_dump()
+        )
     )
 
 async def global_exception_filter(request: Request, exc: Exception):
@@ -36,9 +35,9 @@ async def global_exception_filter(request: Request, exc: Exception):
 
         code = f"HTTP_{exc.status_code}"
         message = str(exc.detail)
-        return JSONResponse(
+        return ApiJSONResponse(
             status_code=exc.status_code,
-            content=ApiResponse.error_response(code=code, message=message).model_dump()
+            content=ApiResponse.error_response(code=code, message=message)
         )
 
     # 2. Pydantic 유효성 검사 실패 처리
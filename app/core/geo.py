@@ -0,0 +1,117 @@
+import math
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# 지구 평균 반지름 (m)
+EARTH_RADIUS_M = 6_371_008.8
+
+
+def haversine_m(lat1: float, lon1: float, lat2, lon2):
+    """
+    두 위경도 좌표 사이의 대원 거리 (m). lat2 / lon2에 NumPy 배열을 넘기면 배열로 반환합니다.
+    """
+    phi1, phi2 = np.radians(lat1), np.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = np.radians(lon2) - np.radians(lon1)
+    a = np.sin(d_phi / 2) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def bounding_box(
+    latitude: float, longitude: float, radius_m: float
+) -> Tuple[float, float, List[Tuple[float, float]]]:
+    """
+    반경 radius_m 원을 포함하는 위경도 사각형 (min_lat, max_lat, [(min_lon, max_lon), ...])
+    인덱스 범위 조회로 후보를 좁힌 뒤 haversine_m으로 정확히 거르는 용도입니다.
+    경도 범위가 날짜변경선(±180)을 넘으면 반대편을 포함하도록 두 구간으로 나누어 반환합니다.
+    """
+    d_lat = math.degrees(radius_m / EARTH_RADIUS_M)
+    min_lat, max_lat = max(latitude - d_lat, -90.0), min(latitude + d_lat, 90.0)
+    if min_lat <= -90.0 or max_lat >= 90.0:
+        return min_lat, max_lat, [(-180.0, 180.0)]
+    d_lon = math.degrees(radius_m / (EARTH_RADIUS_M * math.cos(math.radians(latitude))))
+    if d_lon >= 180.0:
+        return min_lat, max_lat, [(-180.0, 180.0)]
+
+    min_lon, max_lon = longitude - d_lon, longitude + d_lon
+    if min_lon < -180.0:
+        return min_lat, max_lat, [(-180.0, max_lon), (min_lon + 360.0, 180.0)]
+    if max_lon > 180.0:
+        return min_lat, max_lat, [(min_lon, 180.0), (-180.0, max_lon - 360.0)]
+    return min_lat, max_lat, [(min_lon, max_lon)]
+
+
+def to_unit_vectors(latitudes, longitudes) -> np.ndarray:
+    """
+    위경도를 3차원 단위 벡터 (n, 3)로 변환 (직선 거리 순서 = 대원 거리 순서)
+    """
+    phi = np.radians(np.asarray(latitudes, dtype=np.float64))
+    lam = np.radians(np.asarray(longitudes, dtype=np.float64))
+    return np.stack([np.cos(phi) * np.cos(lam), np.cos(phi) * np.sin(lam), np.sin(phi)], axis=-1)
+
+
+class KDTree:
+    """
+    정적 점 집합의 최근접 탐색용 KD-Tree (배열 기반)
+
+    - 노드: 분할 축/값과 자식 인덱스, 리프는 정렬된 점 배열의 [start, end) 구간
+    - 조회: 질의점이 속한 쪽을 먼저 탐색하고, 분할면까지 거리가 현재 최근접보다 먼 쪽은 가지치기
+    """
+
+    def __init__(self, points: np.ndarray, leaf_size: int = 8):
+        self.leaf_size = leaf_size
+        self.indices = np.arange(len(points))
+        self.points = np.array(points, dtype=np.float64)
+        # 노드: [axis, split, left, right, start, end] (리프는 axis = -1)
+        self._nodes: List[Tuple[int, float, int, int, int, int]] = []
+        if len(points):
+            self._build(0, len(points))
+
+    def _build(self, start: int, end: int) -> int:
+        node_id = len(self._nodes)
+        if end - start <= self.leaf_size:
+            self._nodes.append((-1, 0.0, -1, -1, start, end))
+            return node_id
+
+        segment = self.points[start:end]
+        axis = int(np.argmax(segment.max(axis=0) - segment.min(axis=0)))
+        order = np.argsort(segment[:, axis], kind="stable")
+        self.points[start:end] = segment[order]
+        self.indices[start:end] = self.indices[start:end][order]
+
+        mid = (start + end) // 2
+        split = float(self.points[mid, axis])
+        self._nodes.append((axis, split, -1, -1, start, end))
+        left = self._build(start, mid)
+        right = self._build(mid, end)
+        self._nodes[node_id] = (axis, split, left, right, start, end)
+        return node_id
+
+    def nearest(self, point: np.ndarray) -> Optional[Tuple[int, float]]:
+        """
+        최근접 점의 (원본 인덱스, 직선 거리)를 반환합니다. (점이 없으면 None)
+        """
+        if not self._nodes:
+            return None
+
+        best_index, best_dist = -1, math.inf
+        # (노드, 질의점에서 노드 영역까지 거리의 하한)
+        stack = [(0, 0.0)]
+        while stack:
+            node_id, bound = stack.pop()
+            if bound >= best_dist:
+                continue
+            axis, split, left, right, start, end = self._nodes[node_id]
+            if axis < 0:
+                dists = np.sqrt(((self.points[start:end] - point) ** 2).sum(axis=1))
+                i = int(np.argmin(dists))
+                if dists[i] < best_dist:
+                    best_index, best_dist = int(self.indices[start + i]), float(dists[i])
+                continue
+
+            diff = point[axis] - split
+            near, far = (left, right) if diff < 0 else (right, left)
+            stack.append((far, max(bound, abs(diff))))
+            stack.append((near, bound))
+        return best_index, best_dist
@@ -1 +1,4 @@
-from .logger import LoggingInterceptor
\ No newline at end of file
+from .allocation import AllocationTraceInterceptor
+from .compression import CompressionInterceptor
+from .logger import LoggingInterceptor
+from .rate_limiter import RateLimitInterceptor
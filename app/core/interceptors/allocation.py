@@ -0,0 +1,42 @@
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.memory import AllocationTracer
+
+
+class AllocationTraceInterceptor:
+    """
+    요청별 최대 할당량 측정 (ASGI 미들웨어, 메모리 추적 활성화 시에만 등록)
+
+    집계 키는 라우팅된 경로 템플릿(/tickets/{ticket_id} 등)이며, 라우팅 전에 실패한 요청은 실제 경로를 사용합니다.
+    """
+
+    def __init__(self, app: ASGIApp, tracer: AllocationTracer):
+        self.app = app
+        self.tracer = tracer
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not self.tracer.is_tracing:
+            await self.app(scope, receive, send)
+            return
+
+        token = self.tracer.request_started()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.tracer.request_finished(f"{scope['method']} {self._route_path(scope)}", token)
+
+    @staticmethod
+    def _route_path(scope: Scope) -> str:
+        # 하위 라우터의 route.path는 prefix를 제외한 상대 경로이므로 실제 경로에서 prefix를 복원
+        path = scope["path"]
+        route_path = getattr(scope.get("route"), "path", None)
+        if not route_path:
+            return path
+        params = {name: str(value) for name, value in scope.get("path_params", {}).items()}
+        try:
+            concrete = route_path.format(**params)
+        except (KeyError, IndexError, ValueError):
+            return route_path
+        if path.endswith(concrete):
+            return path[: len(path) - len(concrete)] + route_path
+        return route_path
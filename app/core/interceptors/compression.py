@@ -0,0 +1,141 @@
+from typing import Dict, Optional
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.compression import StreamCompressor, negotiate_encoding
+from app.core.metrics import metrics
+
+# 이미 압축된 형식 (다시 압축해도 크기가 줄지 않고 CPU만 소모)
+INCOMPRESSIBLE_MEDIA_TYPES = (
+    "application/vnd.apache.parquet",
+    "application/gzip",
+    "application/zstd",
+    "application/zip",
+    "image/",
+    "video/",
+    "audio/",
+)
+
+# 이 크기 이상의 청크는 스레드풀에서 압축 (zlib / zstd 모두 압축 중 GIL 해제)
+THREADPOOL_THRESHOLD = 256 * 1024
+
+compressed_counter = metrics.counter(
+    "http_compressed_responses_total", "압축하여 전송한 응답 수", label_names=("encoding",)
+)
+
+
+class CompressionInterceptor:
+    """
+    Accept-Encoding 기반 응답 압축 (ASGI 미들웨어, zstd > gzip 우선)
+
+    - 단일 본문 응답: min_size 미만이면 그대로 전송, 이상이면 전체 압축 후 Content-Length 갱신
+    - 스트리밍 응답(NDJSON, CSV 등): 청크마다 압축 후 flush 하여 실시간성을 유지
+    - 이미 Content-Encoding이 있거나 압축 불가 형식(Parquet 등)인 응답, WebSocket은 그대로 통과
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        min_size: int = 1024,
+        levels: Optional[Dict[str, int]] = None,
+        enabled: bool = True,
+    ):
+        self.app = app
+        self.min_size = min_size
+        self.levels = levels or {}
+        self.enabled = enabled
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if not self.enabled or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(send, encoding, self.levels.get(encoding), self.min_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    __slots__ = ("_send", "encoding", "level", "min_size", "_start", "_compressor", "_passthrough")
+
+    def __init__(self, send: Send, encoding: str, level: Optional[int], min_size: int):
+        self._send = send
+        self.encoding = encoding
+        self.level = level
+        self.min_size = min_size
+        self._start: Optional[Message] = None
+        self._compressor: Optional[StreamCompressor] = None
+        self._passthrough = False
+
+    async def send(self, message: Message):
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            # 첫 본문 청크를 보고 압축 여부를 결정하므로 헤더 전송을 보류
+            self._start = message
+            headers = Headers(raw=message["headers"])
+            media_type = headers.get("content-type", "")
+            self._passthrough = (
+                "content-encoding" in headers
+                or message["status"] in (204, 304)
+                or media_type.startswith(INCOMPRESSIBLE_MEDIA_TYPES)
+            )
+            return
+
+        if message_type != "http.response.body":
+            await self._send(message)
+            return
+
+        if self._passthrough:
+            if self._start is not None:
+                await self._send(self._start)
+                self._start = None
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._start is not None:
+            start, self._start = self._start, None
+            if not more_body and len(body) < self.min_size:
+                self._passthrough = True
+                await self._send(start)
+                await self._send(message)
+                return
+
+            headers = MutableHeaders(raw=start["headers"])
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            self._compressor = StreamCompressor(self.encoding, self.level)
+            compressed_counter.inc(encoding=self.encoding)
+
+            if not more_body:
+                body = await self._compress(self._compressor.finish, body)
+                headers["Content-Length"] = str(len(body))
+                await self._send(start)
+                await self._send({"type": "http.response.body", "body": body})
+                return
+
+            # 스트리밍: 최종 크기를 알 수 없으므로 chunked 전송
+            del headers["Content-Length"]
+            await self._send(start)
+
+        if more_body:
+            body = await self._compress(self._compressor.compress, body)
+            if body:
+                await self._send({"type": "http.response.body", "body": body, "more_body": True})
+        else:
+            body = await self._compress(self._compressor.finish, body)
+            await self._send({"type": "http.response.body", "body": body})
+
+    @staticmethod
+    async def _compress(func, body: bytes) -> bytes:
+        if len(body) >= THREADPOOL_THRESHOLD:
+            return await run_in_threadpool(func, body)
+        return func(body)
@@ -0,0 +1,137 @@
+import math
+import time
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+from loguru import logger
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.metrics import metrics
+from app.core.responses import ApiResponse, ApiJSONResponse, ErrorStatus
+
+# 정책별 (초당 토큰 충전량, 버킷 크기)
+RateLimitRule = Tuple[float, float]
+
+# WebSocket 핸드셰이크 거부 코드 (1008: Policy Violation)
+WS_POLICY_VIOLATION = 1008
+
+rejected_counter = metrics.counter(
+    "http_rate_limited_total", "요청 속도 제한으로 거부된 요청 수", label_names=("policy",)
+)
+
+
+class TokenBucket:
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, tokens: float, updated: float):
+        self.tokens = tokens
+        self.updated = updated
+
+
+class RateLimitInterceptor:
+    """
+    토큰 버킷 기반 요청 속도 제한 (ASGI 미들웨어)
+
+    - 클라이언트 키: 등록된(api_keys) API Key 헤더 값, 없거나 등록되지 않은 값이면 클라이언트 IP
+      (임의의 키 값마다 새 버킷이 생기면 헤더만 바꿔 제한을 우회하고 다른 클라이언트 버킷을 밀어낼 수 있음)
+    - 정책: 파싱(parse) / 내보내기(export) 경로별로 별도 버킷
+    - 버킷 갱신은 await 없이 이벤트 루프 스레드에서만 수행되므로 Lock이 필요 없음
+    - 한도 초과 시 ApiResponse 에러 엔벨로프(429)와 Retry-After 헤더로 응답
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        rules: Dict[str, RateLimitRule],
+        api_key_header: str = "X-API-Key",
+        api_keys: Iterable[str] = (),
+        max_buckets: int = 100_000,
+        enabled: bool = True,
+    ):
+        self.app = app
+        self.rules = rules
+        self.api_key_header = api_key_header.lower().encode("latin-1")
+        self.api_keys: FrozenSet[bytes] = frozenset(key.encode("latin-1") for key in api_keys)
+        self.max_buckets = max_buckets
+        self.enabled = enabled
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if not self.enabled or scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        policy = self._classify(scope)
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+
+        retry_after = self._acquire(policy, self._client_key(scope))
+        if retry_after is None:
+            await self.app(scope, receive, send)
+            return
+
+        rejected_counter.inc(policy=policy)
+        logger.warning(f"Rate limit exceeded: policy={policy} path={scope['path']} retry_after={retry_after:.2f}s")
+        if scope["type"] == "websocket":
+            await send({"type": "websocket.close", "code": WS_POLICY_VIOLATION, "reason": "rate limit exceeded"})
+            return
+
+        status = ErrorStatus.RATE_LIMIT_EXCEEDED
+        response = ApiJSONResponse(
+            status_code=status.http_status,
+            content=ApiResponse.error_response(code=status.code, message=status.message),
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+        await response(scope, receive, send)
+
+    def _classify(self, scope: Scope) -> Optional[str]:
+        if scope.get("method") == "OPTIONS":
+            return None
+        path = scope["path"]
+        if "/export/" in path:
+            return "export"
+        if "/upload-ocr" in path or "/stream/" in path or path.endswith("/ws"):
+            return "parse"
+        return None
+
+    def _client_key(self, scope: Scope) -> str:
+        for name, value in scope.get("headers", ()):
+            if name == self.api_key_header and value in self.api_keys:
+                return "key:" + value.decode("latin-1")
+        client = scope.get("client")
+        return "ip:" + (client[0] if client else "unknown")
+
+    def _acquire(self, policy: str, client_key: str) -> Optional[float]:
+        """
+        토큰 1개를 소비합니다. 허용 시 None, 거부 시 재시도까지 남은 시간(초)을 반환합니다.
+        """
+        rate, burst = self.rules[policy]
+        now = time.monotonic()
+        key = (policy, client_key)
+
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= self.max_buckets:
+                self._evict_idle(now)
+            bucket = self._buckets[key] = TokenBucket(burst, now)
+        else:
+            bucket.tokens = min(burst, bucket.tokens + (now - bucket.updated) * rate)
+            bucket.updated = now
+
+        if bucket.tokens >= 1:
+            bucket.tokens -= 1
+            return None
+        return (1 - bucket.tokens) / rate
+
+    def _evict_idle(self, now: float):
+        # 가득 찰 때까지 충전된(=오래 사용하지 않은) 버킷은 새 버킷과 동일하므로 제거해도 무방
+        idle = [
+            key for key, bucket in self._buckets.items()
+            if bucket.tokens + (now - bucket.updated) * self.rules[key[0]][0] >= self.rules[key[0]][1]
+        ]
+        for key in idle:
+            del self._buckets[key]
+        if len(self._buckets) >= self.max_buckets:
+            # 모두 활성 상태라면 가장 오래된 항목부터 제거 (dict 삽입 순서)
+            for key in list(self._buckets)[: len(self._buckets) // 10 or 1]:
+                del self._buckets[key]
@@ -0,0 +1,311 @@
+import os
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+from pydantic import BaseModel, Field
+
+from app.core.responses import CustomException, ErrorStatus
+
+
+class ProcessMemory(BaseModel):
+    """
+    프로세스 메모리 사용량 (단위: KB)
+
+    - rss: 상주 메모리 전체 (공유 페이지 포함)
+    - pss: 공유 페이지를 공유 프로세스 수로 나눈 비례 메모리 (워커 간 비교에 적합)
+    - shared / private: 공유 / 전용 페이지 (private = USS)
+    """
+    pid: int
+    rss: int = 0
+    pss: Optional[int] = Field(None, description="/proc/<pid>/smaps_rollup 미지원 환경에서는 None")
+    shared: Optional[int] = None
+    private: Optional[int] = None
+
+
+def read_process_memory(pid: Optional[int] = None) -> ProcessMemory:
+    """
+    /proc/<pid>/smaps_rollup 기반으로 프로세스 메모리를 조회합니다. (Linux 외 환경은 RSS 최대값만 제공)
+    """
+    pid = pid or os.getpid()
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            fields = {}
+            for line in f:
+                parts = line.split()
+                if len(parts) >= 2 and parts[0].endswith(":") and parts[1].isdigit():
+                    fields[parts[0][:-1]] = int(parts[1])
+    except OSError:
+        if pid != os.getpid():
+            return ProcessMemory(pid=pid)
+        # macOS 등: 현재 프로세스의 최대 RSS만 조회 가능
+        return ProcessMemory(pid=pid, rss=resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+    return ProcessMemory(
+        pid=pid,
+        rss=fields.get("Rss", 0),
+        pss=fields.get("Pss"),
+        shared=fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0),
+        private=fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0),
+    )
+
+
+def child_pids(pid: Optional[int] = None) -> List[int]:
+    """
+    직계 자식 프로세스 PID 목록 (Linux /proc 기반)
+    """
+    pid = pid or os.getpid()
+    children = []
+    try:
+        for tid in os.listdir(f"/proc/{pid}/task"):
+            with open(f"/proc/{pid}/task/{tid}/children") as f:
+                children.extend(int(child) for child in f.read().split())
+    except OSError:
+        pass
+    return sorted(set(children))
+
+
+# 모듈별 할당 집계 시 별도로 구분할 패키지 (그 외는 최상위 패키지 단위로 집계)
+TRACKED_MODULES = ("app.services.ocr", "app.api.v1.ocr", "spacy")
+
+# 스냅샷에서 제외할 할당 위치 (tracemalloc 자체 / import 시스템)
+_SNAPSHOT_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+class AllocationStat(BaseModel):
+    """
+    할당 위치(모듈 또는 파일:라인)별 통계 (단위: bytes)
+    diff 결과에서는 size_diff / count_diff에 기준 스냅샷 대비 증감이 채워집니다.
+    """
+    location: str
+    size: int
+    count: int
+    size_diff: Optional[int] = None
+    count_diff: Optional[int] = None
+
+
+class SnapshotInfo(BaseModel):
+    snapshot_id: int
+    label: Optional[str] = None
+    taken_at: float
+    traced_size: int = Field(..., description="스냅샷 시점의 추적 중인 할당 총량 (bytes)")
+
+
+class RequestPeakStat(BaseModel):
+    """
+    경로별 요청 처리 중 최대 할당량 (bytes, 다른 요청과 겹치지 않은 요청만 집계)
+    """
+    route: str
+    samples: int
+    overlapped: int = Field(0, description="다른 요청과 처리 시간이 겹쳐 집계에서 제외된 요청 수")
+    avg_peak: int = 0
+    max_peak: int = 0
+
+
+class AllocationTracer:
+    """
+    tracemalloc 기반 할당 추적기 (opt-in 진단용)
+
+    - 스냅샷: 최근 max_snapshots개를 ID로 보관하고 두 시점 간 증감(diff)을 계산
+    - 집계: module은 할당이 발생한 가장 안쪽 프레임의 모듈, caller는 호출 스택에서 가장 가까운 TRACKED_MODULES
+      (TRACKED_MODULES는 하위 패키지까지 구분하고 그 외는 최상위 패키지 단위)
+    - 요청별 최대 할당: tracemalloc의 peak는 프로세스 전역이므로 다른 요청과 겹치지 않은 요청만 정확히 측정
+    """
+
+    def __init__(self, max_snapshots: int = 8, max_routes: int = 256):
+        self.max_snapshots = max_snapshots
+        self.max_routes = max_routes
+        self._snapshots: "OrderedDict[int, Tuple[SnapshotInfo, tracemalloc.Snapshot]]" = OrderedDict()
+        self._next_id = 1
+        self._module_by_file: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+        # 요청 peak 측정 상태 (이벤트 루프 스레드에서만 갱신)
+        self._in_flight = 0
+        self._started = 0
+        self._routes: Dict[str, List[int]] = {}  # route -> [samples, overlapped, total_peak, max_peak]
+
+    @property
+    def is_tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int = 1):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+            logger.info(f"tracemalloc started (frames={frames})")
+
+    def stop(self):
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+            logger.info("tracemalloc stopped")
+        with self._lock:
+            self._snapshots.clear()
+
+    def traced_memory(self) -> Tuple[int, int]:
+        """
+        (현재 추적 중인 할당량, 최대 할당량) bytes
+        """
+        return tracemalloc.get_traced_memory()
+
+    def take_snapshot(self, label: Optional[str] = None) -> SnapshotInfo:
+        snapshot = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+        with self._lock:
+            info = SnapshotInfo(
+                snapshot_id=self._next_id,
+                label=label,
+                taken_at=time.time(),
+                traced_size=tracemalloc.get_traced_memory()[0],
+            )
+            self._next_id += 1
+            self._snapshots[info.snapshot_id] = (info, snapshot)
+            while len(self._snapshots) > self.max_snapshots:
+                self._snapshots.popitem(last=False)
+        return info
+
+    def snapshots(self) -> List[SnapshotInfo]:
+        with self._lock:
+            return [info for info, _ in self._snapshots.values()]
+
+    def _get_snapshot(self, snapshot_id: int) -> tracemalloc.Snapshot:
+        # 조회 시점에 다른 요청의 take_snapshot으로 밀려날 수 있으므로 확인과 조회를 한 번에 수행
+        with self._lock:
+            entry = self._snapshots.get(snapshot_id)
+        if entry is None:
+            raise CustomException(ErrorStatus.SNAPSHOT_NOT_FOUND, data={"snapshot_id": snapshot_id})
+        return entry[1]
+
+    def top(self, snapshot_id: int, group: str = "module", limit: int = 20) -> List[AllocationStat]:
+        """
+        스냅샷의 할당량 상위 위치 (group: module | caller | lineno | filename)
+        """
+        snapshot = self._get_snapshot(snapshot_id)
+        stats = self._group(snapshot.statistics(self._key_type(group)), group)
+        return sorted(stats.values(), key=lambda stat: stat.size, reverse=True)[:limit]
+
+    def diff(
+        self, base_id: int, target_id: Optional[int] = None, group: str = "module", limit: int = 20
+    ) -> List[AllocationStat]:
+        """
+        base 스냅샷 대비 target 스냅샷(생략 시 현재 시점, 보관하지 않음)의 할당 증감 상위 위치 (증감 절대값 순)
+        """
+        base = self._get_snapshot(base_id)
+        if target_id is None:
+            target = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+        else:
+            target = self._get_snapshot(target_id)
+        stats = self._group(target.compare_to(base, self._key_type(group)), group)
+        return sorted(stats.values(), key=lambda stat: abs(stat.size_diff), reverse=True)[:limit]
+
+    @staticmethod
+    def _key_type(group: str) -> str:
+        # caller는 호출 스택 전체가 필요 (추적 시작 시 frames가 1이면 module과 동일)
+        return "traceback" if group == "caller" else "lineno"
+
+    def _group(self, statistics, group: str) -> Dict[str, AllocationStat]:
+        grouped: Dict[str, AllocationStat] = {}
+        with_diff = isinstance(statistics[0], tracemalloc.StatisticDiff) if statistics else False
+        for stat in statistics:
+            # Traceback은 오래된 프레임부터 정렬되어 있으므로 마지막이 할당이 발생한 프레임
+            frame = stat.traceback[-1]
+            if group == "lineno":
+                location = f"{frame.filename}:{frame.lineno}"
+            elif group == "filename":
+                location = frame.filename
+            elif group == "caller":
+                location = self._caller_group(stat.traceback)
+            else:
+                location = self._module_group(frame.filename)
+
+            item = grouped.get(location)
+            if item is None:
+                item = grouped[location] = AllocationStat(
+                    location=location, size=0, count=0,
+                    size_diff=0 if with_diff else None, count_diff=0 if with_diff else None,
+                )
+            item.size += stat.size
+            item.count += stat.count
+            if with_diff:
+                item.size_diff += stat.size_diff
+                item.count_diff += stat.count_diff
+        return grouped
+
+    def _caller_group(self, traceback: tracemalloc.Traceback) -> str:
+        # 안쪽 프레임부터 TRACKED_MODULES에 속한 첫 호출자로 집계 (numpy / pydantic 내부 할당을 호출한 서비스 코드로 귀속)
+        for frame in reversed(traceback):
+            group = self._module_group(frame.filename)
+            if group in TRACKED_MODULES:
+                return group
+        return self._module_group(traceback[-1].filename)
+
+    def _module_group(self, filename: str) -> str:
+        # top / diff가 스레드풀에서 동시에 실행될 수 있으므로 매핑 조회와 갱신을 잠금 안에서 수행
+        with self._lock:
+            module = self._module_by_file.get(filename)
+            if module is None:
+                # 처음 보는 파일이면 로드된 모듈 목록으로 파일 -> 모듈 매핑을 갱신
+                for name, loaded in list(sys.modules.items()):
+                    path = getattr(loaded, "__file__", None)
+                    if path:
+                        self._module_by_file.setdefault(path, name)
+                module = self._module_by_file.setdefault(filename, "")
+        if not module:
+            return "<other>"
+        for tracked in TRACKED_MODULES:
+            if module == tracked or module.startswith(tracked + "."):
+                return tracked
+        return module.split(".", 1)[0]
+
+    def request_started(self) -> Tuple[int, int]:
+        """
+        요청 시작 시 호출합니다. 반환값(시작 순번, 시작 시점 할당량)을 request_finished에 전달합니다.
+        """
+        if self._in_flight == 0:
+            tracemalloc.reset_peak()
+        self._in_flight += 1
+        self._started += 1
+        return self._started if self._in_flight == 1 else 0, tracemalloc.get_traced_memory()[0]
+
+    def request_finished(self, route: str, token: Tuple[int, int]):
+        self._in_flight -= 1
+        sequence, baseline = token
+        # 시작 시 단독이었고 그 사이 다른 요청이 시작되지 않았으면 peak가 이 요청만의 값
+        exclusive = sequence and sequence == self._started
+
+        stat = self._routes.get(route)
+        if stat is None:
+            if len(self._routes) >= self.max_routes:
+                return
+            stat = self._routes[route] = [0, 0, 0, 0]
+        if not exclusive:
+            stat[1] += 1
+            return
+        peak = max(tracemalloc.get_traced_memory()[1] - baseline, 0)
+        stat[0] += 1
+        stat[2] += peak
+        stat[3] = max(stat[3], peak)
+
+    def request_peaks(self) -> List[RequestPeakStat]:
+        return sorted(
+            (
+                RequestPeakStat(
+                    route=route, samples=samples, overlapped=overlapped,
+                    avg_peak=total // samples if samples else 0, max_peak=max_peak,
+                )
+                for route, (samples, overlapped, total, max_peak) in self._routes.items()
+            ),
+            key=lambda stat: stat.max_peak,
+            reverse=True,
+        )
+
+
+allocation_tracer = AllocationTracer()
@@ -0,0 +1,57 @@
+import threading
+from typing import Dict, Tuple
+
+
+class Counter:
+    """
+    단조 증가 카운터 (라벨 조합별 값 보관)
+    """
+
+    def __init__(self, name: str, description: str, label_names: Tuple[str, ...] = ()):
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels: str):
+        key = tuple(str(labels.get(name, "")) for name in self.label_names)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        key = tuple(str(labels.get(name, "")) for name in self.label_names)
+        return self._values.get(key, 0)
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            values = dict(self._values) or ({(): 0} if not self.label_names else {})
+        for key, value in sorted(values.items()):
+            labels = ",".join(f'{name}="{label}"' for name, label in zip(self.label_names, key))
+            lines.append(f"{self.name}{{{labels}}} {value:g}" if labels else f"{self.name} {value:g}")
+        return "\n".join(lines)
+
+
+class MetricsRegistry:
+    """
+    프로세스 단위 메트릭 저장소 (Prometheus 텍스트 포맷으로 노출)
+
+    멀티 워커 환경에서는 워커별 값이므로 수집 측에서 합산합니다.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, Counter] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, description: str, label_names: Tuple[str, ...] = ()) -> Counter:
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = Counter(name, description, label_names)
+            return self._metrics[name]
+
+    def render(self) -> str:
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+
+metrics = MetricsRegistry()
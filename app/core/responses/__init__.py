@@ -1,2 +1,2 @@
 from .errors import ErrorStatus, CustomException
-from .response import ApiResponse
\ No newline at end of file
+from .response import ApiResponse, ApiJSONResponse, DuplexStreamingResponse
\ No newline at end of file
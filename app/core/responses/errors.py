@@ -1,9 +1,13 @@
 from enum import Enum
 from starlette.status import (
     HTTP_400_BAD_REQUEST, 
+    HTTP_401_UNAUTHORIZED,
     HTTP_404_NOT_FOUND,
+    HTTP_413_REQUEST_ENTITY_TOO_LARGE,
     HTTP_405_METHOD_NOT_ALLOWED, 
+    HTTP_409_CONFLICT,
     HTTP_422_UNPROCESSABLE_ENTITY, 
+    HTTP_429_TOO_MANY_REQUESTS,
     HTTP_500_INTERNAL_SERVER_ERROR
 )
 
@@ -20,9 +24,17 @@ class ErrorStatus(Enum):
     VALIDATION_ERROR = (HTTP_422_UNPROCESSABLE_ENTITY, "ERR_422", "유효성 검사에 실패했습니다.")
     
     # 비즈니스 로직 에러 정의
-    INVALID_FILE_EXTENSION = (HTTP_400_BAD_REQUEST, "FILE_001", "지원하지 않는 파일 형식입니다. (.json 파일만 가능)")
+    INVALID_FILE_EXTENSION = (HTTP_400_BAD_REQUEST, "FILE_001", "지원하지 않는 파일 형식입니다. (.json, .json.gz, .json.zst 파일만 가능)")
     INVALID_JSON_FORMAT = (HTTP_400_BAD_REQUEST, "FILE_002", "유효하지 않은 JSON 형식입니다.")
+    INVALID_COMPRESSED_FILE = (HTTP_400_BAD_REQUEST, "FILE_003", "압축 파일을 해제할 수 없습니다.")
+    DECOMPRESSED_TOO_LARGE = (HTTP_413_REQUEST_ENTITY_TOO_LARGE, "FILE_004", "압축 해제된 파일 크기가 허용 범위를 초과했습니다.")
     OCR_DATA_EMPTY = (HTTP_400_BAD_REQUEST, "OCR_001", "OCR 데이터 내에서 유효한 텍스트를 찾을 수 없습니다.")
+    INVALID_CURSOR = (HTTP_400_BAD_REQUEST, "TICKET_001", "유효하지 않은 페이지 커서입니다.")
+    STREAM_LINE_TOO_LONG = (HTTP_413_REQUEST_ENTITY_TOO_LARGE, "STREAM_001", "스트림의 한 줄(문서) 크기가 허용 범위를 초과했습니다.")
+    RATE_LIMIT_EXCEEDED = (HTTP_429_TOO_MANY_REQUESTS, "RATE_001", "요청 한도를 초과했습니다. 잠시 후 다시 시도해주세요.")
+    ADMIN_UNAUTHORIZED = (HTTP_401_UNAUTHORIZED, "ADMIN_001", "관리자 인증에 실패했습니다.")
+    MEMORY_TRACE_DISABLED = (HTTP_409_CONFLICT, "MEMORY_001", "메모리 추적이 비활성화되어 있습니다. (MEMORY_TRACE_ENABLED 또는 --trace-memory)")
+    SNAPSHOT_NOT_FOUND = (HTTP_404_NOT_FOUND, "MEMORY_002", "메모리 스냅샷을 찾을 수 없습니다.")
     
     def __init__(self, http_status: int, code: str, message: str):
         self.http_status = http_status
@@ -1,5 +1,9 @@
-from typing import Generic, TypeVar, Optional
+from typing import Any, Generic, TypeVar, Optional
+
+import orjson
 from pydantic import BaseModel, Field
+from starlette.responses import Response, StreamingResponse
+from starlette.types import Receive, Scope, Send
 
 T = TypeVar("T")
 
@@ -16,3 +20,39 @@ class ApiResponse(BaseModel, Generic[T]):
     @classmethod
     def error_response(cls, code: str, message: str, data: Optional[T] = None):
         return cls(success=False, status_code=code, message=message, data=data)
+
+
+class ApiJSONResponse(Response):
+    """
+    ApiResponse 엔벨로프를 orjson으로 바로 직렬화하는 응답 클래스
+
+    엔드포인트에서 이 응답을 직접 반환하면 FastAPI의 response_model 재검증과
+    jsonable_encoder 변환 단계를 건너뜁니다. (신뢰할 수 있는 내부 출력 전용)
+    """
+    media_type = "application/json"
+
+    def __init__(self, content: Any, *args, indent: bool = False, **kwargs):
+        self.indent = indent
+        super().__init__(content, *args, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            content = content.model_dump()
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if self.indent else 0)
+        # 예외 객체 등 직렬화 불가능한 값(검증 에러 상세 등)은 문자열로 변환
+        return orjson.dumps(content, default=str, option=option)
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """
+    요청 본문을 읽는 동안 응답을 함께 전송하는 스트리밍 응답
+
+    기본 StreamingResponse는 ASGI spec 2.4 미만 서버(uvicorn 등)에서 receive()로 연결 종료를
+    감시하므로, 본문을 읽는 body_iterator와 메시지를 나눠 가지게 됩니다.
+    연결 종료는 body_iterator의 본문 읽기(ClientDisconnect)에서 감지합니다.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
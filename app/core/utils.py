@@ -6,11 +6,7 @@ def dict_to_csv(data: Dict[str, Any]) -> str:
     """
     단일 딕셔너리 데이터를 CSV 문자열로 변환합니다.
     """
-    output = io.StringIO()
-    writer = csv.DictWriter(output, fieldnames=data.keys())
-    writer.writeheader()
-    writer.writerow(data)
-    return output.getvalue()
+    return list_of_dicts_to_csv([data])
 
 def list_of_dicts_to_csv(data_list: List[Dict[str, Any]]) -> str:
     """
@@ -22,5 +18,11 @@ def list_of_dicts_to_csv(data_list: List[Dict[str, Any]]) -> str:
     output = io.StringIO()
     writer = csv.DictWriter(output, fieldnames=data_list[0].keys())
     writer.writeheader()
-    writer.writerows(data_list)
+    writer.writerows(_flatten_lists(row) for row in data_list)
     return output.getvalue()
+
+def _flatten_lists(row: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    리스트 값은 ';' 로 이어붙인 문자열로 변환합니다. (예: skipped_stages)
+    """
+    return {k: ";".join(map(str, v)) if isinstance(v, list) else v for k, v in row.items()}
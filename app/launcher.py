@@ -0,0 +1,230 @@
+"""
+운영용 Pre-fork 런처
+
+마스터 프로세스에서 애플리케이션(파서 및 spaCy 모델 포함)을 한 번만 로드한 뒤
+gc.freeze() 후 워커를 fork 하여 모델 메모리를 Copy-on-Write로 공유합니다.
+
+실행 (프로젝트 루트에서):
+    python -m app.launcher --workers 4
+    python -m app.launcher --workers 4 --mode naive   # 비교용: 워커별 개별 로드 (uvicorn --workers)
+    python -m app.launcher --workers 4 --trace-memory  # 워커별 tracemalloc 할당 추적 (/api/v1/system/memory)
+"""
+import argparse
+import gc
+import os
+import signal
+import socket
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+import uvicorn
+from loguru import logger
+
+from app.core.config import settings
+from app.core.memory import child_pids, read_process_memory
+
+
+def _format_kb(value: Optional[int]) -> str:
+    return "-" if value is None else f"{value / 1024:.1f}MB"
+
+
+class MemoryReporter(threading.Thread):
+    """
+    워커 프로세스별 메모리(RSS / PSS / 공유 / 전용)를 주기적으로 로깅
+    """
+
+    def __init__(self, interval: float, list_workers: Callable[[], Dict[str, int]]):
+        super().__init__(name="memory-reporter", daemon=True)
+        self.interval = interval
+        self.list_workers = list_workers
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            self.report()
+
+    def report(self):
+        master = read_process_memory()
+        total_pss = master.pss or 0
+        logger.info(f"[memory] master pid={master.pid} rss={_format_kb(master.rss)} pss={_format_kb(master.pss)}")
+
+        for name, pid in sorted(self.list_workers().items()):
+            usage = read_process_memory(pid)
+            total_pss += usage.pss or 0
+            logger.info(
+                f"[memory] {name} pid={pid} rss={_format_kb(usage.rss)} pss={_format_kb(usage.pss)} "
+                f"shared={_format_kb(usage.shared)} private={_format_kb(usage.private)}"
+            )
+        logger.info(f"[memory] total pss={_format_kb(total_pss)}")
+
+    def stop(self):
+        self._stopped.set()
+
+
+class PreforkLauncher:
+    """
+    마스터에서 앱을 로드하고 워커를 fork 하는 프로세스 관리자 (Linux / macOS)
+    """
+
+    def __init__(self, host: str, port: int, workers: int, report_interval: float):
+        self.host = host
+        self.port = port
+        self.num_workers = workers
+        self.report_interval = report_interval
+
+        self.app = None
+        self.sock: Optional[socket.socket] = None
+        self.workers: Dict[int, int] = {}  # pid -> worker index
+        # 메모리 리포터 스레드가 워커 맵을 읽는 동안 메인 스레드의 spawn / 회수로 변경되지 않도록 보호
+        self._workers_lock = threading.Lock()
+        self.stopping = False
+
+    def run(self):
+        # 로드 중 생성된 객체가 GC 세대 이동(헤더 쓰기)으로 복사되지 않도록 GC 비활성화 후 로드
+        gc.disable()
+        started = time.perf_counter()
+        from app.main import app
+        self.app = app
+        logger.info(f"Application loaded in master (pid={os.getpid()}) in {time.perf_counter() - started:.2f}s")
+
+        self.sock = self._bind()
+
+        # 현재까지의 객체를 영구 세대로 이동 -> 워커의 GC가 공유 페이지를 건드리지 않음
+        gc.collect()
+        gc.freeze()
+        logger.info(f"Frozen {gc.get_freeze_count()} objects before fork")
+
+        for index in range(self.num_workers):
+            self._spawn(index)
+
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+
+        reporter = None
+        if self.report_interval > 0:
+            reporter = MemoryReporter(self.report_interval, self.worker_snapshot)
+            reporter.start()
+
+        self._supervise()
+
+        if reporter:
+            reporter.stop()
+        self.sock.close()
+        logger.info("All workers stopped")
+
+    def _bind(self) -> socket.socket:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        sock.listen(2048)
+        sock.set_inheritable(True)
+        logger.info(f"Listening on http://{self.host}:{self.port} with {self.num_workers} workers")
+        return sock
+
+    def _spawn(self, index: int):
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 0
+            try:
+                self._run_worker(index)
+            except BaseException:
+                logger.exception(f"Worker {index} crashed")
+                exit_code = 1
+            finally:
+                os._exit(exit_code)
+
+        self._add_worker(pid, index)
+        logger.info(f"Started worker-{index} (pid={pid})")
+
+    def worker_snapshot(self) -> Dict[str, int]:
+        """
+        워커 이름 -> pid 맵의 복사본 (리포터 스레드용)
+        """
+        with self._workers_lock:
+            return {f"worker-{index}": pid for pid, index in self.workers.items()}
+
+    def _add_worker(self, pid: int, index: int):
+        with self._workers_lock:
+            self.workers[pid] = index
+
+    def _remove_worker(self, pid: int) -> Optional[int]:
+        with self._workers_lock:
+            return self.workers.pop(pid, None)
+
+    def _run_worker(self, index: int):
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        gc.enable()
+
+        config = uvicorn.Config(self.app, host=self.host, port=self.port, log_level="info")
+        uvicorn.Server(config).run(sockets=[self.sock])
+
+    def _handle_stop(self, signum, frame):
+        if self.stopping:
+            return
+        self.stopping = True
+        logger.info(f"Received signal {signum}, stopping workers")
+        for pid in list(self.workers):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def _supervise(self):
+        while self.workers:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+
+            index = self._remove_worker(pid)
+            if index is None:
+                continue
+            if not self.stopping:
+                logger.warning(f"worker-{index} (pid={pid}) exited with status {status}, restarting")
+                self._spawn(index)
+
+
+def run_naive(host: str, port: int, workers: int, report_interval: float):
+    """
+    비교용: uvicorn 기본 멀티 워커 (워커마다 앱과 spaCy 모델을 개별 로드)
+    """
+    if report_interval > 0:
+        MemoryReporter(report_interval, lambda: {f"child-{pid}": pid for pid in child_pids()}).start()
+    uvicorn.run("app.main:app", host=host, port=port, workers=workers)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Weighbridge OCR Parser API - production launcher")
+    parser.add_argument("--host", default=settings.host)
+    parser.add_argument("--port", type=int, default=settings.port)
+    parser.add_argument("--workers", type=int, default=settings.workers)
+    parser.add_argument("--mode", choices=["prefork", "naive"], default="prefork")
+    parser.add_argument(
+        "--memory-report-interval", type=float, default=settings.memory_report_interval,
+        help="워커 메모리 리포트 주기 (초, 0이면 비활성화)",
+    )
+    parser.add_argument(
+        "--trace-memory", nargs="?", type=int, const=settings.memory_trace_frames, default=None, metavar="FRAMES",
+        help="워커별 tracemalloc 할당 추적 활성화 (FRAMES: 저장할 호출 스택 깊이)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.trace_memory is not None:
+        # naive 모드의 워커는 앱을 새로 import 하므로 환경 변수로도 전달
+        settings.memory_trace_enabled = True
+        settings.memory_trace_frames = args.trace_memory
+        os.environ["MEMORY_TRACE_ENABLED"] = "true"
+        os.environ["MEMORY_TRACE_FRAMES"] = str(args.trace_memory)
+        if not settings.admin_token:
+            logger.warning("Memory tracing enabled but ADMIN_TOKEN is not set; memory endpoints will reject all requests")
+
+    if args.mode == "naive":
+        run_naive(args.host, args.port, args.workers, args.memory_report_interval)
+    else:
+        PreforkLauncher(args.host, args.port, args.workers, args.memory_report_interval).run()
+
+
+if __name__ == "__main__":
+    main()
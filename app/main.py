@@ -1,17 +1,54 @@
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI, HTTPException
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 
 from app import api
-from app.core.responses import CustomException
+from app.core.responses import CustomException, ApiJSONResponse
 from app.core.filters import custom_exception_filter, global_exception_filter
-from app.core.interceptors import LoggingInterceptor
+from app.core.config import settings
+from app.core.interceptors import AllocationTraceInterceptor, CompressionInterceptor, LoggingInterceptor, RateLimitInterceptor
+from app.core.memory import allocation_tracer
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 워커 프로세스마다 시작 (Pre-fork 런처의 마스터에서 로드한 모델 할당은 추적 대상에서 제외)
+    if settings.memory_trace_enabled:
+        allocation_tracer.max_snapshots = settings.memory_trace_max_snapshots
+        allocation_tracer.start(settings.memory_trace_frames)
+    yield
+    allocation_tracer.stop()
 
-app = FastAPI(title="Weighbridge OCR Parser API", version="1.0.0")
+
+app = FastAPI(
+    title="Weighbridge OCR Parser API",
+    version="1.0.0",
+    default_response_class=ApiJSONResponse,
+    lifespan=lifespan,
+)
 
 # 1. Middleware 등록
 app.add_middleware(LoggingInterceptor)
+app.add_middleware(
+    CompressionInterceptor,
+    min_size=settings.compression_min_size,
+    levels={"gzip": settings.compression_gzip_level, "zstd": settings.compression_zstd_level},
+    enabled=settings.compression_enabled,
+)
+app.add_middleware(
+    RateLimitInterceptor,
+    rules={
+        "parse": (settings.rate_limit_parse_rps, settings.rate_limit_parse_burst),
+        "export": (settings.rate_limit_export_rps, settings.rate_limit_export_burst),
+    },
+    api_key_header=settings.rate_limit_api_key_header,
+    api_keys=settings.rate_limit_api_keys,
+    max_buckets=settings.rate_limit_max_clients,
+    enabled=settings.rate_limit_enabled,
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins={"*"},
@@ -19,6 +56,9 @@ app.add_middleware(
     allow_methods={"OPTIONS", "GET", "POST", "DELETE", "PUT"},
     allow_headers={"*"},
 )
+if settings.memory_trace_enabled:
+    # 비활성화 시에는 등록하지 않아 요청 경로에 추가 비용 없음
+    app.add_middleware(AllocationTraceInterceptor, tracer=allocation_tracer)
 
 # 2. Exception Handlers 정의
 app.add_exception_handler(CustomException, custom_exception_filter)
@@ -1 +1 @@
-from .ocr import OCRInput, WeighbridgeTicket, OCRPage, OCRWord
\ No newline at end of file
+from .ocr import OCRInput, WeighbridgeTicket, OCRPage, OCRWord, OCRWordStore, WeighbridgeSite
\ No newline at end of file
@@ -1 +1,2 @@
-from .models import OCRInput, WeighbridgeTicket, OCRPage, OCRWord
\ No newline at end of file
+from .models import OCRInput, WeighbridgeTicket, OCRPage, OCRWord, WeighbridgeSite
+from .word_store import OCRWordStore
\ No newline at end of file
@@ -1,5 +1,6 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
 from typing import List, Optional, Dict, Any
+from .word_store import OCRWordStore
 
 class OCRWord(BaseModel):
     text: str
@@ -7,12 +8,28 @@ class OCRWord(BaseModel):
     confidence: float = 0.0
 
 class OCRPage(BaseModel):
+    """
+    [Domain Model] OCR 페이지 (단어 목록은 컬럼 배열 기반 OCRWordStore로 보관)
+    """
     text: str
-    words: List[OCRWord] = Field(default_factory=list)
+    words: OCRWordStore = Field(default_factory=OCRWordStore.empty)
     confidence: float = 0.0
     width: Optional[int] = None
     height: Optional[int] = None
 
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @field_validator("words", mode="before")
+    @classmethod
+    def _to_word_store(cls, value: Any) -> OCRWordStore:
+        if isinstance(value, OCRWordStore):
+            return value
+        return OCRWordStore.from_words(value or [])
+
+    @field_serializer("words")
+    def _serialize_words(self, words: OCRWordStore) -> List[Dict[str, Any]]:
+        return words.to_words()
+
 class OCRInput(BaseModel):
     """
     [Domain Model] OCR 엔진으로부터 전달받은 원본 데이터
@@ -26,6 +43,7 @@ class WeighbridgeTicket(BaseModel):
     """
     [Domain Model] 파싱된 계근지 데이터
     """
+    ticket_id: Optional[int] = Field(None, description="저장소 티켓 ID (저장 전에는 None)")
     company_name: Optional[str] = Field(None, description="회사명")
     product_name: Optional[str] = Field(None, description="제품명")
     vehicle_number: Optional[str] = Field(None, description="차량번호")
@@ -41,5 +59,20 @@ class WeighbridgeTicket(BaseModel):
     
     confidence_score: float = Field(0.0, description="파싱 신뢰도")
     uncertain: bool = Field(False, description="검토 필요 여부")
+    skipped_stages: List[str] = Field(default_factory=list, description="처리 시간 예산 초과로 건너뛴 파싱 단계")
+    duplicate_of: Optional[int] = Field(None, description="근사 중복으로 판정된 원본 티켓 ID")
+
+    latitude: Optional[float] = Field(None, description="계량 위치 위도")
+    longitude: Optional[float] = Field(None, description="계량 위치 경도")
+    site_id: Optional[str] = Field(None, description="가장 가까운 등록 계량소 ID")
     
     original_text: Optional[str] = Field(None, description="원본 텍스트 (디버깅용)")
+
+class WeighbridgeSite(BaseModel):
+    """
+    [Domain Model] 등록된 계량소
+    """
+    site_id: str = Field(..., description="계량소 ID")
+    name: Optional[str] = Field(None, description="계량소 이름")
+    latitude: float = Field(..., ge=-90, le=90, description="위도")
+    longitude: float = Field(..., ge=-180, le=180, description="경도")
@@ -0,0 +1,161 @@
+import math
+import sys
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# 좌표가 없는 꼭짓점 표시값 (int32 최솟값, 실제 좌표는 그보다 큰 범위로 제한하므로 음수 좌표와 겹치지 않음)
+MISSING_COORD = int(np.iinfo(np.int32).min)
+MIN_COORD = MISSING_COORD + 1
+MAX_COORD = int(np.iinfo(np.int32).max)
+VERTEX_COUNT = 4
+
+
+class OCRWordStore:
+    """
+    [Domain Model] 페이지 단어 목록의 Struct-of-Arrays 표현
+
+    단어마다 Pydantic 모델 + 좌표 dict를 두는 대신 컬럼 배열로 보관합니다.
+    - text / offsets: 모든 단어 텍스트를 이어붙인 단일 버퍼와 단어별 시작 위치 (n + 1)
+    - xs / ys: 꼭짓점 좌표 (n, 4) int32, 좌표 누락(또는 숫자가 아닌 값) 시 MISSING_COORD
+    - confidence: 단어 인식 신뢰도 (n,) float32
+    """
+    __slots__ = ("text", "offsets", "xs", "ys", "confidence")
+
+    def __init__(self, text: str, offsets: np.ndarray, xs: np.ndarray, ys: np.ndarray, confidence: np.ndarray):
+        self.text = text
+        self.offsets = offsets
+        self.xs = xs
+        self.ys = ys
+        self.confidence = confidence
+
+    @classmethod
+    def empty(cls) -> "OCRWordStore":
+        return cls.from_words([])
+
+    @classmethod
+    def from_words(cls, words: Iterable[Any]) -> "OCRWordStore":
+        """
+        단어 목록(dict, OCRWordDto, OCRWord 등)을 컬럼 배열로 일괄 변환합니다.
+        """
+        fields = [cls._word_fields(w) for w in words]
+        n = len(fields)
+
+        texts = [text or "" for text, _, _ in fields]
+        lengths = np.fromiter(map(len, texts), dtype=np.int32, count=n)
+        offsets = np.zeros(n + 1, dtype=np.int32)
+        np.cumsum(lengths, out=offsets[1:])
+
+        # 단어별 꼭짓점 4개를 (x, y) 평탄화 스트림으로 만들어 한 번에 배열로 적재
+        coords = np.fromiter(
+            chain.from_iterable(cls._flatten_vertices(box) for _, box, _ in fields),
+            dtype=np.int32,
+            count=n * VERTEX_COUNT * 2,
+        ).reshape(n, VERTEX_COUNT, 2)
+
+        confidence = np.fromiter((conf or 0.0 for _, _, conf in fields), dtype=np.float32, count=n)
+
+        return cls(
+            text="".join(texts),
+            offsets=offsets,
+            xs=np.ascontiguousarray(coords[:, :, 0]),
+            ys=np.ascontiguousarray(coords[:, :, 1]),
+            confidence=confidence,
+        )
+
+    @staticmethod
+    def _word_fields(word: Any) -> Tuple[Optional[str], Optional[Dict[str, Any]], Optional[float]]:
+        # dict 및 속성 기반 객체(OCRWordDto, OCRWord)를 model_dump 복사 없이 읽음
+        if isinstance(word, dict):
+            return word.get("text"), word.get("boundingBox"), word.get("confidence")
+        return word.text, word.boundingBox, word.confidence
+
+    @staticmethod
+    def _flatten_vertices(box: Optional[Dict[str, Any]]) -> List[int]:
+        # boundingBox는 검증되지 않은 dict이므로 형식이 다른 값은 좌표 누락으로 처리
+        vertices = box.get("vertices") if isinstance(box, dict) else None
+        if not isinstance(vertices, list):
+            vertices = []
+        flat = []
+        for vertex in vertices[:VERTEX_COUNT]:
+            if not isinstance(vertex, dict):
+                vertex = {}
+            flat.append(OCRWordStore._coerce_coord(vertex.get("x")))
+            flat.append(OCRWordStore._coerce_coord(vertex.get("y")))
+        flat.extend([MISSING_COORD] * (VERTEX_COUNT * 2 - len(flat)))
+        return flat
+
+    @staticmethod
+    def _coerce_coord(value: Any) -> int:
+        # 숫자(또는 숫자 문자열)만 좌표로 인정하고 int32 범위로 제한
+        if isinstance(value, bool) or value is None:
+            return MISSING_COORD
+        if not isinstance(value, int):
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                return MISSING_COORD
+            if not math.isfinite(value):
+                return MISSING_COORD
+            value = int(value)
+        return min(max(value, MIN_COORD), MAX_COORD)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def word(self, index: int) -> str:
+        return self.text[self.offsets[index]:self.offsets[index + 1]]
+
+    @property
+    def words(self) -> List[str]:
+        offsets = self.offsets.tolist()
+        return [self.text[start:end] for start, end in zip(offsets, offsets[1:])]
+
+    def bounds(self) -> np.ndarray:
+        """
+        단어별 축 정렬 경계 상자 (n, 4) = [x_min, y_min, x_max, y_max] (좌표 누락 꼭짓점 제외)
+        """
+        big = np.iinfo(np.int32).max
+        x_min = np.where(self.xs == MISSING_COORD, big, self.xs).min(axis=1, initial=big)
+        y_min = np.where(self.ys == MISSING_COORD, big, self.ys).min(axis=1, initial=big)
+        x_max = self.xs.max(axis=1, initial=MISSING_COORD)
+        y_max = self.ys.max(axis=1, initial=MISSING_COORD)
+        return np.stack([x_min, y_min, x_max, y_max], axis=1)
+
+    def has_box(self) -> np.ndarray:
+        """
+        꼭짓점 좌표가 모두 존재하는 단어 마스크
+        """
+        return (self.xs != MISSING_COORD).all(axis=1) & (self.ys != MISSING_COORD).all(axis=1)
+
+    def to_words(self) -> List[Dict[str, Any]]:
+        """
+        단어 dict 목록으로 복원 (직렬화 / 하위 호환용)
+        """
+        result = []
+        for i, text in enumerate(self.words):
+            vertices = [
+                {
+                    **({"x": int(x)} if x != MISSING_COORD else {}),
+                    **({"y": int(y)} if y != MISSING_COORD else {}),
+                }
+                for x, y in zip(self.xs[i], self.ys[i])
+                if x != MISSING_COORD or y != MISSING_COORD
+            ]
+            result.append({
+                "text": text,
+                "boundingBox": {"vertices": vertices} if vertices else None,
+                "confidence": float(self.confidence[i]),
+            })
+        return result
+
+    def nbytes(self) -> int:
+        """
+        배열 및 텍스트 버퍼가 차지하는 메모리 (bytes)
+        """
+        arrays = (self.offsets, self.xs, self.ys, self.confidence)
+        return sys.getsizeof(self.text) + sum(a.nbytes for a in arrays)
+
+    def __repr__(self) -> str:
+        return f"OCRWordStore(words={len(self)})"
@@ -0,0 +1 @@
+from .ocr import TicketRepository
\ No newline at end of file
@@ -0,0 +1 @@
+from .ticket_repository import TicketRepository
\ No newline at end of file
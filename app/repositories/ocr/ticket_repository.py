@@ -0,0 +1,267 @@
+import base64
+import json
+import os
+import sqlite3
+import threading
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from app.core.geo import bounding_box, haversine_m
+from app.core.responses import CustomException, ErrorStatus
+from app.models.ocr.models import WeighbridgeTicket
+
+# 저장 대상 컬럼 (WeighbridgeTicket 필드명과 동일)
+COLUMNS = (
+    "company_name", "product_name", "vehicle_number",
+    "date", "in_time", "out_time",
+    "total_weight", "empty_weight", "net_weight",
+    "confidence_score", "uncertain", "duplicate_of",
+    "latitude", "longitude", "site_id",
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tickets (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    company_name TEXT,
+    product_name TEXT,
+    vehicle_number TEXT,
+    date TEXT NOT NULL DEFAULT '',
+    in_time TEXT,
+    out_time TEXT,
+    total_weight INTEGER,
+    empty_weight INTEGER,
+    net_weight INTEGER,
+    confidence_score REAL NOT NULL DEFAULT 0,
+    uncertain INTEGER NOT NULL DEFAULT 0,
+    duplicate_of INTEGER,
+    latitude REAL,
+    longitude REAL,
+    site_id TEXT,
+    created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ', 'now'))
+);
+"""
+
+# 기존 DB 파일에 없는 컬럼 추가 (컬럼명 -> 타입)
+MIGRATIONS = {
+    "duplicate_of": "INTEGER",
+    "latitude": "REAL",
+    "longitude": "REAL",
+    "site_id": "TEXT",
+}
+
+# 마이그레이션 이후 생성 (추가된 컬럼을 참조하는 인덱스 포함)
+INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_tickets_date ON tickets (date, id);
+CREATE INDEX IF NOT EXISTS idx_tickets_vehicle ON tickets (vehicle_number, date, id);
+CREATE INDEX IF NOT EXISTS idx_tickets_company ON tickets (company_name, date, id);
+CREATE INDEX IF NOT EXISTS idx_tickets_site ON tickets (site_id, date, id);
+CREATE INDEX IF NOT EXISTS idx_tickets_location ON tickets (latitude, longitude) WHERE latitude IS NOT NULL;
+"""
+
+
+class TicketRepository:
+    """
+    파싱된 계근지 저장소 (SQLite, WAL 모드)
+
+    - 쓰기: 단일 커넥션 + Lock, 배치 단위 트랜잭션
+    - 읽기: 스레드별 커넥션 (WAL 모드에서 쓰기와 동시에 조회 가능)
+    - 조회: (date, id) 기준 Keyset 페이지네이션
+    - 반경 조회: (latitude, longitude) 인덱스로 위경도 사각형 범위를 좁힌 뒤 대원 거리로 필터링
+    """
+
+    def __init__(self, db_path: str, batch_size: int = 1000):
+        self.db_path = db_path
+        self.batch_size = batch_size
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._write_lock = threading.Lock()
+        self._local = threading.local()
+        self._writer = self._connect()
+        self._writer.executescript(SCHEMA)
+        self._migrate()
+        self._writer.executescript(INDEXES)
+        logger.info(f"Ticket repository ready: {db_path}")
+
+        # SQLite 커넥션은 fork 이후 공유하면 안 되므로 자식 프로세스에서 새로 연결 (Pre-fork 런처 대응)
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._reset_after_fork)
+
+    def _migrate(self):
+        existing = {row["name"] for row in self._writer.execute("PRAGMA table_info(tickets)")}
+        for column, column_type in MIGRATIONS.items():
+            if column not in existing:
+                self._writer.execute(f"ALTER TABLE tickets ADD COLUMN {column} {column_type}")
+                logger.info(f"Ticket repository migrated: added column {column}")
+
+    def _reset_after_fork(self):
+        # 상속된 커넥션은 닫지 않고 버림 (close 시 부모의 WAL 파일에 영향)
+        self._write_lock = threading.Lock()
+        self._local = threading.local()
+        self._writer = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    def save(self, ticket: WeighbridgeTicket) -> int:
+        """
+        단일 티켓을 저장하고 ID를 반환합니다.
+        """
+        return self.save_all([ticket])[0]
+
+    def save_all(self, tickets: Iterable[WeighbridgeTicket]) -> List[int]:
+        """
+        티켓 목록을 batch_size 단위 트랜잭션으로 일괄 저장하고 ID 목록을 반환합니다.
+        """
+        sql = (
+            f"INSERT INTO tickets ({', '.join(COLUMNS)}) "
+            f"VALUES ({', '.join('?' for _ in COLUMNS)})"
+        )
+        ids = []
+        batch = []
+        with self._write_lock:
+            for ticket in tickets:
+                batch.append(self._to_row(ticket))
+                if len(batch) >= self.batch_size:
+                    ids.extend(self._insert_batch(sql, batch))
+                    batch = []
+            if batch:
+                ids.extend(self._insert_batch(sql, batch))
+        return ids
+
+    def _insert_batch(self, sql: str, rows: List[tuple]) -> List[int]:
+        # IMMEDIATE 트랜잭션은 다른 프로세스의 쓰기도 막으므로 배치 내 ID가 연속으로 할당됨
+        cursor = self._writer.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        try:
+            cursor.executemany(sql, rows)
+            last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+            cursor.execute("COMMIT")
+        except Exception:
+            cursor.execute("ROLLBACK")
+            raise
+        return list(range(last_id - len(rows) + 1, last_id + 1))
+
+    def find_by_id(self, ticket_id: int) -> Optional[WeighbridgeTicket]:
+        row = self._reader().execute("SELECT * FROM tickets WHERE id = ?", (ticket_id,)).fetchone()
+        return self._to_ticket(row) if row else None
+
+    def find(
+        self,
+        vehicle_number: Optional[str] = None,
+        company_name: Optional[str] = None,
+        site_id: Optional[str] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+    ) -> Tuple[List[WeighbridgeTicket], Optional[str]]:
+        """
+        필터 조건으로 티켓을 조회합니다. (다음 페이지 커서 함께 반환)
+        """
+        where, params = [], []
+        if vehicle_number:
+            where.append("vehicle_number = ?")
+            params.append(vehicle_number)
+        if company_name:
+            where.append("company_name = ?")
+            params.append(company_name)
+        if site_id:
+            where.append("site_id = ?")
+            params.append(site_id)
+        if date_from:
+            where.append("date >= ?")
+            params.append(date_from)
+        if date_to:
+            where.append("date <= ?")
+            params.append(date_to)
+        if cursor:
+            where.append("(date, id) > (?, ?)")
+            params.extend(self._decode_cursor(cursor))
+
+        sql = "SELECT * FROM tickets"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY date, id LIMIT ?"
+        params.append(limit + 1)
+
+        rows = self._reader().execute(sql, params).fetchall()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = self._encode_cursor(rows[-1]["date"], rows[-1]["id"])
+
+        return [self._to_ticket(row) for row in rows], next_cursor
+
+    def find_nearby(
+        self,
+        latitude: float,
+        longitude: float,
+        radius_m: float,
+        limit: int = 100,
+    ) -> List[Tuple[WeighbridgeTicket, float]]:
+        """
+        좌표에서 radius_m 이내의 티켓을 가까운 순으로 (티켓, 거리 m) 목록으로 반환합니다.
+        """
+        min_lat, max_lat, lon_ranges = bounding_box(latitude, longitude, radius_m)
+        # 날짜변경선을 넘는 경우 경도 구간이 두 개
+        lon_clause = " OR ".join("longitude BETWEEN ? AND ?" for _ in lon_ranges)
+        rows = self._reader().execute(
+            f"SELECT * FROM tickets WHERE latitude BETWEEN ? AND ? AND ({lon_clause})",
+            (min_lat, max_lat, *(bound for lon_range in lon_ranges for bound in lon_range)),
+        ).fetchall()
+        if not rows:
+            return []
+
+        distances = haversine_m(
+            latitude, longitude,
+            np.fromiter((row["latitude"] for row in rows), dtype=np.float64, count=len(rows)),
+            np.fromiter((row["longitude"] for row in rows), dtype=np.float64, count=len(rows)),
+        )
+        within = np.flatnonzero(distances <= radius_m)
+        nearest = within[np.argsort(distances[within], kind="stable")][:limit]
+        return [(self._to_ticket(rows[i]), float(distances[i])) for i in nearest]
+
+    def close(self):
+        self._writer.close()
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def _to_row(self, ticket: WeighbridgeTicket) -> tuple:
+        values = [getattr(ticket, column) for column in COLUMNS]
+        values[COLUMNS.index("date")] = ticket.date or ""
+        values[COLUMNS.index("uncertain")] = int(ticket.uncertain)
+        return tuple(values)
+
+    def _to_ticket(self, row: sqlite3.Row) -> WeighbridgeTicket:
+        data = {column: row[column] for column in COLUMNS}
+        data["date"] = data["date"] or None
+        data["uncertain"] = bool(data["uncertain"])
+        return WeighbridgeTicket(ticket_id=row["id"], **data)
+
+    def _encode_cursor(self, date: str, ticket_id: int) -> str:
+        raw = json.dumps([date, ticket_id], separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode()
+
+    def _decode_cursor(self, cursor: str) -> Tuple[str, int]:
+        try:
+            date, ticket_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            return str(date), int(ticket_id)
+        except (ValueError, TypeError):
+            raise CustomException(ErrorStatus.INVALID_CURSOR)
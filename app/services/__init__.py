@@ -1 +1 @@
-from .ocr import OCRParserService
\ No newline at end of file
+from .ocr import OCRParserService, TicketExportService, BatchValidationService, NDJSONStreamService, NearDuplicateService, LayoutTemplateService, SiteRegistry, TicketIngestService
\ No newline at end of file
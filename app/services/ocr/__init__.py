@@ -1 +1,8 @@
-from .ocr_service import OCRParserService
\ No newline at end of file
+from .ocr_service import OCRParserService
+from .export_service import TicketExportService
+from .validation_service import BatchValidationService
+from .stream_service import NDJSONStreamService
+from .dedup_service import NearDuplicateService
+from .template_service import LayoutTemplateService
+from .site_service import SiteRegistry
+from .ingest_service import TicketIngestService
\ No newline at end of file
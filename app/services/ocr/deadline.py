@@ -0,0 +1,23 @@
+import time
+from typing import Optional
+
+
+class Deadline:
+    """
+    요청 단위 처리 시간 예산 (단조 시계 기반)
+
+    budget_ms가 None 또는 0 이하이면 제한 없음.
+    """
+    __slots__ = ("budget_ms", "expires_at")
+
+    def __init__(self, budget_ms: Optional[float] = None):
+        self.budget_ms = budget_ms if budget_ms and budget_ms > 0 else None
+        self.expires_at = time.monotonic() + self.budget_ms / 1000 if self.budget_ms else None
+
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def remaining_ms(self) -> Optional[float]:
+        if self.expires_at is None:
+            return None
+        return max(0.0, (self.expires_at - time.monotonic()) * 1000)
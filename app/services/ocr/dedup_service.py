@@ -0,0 +1,220 @@
+import re
+import threading
+import time
+import zlib
+from collections import deque
+from typing import Callable, Deque, Dict, List, NamedTuple, Optional, Set, Tuple
+
+import numpy as np
+from loguru import logger
+
+# MinHash 순열 해시 계수 생성 시드 (프로세스 간 동일한 서명을 얻기 위해 고정)
+MINHASH_SEED = 20260202
+
+_SEPARATOR_PATTERN = re.compile(r"[\s\W_]+")
+_NON_DIGIT_PATTERN = re.compile(r"\D+")
+
+
+class TicketFingerprint(NamedTuple):
+    """
+    정규화된 계근지 텍스트의 MinHash 서명
+
+    - text: 공백/구두점을 제거한 전체 텍스트의 n-gram 서명
+    - digits: 숫자만 이어붙인 문자열의 n-gram 서명 (LSH 후보 탐색 키)
+    """
+    text: np.ndarray
+    digits: np.ndarray
+
+
+class _Entry(NamedTuple):
+    ticket_id: Optional[int]  # None: 원본 파싱/저장 중인 예약 항목
+    registered_at: float
+    fingerprint: TicketFingerprint
+    band_keys: Tuple[bytes, ...]
+
+
+class NearDuplicateService:
+    """
+    MinHash + LSH(Banding) 기반 계근지 근사 중복 탐지
+
+    같은 계근지를 두 번 촬영하면 OCR 잡음만 다른 텍스트가 들어옵니다.
+    - 후보 탐색: 숫자열 서명을 bands개 구간으로 나눠 구간이 하나라도 같은 항목만 비교 (전체 스캔 없음)
+    - 후보 검증: 숫자열과 텍스트 서명의 추정 Jaccard 유사도가 모두 threshold 이상
+      (같은 양식의 다른 계근지는 텍스트가 거의 같으므로 중량/시각 등 숫자열로 구분)
+    - window_sec보다 오래 전에 등록된 항목은 인덱스에서 제거
+    - 동시 요청: find_or_reserve로 검사와 등록(예약)을 한 번에 수행하고, 저장 후 confirm으로 ID 확정
+      (예약된 원본과 겹치는 요청은 확정될 때까지 최대 pending_timeout초 대기)
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.7,
+        window_sec: float = 3600.0,
+        num_perm: int = 128,
+        bands: int = 32,
+        shingle_size: int = 3,
+        pending_timeout: float = 30.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.threshold = threshold
+        self.window_sec = window_sec
+        self.num_perm = num_perm
+        self.bands = bands
+        self.shingle_size = shingle_size
+        self.pending_timeout = pending_timeout
+        self.clock = clock
+
+        # 순열 해시: h(x) = (a * x + b) >> 32 (uint64 오버플로 = mod 2^64, Multiply-Shift)
+        rng = np.random.default_rng(MINHASH_SEED)
+        self._a = (rng.integers(1, 2 ** 63, size=num_perm, dtype=np.uint64) | np.uint64(1))[:, None]
+        self._b = rng.integers(0, 2 ** 63, size=num_perm, dtype=np.uint64)[:, None]
+
+        self._lock = threading.Lock()
+        # 예약 항목이 확정 / 취소되면 대기 중인 요청을 깨움
+        self._resolved = threading.Condition(self._lock)
+        self._entries: Dict[int, _Entry] = {}
+        self._buckets: Dict[bytes, Set[int]] = {}
+        self._order: Deque[int] = deque()
+        self._next_key = 0
+
+    def fingerprint(self, text: str) -> TicketFingerprint:
+        normalized = _SEPARATOR_PATTERN.sub("", text.lower())
+        return TicketFingerprint(
+            text=self._minhash(normalized),
+            digits=self._minhash(_NON_DIGIT_PATTERN.sub("", normalized)),
+        )
+
+    def find(self, fingerprint: TicketFingerprint) -> Optional[int]:
+        """
+        시간 창 안에서 가장 유사한 중복 원본의 티켓 ID를 반환합니다. (없으면 None, 예약 항목은 제외)
+        """
+        with self._lock:
+            self._evict_expired()
+            entry, score = self._match(fingerprint, include_pending=False)
+
+        if entry is None:
+            return None
+        logger.info(f"Near-duplicate ticket detected: original={entry.ticket_id} similarity={score:.2f}")
+        return entry.ticket_id
+
+    def find_or_reserve(self, fingerprint: TicketFingerprint) -> Tuple[Optional[int], Optional[int]]:
+        """
+        중복 원본을 찾고, 없으면 같은 잠금 안에서 예약 항목을 등록합니다.
+        (원본 ID, 예약 키) 중 하나만 값이 있으며, 예약 키를 받은 호출자는 저장 후 confirm / 실패 시 release를 호출합니다.
+
+        예약 항목과 겹치면 확정될 때까지 대기하고, pending_timeout 안에 확정되지 않으면 (None, None)을 반환합니다.
+        """
+        band_keys = tuple(self._band_keys(fingerprint.digits))
+        deadline = time.monotonic() + self.pending_timeout
+        with self._lock:
+            while True:
+                self._evict_expired()
+                entry, score = self._match(fingerprint, include_pending=True)
+                if entry is None:
+                    return None, self._register(fingerprint, band_keys, None)
+                if entry.ticket_id is not None:
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning("Near-duplicate original is still pending. Processing as a new ticket.")
+                    return None, None
+                self._resolved.wait(remaining)
+
+        logger.info(f"Near-duplicate ticket detected: original={entry.ticket_id} similarity={score:.2f}")
+        return entry.ticket_id, None
+
+    def confirm(self, reservation: int, ticket_id: int):
+        """
+        예약 항목에 저장된 원본 티켓 ID를 기록하고 대기 중인 요청을 깨웁니다.
+        """
+        with self._lock:
+            entry = self._entries.get(reservation)
+            if entry is not None:
+                self._entries[reservation] = entry._replace(ticket_id=ticket_id)
+            self._resolved.notify_all()
+
+    def release(self, reservation: int):
+        """
+        원본 파싱/저장에 실패한 예약 항목을 제거합니다. (대기 중인 요청은 다시 검사)
+        """
+        with self._lock:
+            if reservation in self._entries:
+                self._remove(reservation)
+            self._resolved.notify_all()
+
+    def add(self, fingerprint: TicketFingerprint, ticket_id: int):
+        """
+        원본 티켓의 서명을 인덱스에 등록합니다.
+        """
+        band_keys = tuple(self._band_keys(fingerprint.digits))
+        with self._lock:
+            self._evict_expired()
+            self._register(fingerprint, band_keys, ticket_id)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def similarity(a: np.ndarray, b: np.ndarray) -> float:
+        """
+        두 MinHash 서명의 추정 Jaccard 유사도
+        """
+        return float(np.count_nonzero(a == b)) / len(a)
+
+    def _minhash(self, text: str) -> np.ndarray:
+        k = self.shingle_size
+        shingles = {text[i:i + k] for i in range(max(1, len(text) - k + 1))}
+        hashes = np.fromiter((zlib.crc32(s.encode()) for s in shingles), dtype=np.uint64, count=len(shingles))
+        return ((self._a * hashes + self._b) >> np.uint64(32)).min(axis=1)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        rows = self.num_perm // self.bands
+        return [bytes([band]) + signature[band * rows:(band + 1) * rows].tobytes() for band in range(self.bands)]
+
+    def _match(self, fingerprint: TicketFingerprint, include_pending: bool) -> Tuple[Optional[_Entry], float]:
+        candidates = set()
+        for key in self._band_keys(fingerprint.digits):
+            candidates.update(self._buckets.get(key, ()))
+
+        best_entry, best_score = None, self.threshold
+        for entry_key in candidates:
+            entry = self._entries[entry_key]
+            if entry.ticket_id is None and not include_pending:
+                continue
+            score = self.similarity(fingerprint.digits, entry.fingerprint.digits)
+            if score < best_score:
+                continue
+            score = min(score, self.similarity(fingerprint.text, entry.fingerprint.text))
+            if score >= best_score:
+                best_entry, best_score = entry, score
+        return best_entry, best_score
+
+    def _register(self, fingerprint: TicketFingerprint, band_keys: Tuple[bytes, ...], ticket_id: Optional[int]) -> int:
+        entry_key = self._next_key
+        self._next_key += 1
+        self._entries[entry_key] = _Entry(ticket_id, self.clock(), fingerprint, band_keys)
+        self._order.append(entry_key)
+        for key in band_keys:
+            self._buckets.setdefault(key, set()).add(entry_key)
+        return entry_key
+
+    def _remove(self, entry_key: int):
+        for key in self._entries.pop(entry_key).band_keys:
+            bucket = self._buckets[key]
+            bucket.discard(entry_key)
+            if not bucket:
+                del self._buckets[key]
+
+    def _evict_expired(self):
+        expire_before = self.clock() - self.window_sec
+        while self._order:
+            entry = self._entries.get(self._order[0])
+            # release로 이미 제거된 항목은 순서 큐에서만 정리
+            if entry is not None and entry.registered_at >= expire_before:
+                break
+            entry_key = self._order.popleft()
+            if entry is not None:
+                self._remove(entry_key)
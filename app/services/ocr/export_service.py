@@ -0,0 +1,96 @@
+from typing import Any, BinaryIO, Iterable, Iterator, List, Union
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from loguru import logger
+
+from app.models.ocr.models import WeighbridgeTicket
+
+# 분석용 컬럼 스키마
+# - 중량: 정수형 컬럼 (OCR 오인식으로 int32 범위를 넘는 값도 저장소와 동일하게 보존)
+# - 날짜/시간: date32 / time32(s) 시간 타입
+# - 회사명/제품명/차량번호/계량소: 반복 값이 많으므로 Dictionary 인코딩
+TICKET_SCHEMA = pa.schema([
+    pa.field("company_name", pa.dictionary(pa.int32(), pa.string())),
+    pa.field("product_name", pa.dictionary(pa.int32(), pa.string())),
+    pa.field("vehicle_number", pa.dictionary(pa.int32(), pa.string())),
+    pa.field("date", pa.date32()),
+    pa.field("in_time", pa.time32("s")),
+    pa.field("out_time", pa.time32("s")),
+    pa.field("total_weight", pa.int64()),
+    pa.field("empty_weight", pa.int64()),
+    pa.field("net_weight", pa.int64()),
+    pa.field("confidence_score", pa.float64()),
+    pa.field("uncertain", pa.bool_()),
+    pa.field("site_id", pa.dictionary(pa.int32(), pa.string())),
+    pa.field("latitude", pa.float64()),
+    pa.field("longitude", pa.float64()),
+])
+
+DEFAULT_ROW_GROUP_SIZE = 10_000
+
+
+class TicketExportService:
+    """
+    파싱된 계근지 배치를 Arrow / Parquet 컬럼 포맷으로 변환
+    """
+
+    def __init__(self, row_group_size: int = DEFAULT_ROW_GROUP_SIZE, compression: str = "zstd"):
+        self.row_group_size = row_group_size
+        self.compression = compression
+
+    def to_record_batch(self, tickets: List[WeighbridgeTicket]) -> pa.RecordBatch:
+        """
+        계근지 목록을 TICKET_SCHEMA 형태의 RecordBatch로 변환합니다.
+        """
+        columns = {field.name: [getattr(t, field.name) for t in tickets] for field in TICKET_SCHEMA}
+
+        arrays = []
+        for field in TICKET_SCHEMA:
+            values = columns[field.name]
+            if pa.types.is_dictionary(field.type):
+                arrays.append(pa.array(values, pa.string()).dictionary_encode())
+            elif pa.types.is_date(field.type):
+                arrays.append(self._parse_temporal(values, "%Y-%m-%d", field.type))
+            elif pa.types.is_time(field.type):
+                arrays.append(self._parse_temporal(values, "%H:%M:%S", field.type))
+            else:
+                arrays.append(pa.array(values, field.type))
+
+        return pa.RecordBatch.from_arrays(arrays, schema=TICKET_SCHEMA)
+
+    def write_parquet(
+        self,
+        tickets: Iterable[WeighbridgeTicket],
+        sink: Union[str, BinaryIO],
+    ) -> int:
+        """
+        계근지 스트림을 row group 단위로 나누어 Parquet으로 기록합니다.
+        입력은 한 번에 row_group_size 건만 메모리에 유지됩니다. (기록된 행 수 반환)
+        """
+        rows = 0
+        with pq.ParquetWriter(sink, TICKET_SCHEMA, compression=self.compression) as writer:
+            for chunk in self._chunked(tickets):
+                writer.write_batch(self.to_record_batch(chunk), row_group_size=self.row_group_size)
+                rows += len(chunk)
+
+        logger.debug(f"Parquet export completed: {rows} rows")
+        return rows
+
+    def _chunked(self, tickets: Iterable[WeighbridgeTicket]) -> Iterator[List[WeighbridgeTicket]]:
+        chunk = []
+        for ticket in tickets:
+            chunk.append(ticket)
+            if len(chunk) >= self.row_group_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def _parse_temporal(self, values: List[Any], fmt: str, target: pa.DataType) -> pa.Array:
+        """
+        문자열 날짜/시간 컬럼을 Arrow 시간 타입으로 일괄 변환 (형식 오류는 null 처리)
+        """
+        parsed = pc.strptime(pa.array(values, pa.string()), format=fmt, unit="s", error_is_null=True)
+        return parsed.cast(target)
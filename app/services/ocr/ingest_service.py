@@ -0,0 +1,143 @@
+from typing import Dict, List, Literal, Optional
+
+from app.core.metrics import metrics
+from app.models.ocr.models import OCRInput, WeighbridgeTicket
+from app.repositories import TicketRepository
+from .dedup_service import NearDuplicateService
+from .ocr_service import OCRParserService
+from .validation_service import BatchValidationService
+
+DedupMode = Literal["off", "flag", "skip"]
+
+duplicate_counter = metrics.counter("ocr_duplicate_tickets_total", "근사 중복으로 판정된 계근지 수", ("mode",))
+
+
+class TicketIngestService:
+    """
+    계근지 수집: 근사 중복 검사 -> 파싱 -> (배치) 교차 검증 -> 저장
+
+    - off: 중복 검사 없이 파싱 및 저장
+    - flag: 파싱/저장하고 duplicate_of에 원본 ID 표시
+    - skip: 파싱 없이 원본 티켓을 반환 (저장하지 않음)
+    """
+
+    def __init__(
+        self,
+        parser_service: OCRParserService,
+        validation_service: BatchValidationService,
+        repository: TicketRepository,
+        dedup_service: NearDuplicateService,
+        dedup_mode: DedupMode = "flag",
+    ):
+        self.parser_service = parser_service
+        self.validation_service = validation_service
+        self.repository = repository
+        self.dedup_service = dedup_service
+        self.dedup_mode = dedup_mode
+
+    def ingest(self, ocr_input: OCRInput, budget_ms: Optional[float] = None) -> WeighbridgeTicket:
+        """
+        단건 문서를 근사 중복 검사 후 파싱 및 저장합니다. (스레드풀에서 실행)
+        """
+        if self.dedup_mode == "off":
+            ticket = self.parser_service.parse(ocr_input, budget_ms=budget_ms)
+            ticket.ticket_id = self.repository.save(ticket)
+            return ticket
+
+        # 파싱 전에 예약하여 동시에 들어온 같은 계근지가 모두 원본으로 저장되지 않도록 함
+        fingerprint = self.dedup_service.fingerprint(ocr_input.text)
+        original_id, reservation = self.dedup_service.find_or_reserve(fingerprint)
+        if original_id is not None:
+            duplicate_counter.inc(mode=self.dedup_mode)
+            if self.dedup_mode == "skip":
+                original = self.repository.find_by_id(original_id)
+                if original is not None:
+                    return original.model_copy(update={"ticket_id": None, "duplicate_of": original_id})
+
+        try:
+            ticket = self.parser_service.parse(ocr_input, budget_ms=budget_ms)
+            ticket.duplicate_of = original_id
+            ticket.ticket_id = self.repository.save(ticket)
+        except BaseException:
+            if reservation is not None:
+                self.dedup_service.release(reservation)
+            raise
+        if reservation is not None:
+            self.dedup_service.confirm(reservation, ticket.ticket_id)
+        return ticket
+
+    def ingest_batch(self, ocr_inputs: List[OCRInput]) -> List[WeighbridgeTicket]:
+        """
+        근사 중복 검사, 파싱, 배치 교차 검증 후 일괄 저장합니다. (결과는 입력 순서)
+
+        이전 요청에서 등록된 원본뿐 아니라 같은 배치의 앞선 문서와도 비교합니다.
+        """
+        if self.dedup_mode == "off":
+            tickets = self.validation_service.validate(list(self.parser_service.parse_batch(ocr_inputs)))
+            for ticket, ticket_id in zip(tickets, self.repository.save_all(tickets)):
+                ticket.ticket_id = ticket_id
+            return tickets
+
+        dedup_service = self.dedup_service
+        fingerprints = [dedup_service.fingerprint(ocr_input.text) for ocr_input in ocr_inputs]
+        # 배치 내 비교용 임시 인덱스 (ID 대신 배치 내 위치를 등록)
+        batch_index = NearDuplicateService(threshold=dedup_service.threshold, window_sec=dedup_service.window_sec)
+        stored_originals: List[Optional[int]] = []
+        batch_originals: List[Optional[int]] = []
+        reservations: Dict[int, int] = {}  # 배치 내 위치 -> 예약 키 (저장 후 확정)
+        try:
+            for position, fingerprint in enumerate(fingerprints):
+                # 배치 내 원본은 이미 예약되어 있으므로 먼저 비교 (자기 예약을 기다리지 않도록)
+                stored_id, batch_position = None, batch_index.find(fingerprint)
+                if batch_position is None:
+                    stored_id, reservation = dedup_service.find_or_reserve(fingerprint)
+                    if reservation is not None:
+                        reservations[position] = reservation
+                    if stored_id is None:
+                        batch_index.add(fingerprint, position)
+                stored_originals.append(stored_id)
+                batch_originals.append(batch_position)
+                if stored_id is not None or batch_position is not None:
+                    duplicate_counter.inc(mode=self.dedup_mode)
+
+            skip = self.dedup_mode == "skip"
+            results: List[Optional[WeighbridgeTicket]] = [None] * len(ocr_inputs)
+            if skip:
+                for position, stored_id in enumerate(stored_originals):
+                    original = self.repository.find_by_id(stored_id) if stored_id is not None else None
+                    if original is not None:
+                        results[position] = original.model_copy(update={"ticket_id": None, "duplicate_of": stored_id})
+
+            positions = [
+                position for position in range(len(ocr_inputs))
+                if results[position] is None and not (skip and batch_originals[position] is not None)
+            ]
+            parsed = self.validation_service.validate(
+                list(self.parser_service.parse_batch([ocr_inputs[p] for p in positions]))
+            )
+            for position, ticket in zip(positions, parsed):
+                ticket.duplicate_of = stored_originals[position]
+                results[position] = ticket
+
+            # 배치 내 원본을 먼저 저장해야 중복 티켓의 duplicate_of에 원본 ID를 기록할 수 있음
+            originals = [p for p in positions if batch_originals[p] is None]
+            for position, ticket_id in zip(originals, self.repository.save_all([results[p] for p in originals])):
+                results[position].ticket_id = ticket_id
+                if position in reservations:
+                    dedup_service.confirm(reservations.pop(position), ticket_id)
+        finally:
+            for reservation in reservations.values():
+                dedup_service.release(reservation)
+
+        duplicates = [p for p in range(len(ocr_inputs)) if batch_originals[p] is not None]
+        for position in duplicates:
+            original = results[batch_originals[position]]
+            if skip:
+                results[position] = original.model_copy(update={"ticket_id": None, "duplicate_of": original.ticket_id})
+            else:
+                results[position].duplicate_of = original.ticket_id
+        if not skip:
+            for position, ticket_id in zip(duplicates, self.repository.save_all([results[p] for p in duplicates])):
+                results[position].ticket_id = ticket_id
+
+        return results
@@ -1,11 +1,33 @@
 import re
 import spacy
-from typing import Optional, List, Tuple
+from typing import Any, Callable, Dict, Optional, List, Tuple, Iterable, Iterator
 from loguru import logger
+from app.core.config import settings
+from app.core.metrics import metrics
 from app.models.ocr.models import OCRInput, WeighbridgeTicket
+from .deadline import Deadline
+from .template_service import LayoutTemplateService
+from .site_service import SiteRegistry
+from .validation_service import WEIGHT_TOLERANCE_KG
+
+deadline_hits = metrics.counter("ocr_parse_deadline_exceeded_total", "처리 시간 예산을 초과한 파싱 요청 수")
+skipped_stage_counter = metrics.counter(
+    "ocr_parse_skipped_stages_total", "처리 시간 예산 초과로 건너뛴 파싱 단계 수", ("stage",)
+)
 
 class OCRParserService:
-    def __init__(self):
+    def __init__(
+        self,
+        budget_ms: Optional[float] = None,
+        template_service: Optional[LayoutTemplateService] = None,
+        site_registry: Optional[SiteRegistry] = None,
+    ):
+        # 요청당 처리 시간 예산 (ms, None이면 설정값 사용 / 0 이하면 제한 없음)
+        self.budget_ms = settings.parse_budget_ms if budget_ms is None else budget_ms
+        # 레이아웃 템플릿 캐시 (None이면 항상 일반 파싱 경로 사용)
+        self.template_service = template_service
+        # 계량소 공간 인덱스 (None이면 좌표만 추출하고 계량소 판정은 하지 않음)
+        self.site_registry = site_registry
         try:
             # 한국어 모델 로드
             self.nlp = spacy.load("ko_core_news_sm")
@@ -14,18 +36,55 @@ class OCRParserService:
             logger.warning("spaCy model 'ko_core_news_sm' not found. NER capabilities will be limited.")
             self.nlp = None
 
-    def parse(self, ocr_input: OCRInput) -> WeighbridgeTicket:
+    def parse(self, ocr_input: OCRInput, budget_ms: Optional[float] = None) -> WeighbridgeTicket:
         text = ocr_input.text
         logger.debug(f"Parsing text length: {len(text)}")
 
+        # 처리 시간 예산: 각 단계 시작 전에 확인하고, 초과 시 남은 단계는 건너뜀
+        deadline = Deadline(self.budget_ms if budget_ms is None else budget_ms)
+        skipped_stages: List[str] = []
+
+        def should_run(stage: str) -> bool:
+            if deadline.expired():
+                skipped_stages.append(stage)
+                return False
+            return True
+
+        # 0. 레이아웃 템플릿 조회: 학습된 양식이면 필드 영역에서 값을 바로 읽고, 못 읽은 필드만 일반 경로로 추출
+        page_words = ocr_input.pages[0].words if ocr_input.pages else None
+        template_id, fields = None, {}
+        if self.template_service is not None and page_words is not None and should_run("template"):
+            matched = self.template_service.match(page_words)
+            if matched:
+                template_id, raw_fields = matched
+                fields = self._parse_template_fields(raw_fields)
+
+        total_weight = fields.get("total_weight")
+        empty_weight = fields.get("empty_weight")
+        net_weight = fields.get("net_weight")
+        date = fields.get("date")
+        in_time = fields.get("in_time")
+        out_time = fields.get("out_time")
+        vehicle_number = fields.get("vehicle_number")
+        company_name = fields.get("company_name")
+        product_name = fields.get("product_name")
+
         # 1. 중량 데이터 추출 (정규표현식 기반 패턴 매칭)
         # 다양한 라벨 변형을 고려하여 키워드 확장
-        total_weight = self._extract_weight(text, ["총중량", "총량", "총"])
-        empty_weight = self._extract_weight(text, ["공차중량", "공차", "차중량", "차량중량"])
-        net_weight = self._extract_weight(text, ["실중량", "순중량", "실량"])
+        if not (total_weight and empty_weight and net_weight) and should_run("weight"):
+            total_weight = total_weight or self._extract_weight(text, ["총중량", "총량", "총"])
+            empty_weight = empty_weight or self._extract_weight(text, ["공차중량", "공차", "차중량", "차량중량"])
+            net_weight = net_weight or self._extract_weight(text, ["실중량", "순중량", "실량"])
+
+        # 라벨로 추출한 중량 그대로 정합성이 맞는 경우에만 템플릿 학습 대상
+        # (크기순 Fallback 값은 공차/실중량이 뒤바뀌어도 합이 같아 정합성 검사를 통과하므로 제외)
+        weights_verified = bool(
+            total_weight and empty_weight and net_weight
+            and abs(total_weight - empty_weight - net_weight) <= WEIGHT_TOLERANCE_KG
+        )
 
         # 라벨 기반 추출 실패 시, Fallback 로직: kg 단위 숫자들을 크기순으로 할당
-        if not (total_weight and empty_weight and net_weight):
+        if not (total_weight and empty_weight and net_weight) and should_run("weight_fallback"):
             logger.info("Label-based weight extraction incomplete. Trying fallback logic.")
             weights = self._extract_all_weights(text)
             if len(weights) >= 2:
@@ -34,41 +93,71 @@ class OCRParserService:
                 if not total_weight: total_weight = weights[0]
                 if not empty_weight: empty_weight = weights[1]
                 if not net_weight and len(weights) >= 3: net_weight = weights[2]
+                weights_verified = False
 
         # 2. 날짜 및 시간 추출
-        date = self._extract_date(text)
-        times = self._extract_times(text)
-        
-        # 입/출고 시간 추론 (휴리스틱)
-        in_time = None
-        out_time = None
-        if len(times) >= 1:
-            in_time = times[0]
-        if len(times) >= 2:
-            out_time = times[-1]
+        if not (date and in_time and out_time) and should_run("datetime"):
+            date = date or self._extract_date(text)
+            times = self._extract_times(text)
+
+            # 입/출고 시간 추론 (휴리스틱)
+            if len(times) >= 1 and not in_time:
+                in_time = times[0]
+            if len(times) >= 2 and not out_time:
+                out_time = times[-1]
 
         # 3. 차량 번호 추출
-        vehicle_number = self._extract_vehicle_number(text)
+        if not vehicle_number and should_run("vehicle"):
+            vehicle_number = self._extract_vehicle_number(text)
+
+        # 3-1. 계량 위치(GPS 좌표) 추출 및 가장 가까운 계량소 판정
+        latitude = longitude = site_id = None
+        if should_run("location"):
+            coordinates = self._extract_coordinates(text)
+            if coordinates:
+                latitude, longitude = coordinates
+                if self.site_registry is not None:
+                    site_id = self.site_registry.resolve(latitude, longitude)
 
         # 4. 회사명 및 품목명 추출 (하이브리드 방식: Regex + spaCy NER)
-        company_name = self._extract_company(text)
-        product_name = self._extract_product(text)
+        if not company_name and should_run("company"):
+            company_name = self._extract_company(text, should_run)
+        if not product_name and should_run("product"):
+            product_name = self._extract_product(text)
 
         # 5. 데이터 검증 및 보정 (Cross-Validation)
-        # 논리적 검증: 총중량 - 공차중량 = 실중량
-        if total_weight and empty_weight and net_weight:
-            calc_net = total_weight - empty_weight
-            if abs(calc_net - net_weight) > 50:
-                logger.warning(f"Weight mismatch: Total({total_weight}) - Empty({empty_weight}) = {calc_net} != Net({net_weight})")
-                net_weight = calc_net
-        
-        # 누락된 중량 데이터 역산 채우기
-        if total_weight and empty_weight and not net_weight:
-            net_weight = total_weight - empty_weight
-        if total_weight and net_weight and not empty_weight:
-            empty_weight = total_weight - net_weight
-        if empty_weight and net_weight and not total_weight:
-            total_weight = empty_weight + net_weight
+        if should_run("cross_validation"):
+            # 논리적 검증: 총중량 - 공차중량 = 실중량
+            if total_weight and empty_weight and net_weight:
+                calc_net = total_weight - empty_weight
+                if abs(calc_net - net_weight) > WEIGHT_TOLERANCE_KG:
+                    logger.warning(f"Weight mismatch: Total({total_weight}) - Empty({empty_weight}) = {calc_net} != Net({net_weight})")
+                    net_weight = calc_net
+
+            # 누락된 중량 데이터 역산 채우기
+            if total_weight and empty_weight and not net_weight:
+                net_weight = total_weight - empty_weight
+            if total_weight and net_weight and not empty_weight:
+                empty_weight = total_weight - net_weight
+            if empty_weight and net_weight and not total_weight:
+                total_weight = empty_weight + net_weight
+
+        # 6. 템플릿 학습: 처음 보는 양식이고 라벨로 추출한 중량의 정합성이 맞는 결과만 학습
+        if (
+            self.template_service is not None and page_words is not None
+            and template_id is None and not skipped_stages and weights_verified
+        ):
+            self.template_service.learn(page_words, {
+                "total_weight": total_weight, "empty_weight": empty_weight, "net_weight": net_weight,
+                "date": date, "in_time": in_time, "out_time": out_time,
+                "vehicle_number": vehicle_number, "company_name": company_name, "product_name": product_name,
+            })
+
+        if skipped_stages:
+            logger.warning(f"Parse deadline exceeded ({deadline.budget_ms}ms). Skipped stages: {skipped_stages}")
+            deadline_hits.inc()
+            for stage in skipped_stages:
+                skipped_stage_counter.inc(stage=stage)
 
         return WeighbridgeTicket(
             company_name=company_name,
@@ -81,10 +170,58 @@ class OCRParserService:
             empty_weight=empty_weight,
             net_weight=net_weight,
             confidence_score=ocr_input.confidence,
-            uncertain=False, 
+            uncertain=bool(skipped_stages),
+            skipped_stages=skipped_stages,
+            latitude=latitude,
+            longitude=longitude,
+            site_id=site_id,
             original_text=text
         )
 
+    def parse_batch(self, ocr_inputs: Iterable[OCRInput]) -> Iterator[WeighbridgeTicket]:
+        """
+        여러 OCR 결과를 순차적으로 파싱 (배치 처리용 제너레이터)
+        """
+        for ocr_input in ocr_inputs:
+            yield self.parse(ocr_input)
+
+    def _parse_template_fields(self, raw_fields: Dict[str, str]) -> Dict[str, Any]:
+        """
+        템플릿 영역에서 읽은 텍스트를 필드 값으로 변환 (변환 실패 필드는 제외하여 일반 경로로 추출)
+        """
+        fields: Dict[str, Any] = {}
+        for field in ("total_weight", "empty_weight", "net_weight"):
+            match = re.search(r"\d[\d,. ]*", raw_fields.get(field, ""))
+            value = self._parse_weight_string(match.group().strip()) if match else None
+            if value:
+                fields[field] = value
+
+        # 세 중량이 모두 읽혔는데 정합성이 맞지 않으면 양식이 바뀐 것으로 보고 중량은 일반 경로로 추출
+        weights = [fields.get(f) for f in ("total_weight", "empty_weight", "net_weight")]
+        if all(weights) and abs(weights[0] - weights[1] - weights[2]) > WEIGHT_TOLERANCE_KG:
+            logger.info("Template weights are inconsistent. Falling back to generic extraction.")
+            for field in ("total_weight", "empty_weight", "net_weight"):
+                fields.pop(field)
+
+        date = self._extract_date(raw_fields.get("date", ""))
+        if date:
+            fields["date"] = date
+        for field in ("in_time", "out_time"):
+            times = self._extract_times(raw_fields.get(field, ""))
+            if times:
+                fields[field] = times[0]
+
+        match = re.search(r"\d{2,3}\s*[가-힣]\s*\d{4}|\d{4}", raw_fields.get("vehicle_number", ""))
+        if match:
+            fields["vehicle_number"] = match.group().replace(" ", "")
+        company_name = raw_fields.get("company_name", "").strip()
+        if len(company_name) > 1:
+            fields["company_name"] = self._match_corporate_name(company_name) or company_name
+        product_name = raw_fields.get("product_name", "").strip()
+        if len(product_name) > 1:
+            fields["product_name"] = product_name
+        return fields
+
     def _normalize_number_text(self, text: str) -> str:
         """
         OCR 과정에서 흔히 발생하는 숫자 오인식 문자를 교정
@@ -207,7 +344,17 @@ class OCRParserService:
             
         return None
 
-    def _extract_company(self, text: str) -> Optional[str]:
+    def _extract_coordinates(self, text: str) -> Optional[Tuple[float, float]]:
+        """
+        "37.105317, 127.375673" 형태의 위도, 경도 좌표 추출 (소수점 4자리 이상, 범위 검증)
+        """
+        for lat_str, lon_str in re.findall(r"(-?\d{1,2}\.\d{4,})\s*,\s*(-?\d{1,3}\.\d{4,})", text):
+            latitude, longitude = float(lat_str), float(lon_str)
+            if -90 <= latitude <= 90 and -180 <= longitude <= 180:
+                return latitude, longitude
+        return None
+
+    def _extract_company(self, text: str, should_run: Optional[Callable[[str], bool]] = None) -> Optional[str]:
         # 1. Label Search
         kw_regex = r"(?:상호|회사명|공급자|거래처)" # 거래처 추가
         match = re.search(f"{kw_regex}.*?[:]\s*([^\n]+)", text)
@@ -216,14 +363,11 @@ class OCRParserService:
             if val and len(val) > 1: return val
 
         # 2. Regex Pattern Search
-        match = re.search(r"\(주\)[ ]*([가-힣a-zA-Z0-9]+)", text)
-        if match: return f"(주) {match.group(1)}"
+        corporate_name = self._match_corporate_name(text)
+        if corporate_name: return corporate_name
 
-        match = re.search(r"([가-힣a-zA-Z0-9]+)[ ]*\(주\)", text)
-        if match: return f"{match.group(1)} (주)"
-
-        # 3. spaCy NER Fallback
-        if self.nlp:
+        # 3. spaCy NER Fallback (가장 비싼 단계이므로 예산이 남은 경우에만 실행, 건너뛰면 company_ner 단계로 기록)
+        if self.nlp and (should_run is None or should_run("company_ner")):
             doc = self.nlp(text)
             org_candidates = []
             for ent in doc.ents:
@@ -234,6 +378,14 @@ class OCRParserService:
                 return org_candidates[0]
         return None
 
+    def _match_corporate_name(self, text: str) -> Optional[str]:
+        match = re.search(r"\(주\)[ ]*([가-힣a-zA-Z0-9]+)", text)
+        if match: return f"(주) {match.group(1)}"
+
+        match = re.search(r"([가-힣a-zA-Z0-9]+)[ ]*\(주\)", text)
+        if match: return f"{match.group(1)} (주)"
+        return None
+
     def _extract_product(self, text: str) -> Optional[str]:
         kw_regex = r"(?:품명|제품명)"
         match = re.search(f"{kw_regex}.*?[:]\s*([^\n]+)", text)
@@ -0,0 +1,66 @@
+import json
+import math
+import os
+from typing import List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from app.core.geo import EARTH_RADIUS_M, KDTree, to_unit_vectors
+from app.models.ocr.models import WeighbridgeSite
+
+
+class SiteRegistry:
+    """
+    등록된 계량소의 공간 인덱스 (위경도 -> 3차원 단위 벡터 KD-Tree)
+
+    티켓 좌표에서 가장 가까운 계량소를 찾고, max_distance_m 이내일 때만 해당 계량소로 판정합니다.
+    """
+
+    def __init__(self, sites: Sequence[WeighbridgeSite], max_distance_m: float = 1000.0):
+        self.sites: List[WeighbridgeSite] = list(sites)
+        self.max_distance_m = max_distance_m
+        self._tree = KDTree(to_unit_vectors(
+            [site.latitude for site in self.sites],
+            [site.longitude for site in self.sites],
+        ).reshape(-1, 3))
+
+    @classmethod
+    def from_file(cls, path: str, max_distance_m: float = 1000.0) -> "SiteRegistry":
+        """
+        JSON 파일({"sites": [...]})에서 계량소 목록을 읽습니다. 파일이 없으면 빈 레지스트리를 반환합니다.
+        """
+        if not os.path.exists(path):
+            logger.warning(f"Site registry not found: {path}. Site resolution disabled.")
+            return cls([], max_distance_m=max_distance_m)
+
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        sites = [WeighbridgeSite(**item) for item in data.get("sites", [])]
+        logger.info(f"Loaded {len(sites)} weighbridge sites from {path}")
+        return cls(sites, max_distance_m=max_distance_m)
+
+    def __len__(self) -> int:
+        return len(self.sites)
+
+    def nearest(self, latitude: float, longitude: float) -> Optional[Tuple[WeighbridgeSite, float]]:
+        """
+        가장 가까운 계량소와 대원 거리(m)를 반환합니다. (등록된 계량소가 없으면 None)
+        """
+        found = self._tree.nearest(to_unit_vectors(latitude, longitude))
+        if found is None:
+            return None
+        index, chord = found
+        # 단위 구면의 현 길이 -> 중심각 -> 대원 거리
+        distance_m = 2 * EARTH_RADIUS_M * math.asin(min(chord / 2, 1.0))
+        return self.sites[index], distance_m
+
+    def resolve(self, latitude: Optional[float], longitude: Optional[float]) -> Optional[str]:
+        """
+        좌표가 max_distance_m 이내인 가장 가까운 계량소 ID를 반환합니다.
+        """
+        if latitude is None or longitude is None:
+            return None
+        found = self.nearest(latitude, longitude)
+        if found is None or found[1] > self.max_distance_m:
+            return None
+        return found[0].site_id
@@ -0,0 +1,118 @@
+import asyncio
+from typing import AsyncIterator, Callable, Tuple, Union
+
+from loguru import logger
+from starlette.concurrency import run_in_threadpool
+
+from app.core.responses import CustomException, ErrorStatus
+from app.models.ocr.models import WeighbridgeTicket
+
+# (문서 순번, 파싱 결과 또는 문서 단위 에러)
+StreamResult = Tuple[int, Union[WeighbridgeTicket, CustomException]]
+
+
+class NDJSONStreamService:
+    """
+    NDJSON 스트림(한 줄 = OCR 문서 1건)을 읽으면서 파싱 결과를 완료 순서대로 반환
+
+    - 요청 본문 전체를 버퍼링하지 않고 줄 단위로 처리
+    - 동시 처리 문서 수(max_in_flight)를 넘으면 본문 읽기를 멈춤 (Backpressure)
+    - 결과는 완료 순서로 반환되므로 호출 측은 순번(seq)으로 원본 문서와 매칭
+
+    handler는 한 줄(문서)을 받아 파싱된 티켓을 반환하는 동기 함수이며 스레드풀에서 실행됩니다.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[bytes], WeighbridgeTicket],
+        max_in_flight: int = 8,
+        max_line_bytes: int = 10 * 1024 * 1024,
+    ):
+        self.handler = handler
+        self.max_in_flight = max_in_flight
+        self.max_line_bytes = max_line_bytes
+
+    async def process(self, chunks: AsyncIterator[bytes]) -> AsyncIterator[StreamResult]:
+        results: asyncio.Queue = asyncio.Queue()
+        slots = asyncio.Semaphore(self.max_in_flight)
+        done = object()
+
+        async def parse_line(seq: int, line: bytes):
+            queued = False
+            try:
+                try:
+                    result = await run_in_threadpool(self.handler, line)
+                except CustomException as e:
+                    result = e
+                except Exception as e:
+                    # 예상하지 못한 에러도 해당 순번의 에러 응답으로 전달 (결과 누락 방지)
+                    logger.exception(e)
+                    result = CustomException(ErrorStatus.INTERNAL_SERVER_ERROR)
+                await results.put((seq, result))
+                queued = True
+            finally:
+                # 결과를 넣지 못하고 종료(취소 등)되면 소비 측에서 슬롯을 반환할 수 없으므로 직접 반환
+                if not queued:
+                    slots.release()
+
+        async def read_lines():
+            tasks = set()
+            seq = 0
+            try:
+                async for line in self._iter_lines(chunks):
+                    # 슬롯은 결과가 소비될 때 반환 -> 처리 중 + 전송 대기 문서 수가 제한됨
+                    await slots.acquire()
+                    task = asyncio.create_task(parse_line(seq, line))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                    seq += 1
+            except CustomException as e:
+                await results.put((seq, e))
+            finally:
+                if tasks:
+                    await asyncio.gather(*tasks, return_exceptions=True)
+                await results.put(done)
+
+        reader = asyncio.create_task(read_lines())
+        try:
+            while True:
+                item = await results.get()
+                if item is done:
+                    break
+                slots.release()
+                yield item
+            # 본문 읽기 중 발생한 예외(클라이언트 연결 종료 등) 전파
+            await reader
+        finally:
+            if not reader.done():
+                logger.info("NDJSON stream closed before completion, cancelling reader")
+                reader.cancel()
+
+    async def _iter_lines(self, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        # 새로 들어온 청크에서만 줄바꿈을 탐색 (긴 줄이 여러 청크로 나뉘어도 선형 시간)
+        pending = []
+        pending_size = 0
+        async for chunk in chunks:
+            start = 0
+            while (end := chunk.find(b"\n", start)) != -1:
+                line = b"".join(pending) + chunk[start:end]
+                pending.clear()
+                pending_size = 0
+                start = end + 1
+                # 한 청크 안에서 끝나는 줄과 여러 청크에 걸친 줄의 마지막 조각도 합친 길이로 검사
+                if len(line) > self.max_line_bytes:
+                    raise CustomException(ErrorStatus.STREAM_LINE_TOO_LONG)
+                if line.strip():
+                    yield line
+
+            if start < len(chunk):
+                pending.append(chunk[start:])
+                pending_size += len(chunk) - start
+                if pending_size > self.max_line_bytes:
+                    raise CustomException(ErrorStatus.STREAM_LINE_TOO_LONG)
+
+        line = b"".join(pending)
+        if len(line) > self.max_line_bytes:
+            raise CustomException(ErrorStatus.STREAM_LINE_TOO_LONG)
+        if line.strip():
+            yield line
@@ -0,0 +1,250 @@
+import hashlib
+import json
+import os
+import re
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+from loguru import logger
+
+from app.core.metrics import metrics
+from app.models.ocr.word_store import OCRWordStore
+
+# 템플릿으로 학습하는 필드 (WeighbridgeTicket 필드명과 동일)
+TEMPLATE_FIELDS = (
+    "total_weight", "empty_weight", "net_weight",
+    "date", "in_time", "out_time",
+    "vehicle_number", "company_name", "product_name",
+)
+
+# 값 하나가 OCR 단어 여러 개로 나뉜 경우 최대 몇 개까지 이어붙여 찾을지
+MAX_VALUE_WORDS = 4
+
+_NORMALIZE_PATTERN = re.compile(r"[\W_]+")
+_DIGIT_PATTERN = re.compile(r"\d")
+
+template_lookups = metrics.counter("ocr_template_lookups_total", "레이아웃 템플릿 조회 수", ("result",))
+template_learned = metrics.counter("ocr_template_learned_total", "새로 학습한 레이아웃 템플릿 수")
+
+# 필드명 -> 정규화 좌표 영역 [x_min, y_min, x_max, y_max]
+FieldRegions = Dict[str, List[float]]
+
+
+def _normalize(text: str) -> str:
+    return _NORMALIZE_PATTERN.sub("", text.lower())
+
+
+class LayoutTemplate:
+    __slots__ = ("template_id", "tokens", "regions")
+
+    def __init__(self, template_id: str, tokens: Set[str], regions: FieldRegions):
+        self.template_id = template_id
+        self.tokens = tokens
+        self.regions = regions
+
+
+class _PageLayout:
+    """
+    페이지 단어들의 정규화 좌표 (단어 경계 상자 전체를 [0, 1] 프레임으로 변환)
+    촬영 위치/배율이 달라도 같은 양식이면 같은 좌표가 되도록 평행이동/배율을 제거합니다.
+    """
+    __slots__ = ("words", "normalized", "boxes")
+
+    def __init__(self, store: OCRWordStore):
+        mask = store.has_box()
+        words = store.words
+        self.words = [words[i] for i in np.flatnonzero(mask)]
+        self.normalized = [_normalize(text) for text in self.words]
+        boxes = store.bounds()[mask].astype(np.float64)
+        if len(boxes):
+            origin = boxes[:, :2].min(axis=0)
+            size = np.maximum(boxes[:, 2:].max(axis=0) - origin, 1.0)
+            boxes = (boxes - np.tile(origin, 2)) / np.tile(size, 2)
+        self.boxes = boxes
+
+
+class LayoutTemplateService:
+    """
+    레이아웃 지문 기반 계근지 템플릿 캐시
+
+    - 지문: 숫자가 없는 단어(라벨 등 양식 고정 텍스트)의 (정규화 텍스트, 격자 좌표) 집합
+    - 학습: 일반 파싱 결과 값이 실제로 찍힌 단어 영역을 찾아 필드 -> 영역 매핑으로 저장
+    - 조회: 지문이 같거나 Jaccard 유사도가 match_threshold 이상인 템플릿의 영역에서 단어를 바로 읽음
+    - 템플릿은 store_path JSON 파일에 저장되어 재시작 후에도 유지
+    """
+
+    def __init__(
+        self,
+        store_path: Optional[str] = None,
+        grid_size: int = 12,
+        match_threshold: float = 0.6,
+        region_margin: float = 0.02,
+        min_fields: int = 3,
+        max_templates: int = 500,
+    ):
+        self.store_path = store_path
+        self.grid_size = grid_size
+        self.match_threshold = match_threshold
+        self.region_margin = region_margin
+        self.min_fields = min_fields
+        self.max_templates = max_templates
+
+        self._lock = threading.Lock()
+        self._templates: Dict[str, LayoutTemplate] = {}
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._templates)
+
+    def match(self, store: OCRWordStore) -> Optional[Tuple[str, Dict[str, str]]]:
+        """
+        일치하는 템플릿이 있으면 (템플릿 ID, 필드별 영역 내 텍스트)를 반환합니다.
+        """
+        layout = _PageLayout(store)
+        tokens = self._tokens(layout)
+        template = self._find(tokens) if tokens else None
+        if template is None:
+            template_lookups.inc(result="miss")
+            return None
+
+        template_lookups.inc(result="hit")
+        return template.template_id, self._read_regions(layout, template.regions)
+
+    def learn(self, store: OCRWordStore, values: Dict[str, object]) -> Optional[str]:
+        """
+        파싱된 필드 값이 찍힌 단어 영역을 찾아 템플릿으로 저장합니다. (저장된 템플릿 ID 반환)
+        """
+        layout = _PageLayout(store)
+        tokens = self._tokens(layout)
+        if not tokens:
+            return None
+
+        regions = {}
+        for field in TEMPLATE_FIELDS:
+            value = values.get(field)
+            if value is None:
+                continue
+            region = self._locate(layout, _normalize(str(value)))
+            if region is not None:
+                regions[field] = region
+
+        if len(regions) < self.min_fields:
+            return None
+
+        template_id = self._template_id(tokens)
+        with self._lock:
+            if template_id in self._templates or len(self._templates) >= self.max_templates:
+                return None
+            self._templates[template_id] = LayoutTemplate(template_id, tokens, regions)
+            self._save()
+
+        template_learned.inc()
+        logger.info(f"Learned layout template {template_id}: fields={sorted(regions)}")
+        return template_id
+
+    def _tokens(self, layout: _PageLayout) -> Set[str]:
+        if not len(layout.boxes):
+            return set()
+        centers = (layout.boxes[:, :2] + layout.boxes[:, 2:]) / 2
+        cells = np.minimum((centers * self.grid_size).astype(np.int64), self.grid_size - 1).tolist()
+        return {
+            f"{text}@{cx},{cy}"
+            for text, (cx, cy) in zip(layout.normalized, cells)
+            if text and not _DIGIT_PATTERN.search(text)
+        }
+
+    def _find(self, tokens: Set[str]) -> Optional[LayoutTemplate]:
+        template = self._templates.get(self._template_id(tokens))
+        if template is not None:
+            return template
+
+        best, best_score = None, self.match_threshold
+        for candidate in list(self._templates.values()):
+            score = len(tokens & candidate.tokens) / len(tokens | candidate.tokens)
+            if score >= best_score:
+                best, best_score = candidate, score
+        return best
+
+    def _locate(self, layout: _PageLayout, value: str) -> Optional[List[float]]:
+        # 읽기 순서상 처음으로 값과 일치하는 연속 단어들의 영역 (일반 파싱의 첫 매칭 규칙과 동일)
+        if not value:
+            return None
+        normalized = layout.normalized
+        for start in range(len(normalized)):
+            joined = ""
+            for end in range(start, min(start + MAX_VALUE_WORDS, len(normalized))):
+                joined += normalized[end]
+                if joined == value:
+                    boxes = layout.boxes[start:end + 1]
+                    return [
+                        float(boxes[:, 0].min()), float(boxes[:, 1].min()),
+                        float(boxes[:, 2].max()), float(boxes[:, 3].max()),
+                    ]
+                if not value.startswith(joined):
+                    break
+        return None
+
+    def _read_regions(self, layout: _PageLayout, regions: FieldRegions) -> Dict[str, str]:
+        # 필드 영역별로 세로 중심이 영역 안에 있고 가로로 겹치는 단어를 좌->우 순서로 이어붙임
+        if not len(layout.boxes) or not regions:
+            return {}
+        names = list(regions)
+        bounds = np.array([regions[name] for name in names]) + np.array([-1, -1, 1, 1]) * self.region_margin
+        boxes = layout.boxes
+        cy = (boxes[:, 1] + boxes[:, 3]) / 2
+        hits = (
+            (cy >= bounds[:, 1:2]) & (cy <= bounds[:, 3:4])
+            & (boxes[:, 2] >= bounds[:, 0:1]) & (boxes[:, 0] <= bounds[:, 2:3])
+        )
+        order = np.argsort(boxes[:, 0], kind="stable")
+        ordered_words = [layout.words[i] for i in order.tolist()]
+        fields = {}
+        for name, hit in zip(names, hits[:, order].tolist()):
+            text = " ".join(word for word, selected in zip(ordered_words, hit) if selected)
+            if text:
+                fields[name] = text
+        return fields
+
+    @staticmethod
+    def _template_id(tokens: Set[str]) -> str:
+        return hashlib.sha1("\n".join(sorted(tokens)).encode()).hexdigest()[:16]
+
+    def _load(self):
+        self._templates.update(self._read_store())
+        if self._templates:
+            logger.info(f"Loaded {len(self._templates)} layout templates from {self.store_path}")
+
+    def _read_store(self) -> Dict[str, LayoutTemplate]:
+        if not self.store_path or not os.path.exists(self.store_path):
+            return {}
+        try:
+            with open(self.store_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load layout templates from {self.store_path}: {e}")
+            return {}
+        return {
+            template_id: LayoutTemplate(template_id, set(item["tokens"]), item["regions"])
+            for template_id, item in data.get("templates", {}).items()
+        }
+
+    def _save(self):
+        # 다른 워커 프로세스가 학습한 템플릿을 병합한 뒤 임시 파일에 기록 후 교체 (쓰기 도중 종료되어도 기존 파일 유지)
+        if not self.store_path:
+            return
+        for template_id, template in self._read_store().items():
+            self._templates.setdefault(template_id, template)
+        directory = os.path.dirname(self.store_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = {
+            "templates": {
+                template.template_id: {"tokens": sorted(template.tokens), "regions": template.regions}
+                for template in self._templates.values()
+            }
+        }
+        tmp_path = f"{self.store_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.store_path)
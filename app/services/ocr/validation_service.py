@@ -0,0 +1,143 @@
+from typing import List, Optional, Sequence
+
+import numpy as np
+from loguru import logger
+
+from app.models.ocr.models import WeighbridgeTicket
+
+# 총중량 - 공차중량 = 실중량 검증 시 허용 오차 (kg)
+WEIGHT_TOLERANCE_KG = 50
+
+# 검증 결과 플래그 (비트마스크)
+FLAG_WEIGHT_MISMATCH = 1 << 0
+FLAG_TARE_DEVIATION = 1 << 1
+FLAG_TIME_ORDER = 1 << 2
+
+SECONDS_PER_DAY = 24 * 3600
+
+
+class BatchValidationService:
+    """
+    계근지 배치를 NumPy 배열로 적재하여 벡터 연산으로 교차 검증
+
+    - 중량 정합성: |총중량 - 공차중량 - 실중량| > 허용 오차, 또는 실중량 < 0
+    - 차량별 공차 편차: 같은 차량의 공차중량 중앙값 대비 편차가 큰 경우
+    - 시간 순서: 체류 시간이 비정상적으로 짧은/긴 경우 (출고시간이 입고시간보다 빠르면 자정을 넘긴 것으로 보고 24시간을 더함)
+    """
+
+    def __init__(
+        self,
+        weight_tolerance: int = WEIGHT_TOLERANCE_KG,
+        tare_tolerance_ratio: float = 0.1,
+        tare_tolerance_kg: int = 200,
+        min_vehicle_trips: int = 3,
+        min_turnaround_sec: int = 60,
+        max_turnaround_sec: int = 12 * 3600,
+    ):
+        self.weight_tolerance = weight_tolerance
+        self.tare_tolerance_ratio = tare_tolerance_ratio
+        self.tare_tolerance_kg = tare_tolerance_kg
+        self.min_vehicle_trips = min_vehicle_trips
+        self.min_turnaround_sec = min_turnaround_sec
+        self.max_turnaround_sec = max_turnaround_sec
+
+    def check(self, tickets: Sequence[WeighbridgeTicket]) -> np.ndarray:
+        """
+        티켓별 검증 플래그(비트마스크) 배열을 반환합니다. (0 = 정상)
+        """
+        flags = np.zeros(len(tickets), dtype=np.uint8)
+        if not tickets:
+            return flags
+
+        total = self._to_weight_array([t.total_weight for t in tickets])
+        empty = self._to_weight_array([t.empty_weight for t in tickets])
+        net = self._to_weight_array([t.net_weight for t in tickets])
+
+        flags[self._check_weights(total, empty, net)] |= FLAG_WEIGHT_MISMATCH
+        flags[self._check_tare([t.vehicle_number for t in tickets], empty)] |= FLAG_TARE_DEVIATION
+        flags[self._check_times([t.in_time for t in tickets], [t.out_time for t in tickets])] |= FLAG_TIME_ORDER
+        return flags
+
+    def validate(self, tickets: Sequence[WeighbridgeTicket]) -> List[WeighbridgeTicket]:
+        """
+        이상치로 판정된 티켓을 uncertain=True로 표시한 목록을 반환합니다.
+        """
+        flags = self.check(tickets)
+        outliers = np.flatnonzero(flags)
+        if len(outliers):
+            logger.warning(
+                f"Batch validation: {len(outliers)}/{len(tickets)} outliers "
+                f"(weight={np.count_nonzero(flags & FLAG_WEIGHT_MISMATCH)}, "
+                f"tare={np.count_nonzero(flags & FLAG_TARE_DEVIATION)}, "
+                f"time={np.count_nonzero(flags & FLAG_TIME_ORDER)})"
+            )
+
+        result = list(tickets)
+        for i in outliers:
+            result[i] = result[i].model_copy(update={"uncertain": True})
+        return result
+
+    def _to_weight_array(self, values: List[Optional[int]]) -> np.ndarray:
+        # 누락값은 NaN으로 표현하여 비교 연산에서 자동으로 제외
+        return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+    def _check_weights(self, total: np.ndarray, empty: np.ndarray, net: np.ndarray) -> np.ndarray:
+        with np.errstate(invalid="ignore"):
+            mismatch = np.abs(total - empty - net) > self.weight_tolerance
+            negative = (total - empty) < 0
+        return mismatch | negative
+
+    def _check_tare(self, vehicles: List[Optional[str]], empty: np.ndarray) -> np.ndarray:
+        """
+        차량번호별 공차중량 중앙값을 그룹 연산으로 계산하여 편차가 큰 티켓을 찾습니다.
+        """
+        vehicle_arr = np.array([v or "" for v in vehicles], dtype=object)
+        valid = (vehicle_arr != "") & ~np.isnan(empty)
+        outliers = np.zeros(len(empty), dtype=bool)
+        if not valid.any():
+            return outliers
+
+        idx = np.flatnonzero(valid)
+        _, groups = np.unique(vehicle_arr[idx], return_inverse=True)
+        values = empty[idx]
+
+        # 그룹 -> 값 순으로 정렬 후 그룹 시작 위치 기준 중앙값 계산
+        order = np.lexsort((values, groups))
+        sorted_values = values[order]
+        counts = np.bincount(groups)
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        medians = (sorted_values[starts + (counts - 1) // 2] + sorted_values[starts + counts // 2]) / 2
+
+        median = medians[groups]
+        tolerance = np.maximum(self.tare_tolerance_kg, median * self.tare_tolerance_ratio)
+        deviated = (np.abs(values - median) > tolerance) & (counts[groups] >= self.min_vehicle_trips)
+
+        outliers[idx] = deviated
+        return outliers
+
+    def _check_times(self, in_times: List[Optional[str]], out_times: List[Optional[str]]) -> np.ndarray:
+        in_sec, in_valid = self._to_seconds(in_times)
+        out_sec, out_valid = self._to_seconds(out_times)
+
+        # 23:50 입고 -> 00:10 출고처럼 자정을 넘긴 운행은 다음날 출고로 계산
+        turnaround = out_sec - in_sec
+        turnaround[turnaround < 0] += SECONDS_PER_DAY
+        invalid_order = (turnaround < self.min_turnaround_sec) | (turnaround > self.max_turnaround_sec)
+        return invalid_order & in_valid & out_valid
+
+    def _to_seconds(self, times: List[Optional[str]]):
+        """
+        'HH:MM:SS' 문자열 배열을 초 단위 정수 배열로 변환 (문자 코드 연산으로 일괄 처리)
+        """
+        # 한 글자 여유를 두어 8자를 넘는 문자열이 잘려서 유효한 시각으로 읽히지 않도록 함
+        arr = np.array([t or "" for t in times], dtype="<U9")
+        chars = arr.view(np.uint32).reshape(len(arr), 9).astype(np.int64)
+        digits = chars - ord("0")
+
+        colon = ord(":")
+        valid = (chars[:, 2] == colon) & (chars[:, 5] == colon) & (chars[:, 8] == 0)
+        digit_cols = digits[:, [0, 1, 3, 4, 6, 7]]
+        valid &= ((digit_cols >= 0) & (digit_cols <= 9)).all(axis=1)
+
+        seconds = (digits[:, 0] * 10 + digits[:, 1]) * 3600 + (digits[:, 3] * 10 + digits[:, 4]) * 60 + digits[:, 6] * 10 + digits[:, 7]
+        return seconds, valid
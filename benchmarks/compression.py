@@ -0,0 +1,123 @@
+"""
+업로드 / 응답 압축 벤치마크 (gzip 1/6/9, zstd 1/3/10의 압축률과 CPU 비용)
+
+- 업로드: data/sample_*.json (words 배열과 bounding box가 대부분인 실제 OCR 결과)
+- 응답: 티켓 목록 JSON 엔벨로프, CSV 내보내기 (합성 티켓 N건)
+- 링크 속도별 "전송 + 압축 + 해제" 총 시간을 비압축 전송과 비교
+
+실행 (프로젝트 루트에서):
+    python -m benchmarks.compression --tickets 1000 --links 1,10,100
+"""
+import argparse
+import glob
+import gzip
+import os
+import time
+import zlib
+
+import orjson
+import zstandard
+
+from app.api.v1.ocr.dtos import WeighbridgeResponse
+from app.core.compression import StreamCompressor
+from app.core.responses import ApiResponse, ApiJSONResponse
+from app.core.utils import list_of_dicts_to_csv
+
+CODECS = {
+    "gzip-1": (lambda data: zlib.compress(data, 1, 31), lambda data: zlib.decompress(data, 31)),
+    "gzip-6": (lambda data: zlib.compress(data, 6, 31), lambda data: zlib.decompress(data, 31)),
+    "gzip-9": (lambda data: zlib.compress(data, 9, 31), lambda data: zlib.decompress(data, 31)),
+    "zstd-1": (zstandard.ZstdCompressor(level=1).compress, zstandard.ZstdDecompressor().decompress),
+    "zstd-3": (zstandard.ZstdCompressor(level=3).compress, zstandard.ZstdDecompressor().decompress),
+    "zstd-10": (zstandard.ZstdCompressor(level=10).compress, zstandard.ZstdDecompressor().decompress),
+}
+
+
+def build_payloads(tickets: int) -> dict:
+    payloads = {}
+    samples = sorted(glob.glob(os.path.join(os.path.dirname(__file__), "../data/sample_*.json")))
+    for path in samples:
+        with open(path, "rb") as f:
+            payloads[f"upload {os.path.basename(path)}"] = f.read()
+
+    rows = [
+        WeighbridgeResponse(
+            ticket_id=i,
+            company_name=f"정우리사이클링 (주) {i % 37}",
+            vehicle_number=f"{1000 + i % 9000}",
+            date="2026-02-01",
+            in_time=f"{8 + i % 10:02d}:{i % 60:02d}:00",
+            out_time=f"{9 + i % 10:02d}:{(i * 7) % 60:02d}:35",
+            total_weight=14000 + (i * 37) % 9000,
+            empty_weight=13000 + (i * 11) % 900,
+            net_weight=1000 + (i * 26) % 8100,
+            confidence_score=0.9 + (i % 10) / 100,
+        )
+        for i in range(tickets)
+    ]
+    payloads[f"response tickets x{tickets}"] = ApiJSONResponse(ApiResponse.success_response(data=rows)).body
+    payloads[f"export csv x{tickets}"] = list_of_dicts_to_csv([row.model_dump() for row in rows]).encode("utf-8")
+    return payloads
+
+
+def measure(fn, data: bytes, min_time: float = 0.2) -> float:
+    """
+    fn(data) 1회 평균 시간 (초)
+    """
+    fn(data)
+    runs, started = 0, time.perf_counter()
+    while True:
+        fn(data)
+        runs += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            return elapsed / runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tickets", type=int, default=1000)
+    parser.add_argument("--links", default="1,10,100", help="비교할 링크 속도 목록 (Mbps)")
+    args = parser.parse_args()
+    links = [float(value) for value in args.links.split(",")]
+
+    link_columns = "".join(f"{f'@{link:g}Mbps':>11}" for link in links)
+    for name, data in build_payloads(args.tickets).items():
+        print(f"# {name}: {len(data):,} bytes")
+        print(f"{'codec':<9}{'bytes':>10}{'ratio':>8}{'comp ms':>9}{'dec ms':>8}{'comp MB/s':>11}{link_columns}")
+        # 비압축 전송 시간 (ms)
+        raw_ms = [len(data) * 8 / (link * 1e6) * 1e3 for link in links]
+        print(f"{'none':<9}{len(data):>10,}{1.0:>8.2f}{0:>9.2f}{0:>8.2f}{'-':>11}"
+              + "".join(f"{ms:>9.1f}ms" for ms in raw_ms))
+
+        for codec, (compress, decompress) in CODECS.items():
+            compressed = compress(data)
+            comp_s = measure(compress, data)
+            dec_s = measure(decompress, compressed)
+            totals = [
+                (len(compressed) * 8 / (link * 1e6) + comp_s + dec_s) * 1e3
+                for link in links
+            ]
+            print(
+                f"{codec:<9}{len(compressed):>10,}{len(data) / len(compressed):>8.2f}"
+                f"{comp_s * 1e3:>9.2f}{dec_s * 1e3:>8.2f}{len(data) / comp_s / 1e6:>11.1f}"
+                + "".join(f"{ms:>9.1f}ms" for ms in totals)
+            )
+        print()
+
+    # 스트리밍 응답(청크별 flush)의 압축률 손실: NDJSON 한 줄씩 flush 하는 경우
+    lines = [orjson.dumps({"seq": i, "data": {"ticket_id": i, "net_weight": 1000 + i}}) + b"\n" for i in range(1000)]
+    whole = b"".join(lines)
+    print("# NDJSON stream 1000 lines: flush per line vs whole body")
+    whole_sizes = {
+        "gzip": len(gzip.compress(whole, 6)),
+        "zstd": len(zstandard.ZstdCompressor(level=3).compress(whole)),
+    }
+    for encoding, whole_size in whole_sizes.items():
+        compressor = StreamCompressor(encoding)
+        streamed = sum(len(compressor.compress(line)) for line in lines) + len(compressor.finish())
+        print(f"{encoding:<5} raw={len(whole):,} whole={whole_size:,} per-line flush={streamed:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,459 @@
+"""
+엔드투엔드 부하 테스트 (/upload-ocr, /export/csv, /export/json)
+
+- 대상: 기본은 in-process (httpx ASGITransport, 앱과 같은 이벤트 루프), --url 지정 시 실행 중인 서버
+- 부하 모델
+  - closed loop (--concurrency): 동시 사용자 C명이 응답을 받는 즉시 다음 요청 전송
+  - open loop (--rate): 초당 R건 포아송 도착. 지연시간은 예정 도착 시각부터 측정하므로
+    서버가 밀려도 요청 간격이 늘어나지 않음 (coordinated omission 방지)
+  - 쉼표로 여러 단계를 주면 단계별로 실행하여 포화 지점을 찾음
+- 페이로드: data/sample_*.json 원본(real)과 차량번호/중량만 바꾼 변형(synthetic)
+- 결과: 처리량, p50/p95/p99/max, 지연시간 히스토그램, 에러율을 출력하고 --output JSON으로 저장,
+  --compare로 두 결과 파일(릴리스 간)을 비교
+
+in-process 모드는 측정 대상 외 요소를 줄이기 위해 요청 속도 제한과 중복 탐지를 끄고
+(RATE_LIMIT_ENABLED=false, DEDUP_MODE=off) 임시 DB를 사용합니다. 환경 변수로 재정의할 수 있습니다.
+
+실행 (프로젝트 루트에서):
+    python -m benchmarks.load_test --concurrency 1,4,16 --duration 10
+    python -m benchmarks.load_test --rate 50,100,200 --duration 10 --mix upload-ocr:3,export/csv:1
+    python -m benchmarks.load_test --url http://127.0.0.1:8000 --concurrency 32 --output results/v1.json
+    python -m benchmarks.load_test --compare results/v1.json results/v2.json
+"""
+import argparse
+import asyncio
+import copy
+import glob
+import gzip
+import json
+import math
+import os
+import platform
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+import zstandard
+
+SAMPLE_PATHS = sorted(glob.glob(os.path.join(os.path.dirname(__file__), "../data/sample_*.json")))
+
+ENDPOINTS = {
+    "upload-ocr": "/api/v1/ocr/upload-ocr",
+    "export/csv": "/api/v1/ocr/export/csv",
+    "export/json": "/api/v1/ocr/export/json",
+}
+
+# 히스토그램 구간 상한 (ms)
+HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, math.inf)
+
+UPLOAD_ENCODINGS = {
+    "none": (".json", lambda data: data),
+    "gzip": (".json.gz", gzip.compress),
+    "zstd": (".json.zst", zstandard.ZstdCompressor().compress),
+}
+
+# 엔드포인트명, 지연시간(초), 에러 키(성공 시 None)
+Sample = Tuple[str, float, Optional[str]]
+
+
+# --- 페이로드 ---
+
+def _replace_values(node, pattern: re.Pattern, replacements: Dict[str, str]):
+    if isinstance(node, dict):
+        return {key: _replace_values(value, pattern, replacements) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_replace_values(value, pattern, replacements) for value in node]
+    if isinstance(node, str):
+        return pattern.sub(lambda match: replacements[match.group(0)], node)
+    return node
+
+
+def synthesize(document: dict, values: dict, rng: random.Random) -> dict:
+    """
+    원본 OCR 문서의 차량번호와 중량을 일관되게 바꾼 변형 문서를 만듭니다. (본문 / 페이지 / 단어 텍스트 모두)
+    중량은 총중량 - 공차중량 = 실중량을 유지하므로 교차 검증도 원본과 같은 경로를 탑니다.
+    """
+    replacements = {}
+    if values.get("vehicle_number"):
+        replacements[values["vehicle_number"]] = f"{rng.randint(1000, 9999)}"
+
+    total, empty = values.get("total_weight"), values.get("empty_weight")
+    if total and empty:
+        new_empty = rng.randint(5_000, 20_000)
+        new_total = new_empty + rng.randint(100, 30_000)
+        for old, new in ((total, new_total), (empty, new_empty), (total - empty, new_total - new_empty)):
+            replacements.setdefault(f"{old:,}", f"{new:,}")
+            replacements.setdefault(str(old), str(new))
+
+    if not replacements:
+        return copy.deepcopy(document)
+    alternatives = "|".join(re.escape(old) for old in sorted(replacements, key=len, reverse=True))
+    pattern = re.compile(rf"(?<![\d,]){alternatives}(?![\d,])")
+    return _replace_values(document, pattern, replacements)
+
+
+async def build_payloads(client: httpx.AsyncClient, kind: str, variants: int, seed: int) -> List[bytes]:
+    """
+    실제 샘플과 합성 변형 페이로드 목록 (합성 기준값은 대상 서버의 /export/json 파싱 결과)
+    """
+    originals = []
+    for path in SAMPLE_PATHS:
+        with open(path, "rb") as f:
+            originals.append(f.read())
+
+    payloads = [] if kind == "synthetic" else list(originals)
+    if kind == "real":
+        return payloads
+
+    rng = random.Random(seed)
+    for content in originals:
+        response = await client.post(
+            ENDPOINTS["export/json"], files={"file": ("sample.json", content, "application/json")}
+        )
+        response.raise_for_status()
+        values = response.json()
+        document = json.loads(content)
+        payloads.extend(
+            json.dumps(synthesize(document, values, rng), ensure_ascii=False).encode("utf-8")
+            for _ in range(variants)
+        )
+    return payloads
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    weights = {}
+    for item in mix.split(","):
+        name, _, weight = item.strip().partition(":")
+        if name not in ENDPOINTS:
+            raise SystemExit(f"Unknown endpoint in --mix: {name} (choose from {', '.join(ENDPOINTS)})")
+        weights[name] = float(weight or 1)
+    return weights
+
+
+# --- 대상 클라이언트 ---
+
+def create_client(url: Optional[str], timeout: float, connections: int, accept_encoding: Optional[str]) -> httpx.AsyncClient:
+    headers = {"Accept-Encoding": accept_encoding} if accept_encoding else None
+    if url:
+        limits = httpx.Limits(max_connections=connections, max_keepalive_connections=connections)
+        return httpx.AsyncClient(base_url=url, timeout=timeout, limits=limits, headers=headers)
+
+    # 앱 import 전에 설정해야 settings에 반영됨 (요청마다 남는 INFO / WARNING 로그도 측정에서 제외)
+    workdir = tempfile.mkdtemp(prefix="load_test_")
+    os.environ.setdefault("TICKET_DB_PATH", os.path.join(workdir, "tickets.db"))
+    os.environ.setdefault("TEMPLATE_STORE_PATH", os.path.join(workdir, "templates.json"))
+    os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+    os.environ.setdefault("DEDUP_MODE", "off")
+    from loguru import logger
+    from app.main import app
+
+    logger.remove()
+    logger.add(sys.stderr, level="ERROR")
+    transport = httpx.ASGITransport(app=app)
+    return httpx.AsyncClient(transport=transport, base_url="http://load-test", timeout=timeout, headers=headers)
+
+
+class Workload:
+    """
+    요청 1건 = 가중치로 고른 엔드포인트 + 임의 페이로드
+    """
+
+    def __init__(self, client: httpx.AsyncClient, payloads: List[bytes], mix: Dict[str, float], encoding: str, seed: int):
+        self.client = client
+        self.names = list(mix)
+        self.weights = list(mix.values())
+        suffix, compress = UPLOAD_ENCODINGS[encoding]
+        self.filename = f"ticket{suffix}"
+        self.payloads = [compress(payload) for payload in payloads]
+        self.rng = random.Random(seed)
+
+    async def send(self, scheduled: Optional[float] = None) -> Sample:
+        name = self.rng.choices(self.names, self.weights)[0]
+        payload = self.payloads[self.rng.randrange(len(self.payloads))]
+        started = time.perf_counter() if scheduled is None else scheduled
+        error = None
+        try:
+            response = await self.client.post(
+                ENDPOINTS[name], files={"file": (self.filename, payload, "application/octet-stream")}
+            )
+            await response.aread()
+            if response.status_code != 200:
+                error = f"HTTP {response.status_code}"
+        except httpx.HTTPError as e:
+            error = type(e).__name__
+        return name, time.perf_counter() - started, error
+
+
+# --- 부하 모델 ---
+
+async def run_closed(workload: Workload, concurrency: int, duration: float, requests: Optional[int]) -> Tuple[List[Sample], float]:
+    samples: List[Sample] = []
+    started = time.perf_counter()
+    deadline = started + duration
+    remaining = [requests]
+
+    def has_next() -> bool:
+        if requests is None:
+            return time.perf_counter() < deadline
+        remaining[0] -= 1
+        return remaining[0] >= 0
+
+    async def user():
+        while has_next():
+            samples.append(await workload.send())
+
+    await asyncio.gather(*(user() for _ in range(concurrency)))
+    return samples, time.perf_counter() - started
+
+
+async def run_open(workload: Workload, rate: float, duration: float, max_in_flight: int, seed: int) -> Tuple[List[Sample], float]:
+    samples: List[Sample] = []
+    tasks = set()
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    scheduled = started
+
+    async def fire(at: float):
+        samples.append(await workload.send(scheduled=at))
+
+    while True:
+        scheduled += rng.expovariate(rate)
+        if scheduled - started >= duration:
+            break
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if len(tasks) >= max_in_flight:
+            samples.append(("-", 0.0, "dropped"))
+            continue
+        task = asyncio.create_task(fire(scheduled))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    if tasks:
+        await asyncio.gather(*tasks)
+    return samples, time.perf_counter() - started
+
+
+# --- 집계 ---
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    # nearest-rank
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, max(0, math.ceil(q / 100 * len(sorted_values)) - 1))]
+
+
+def summarize(samples: List[Sample], elapsed: float) -> dict:
+    latencies = sorted(latency * 1000 for _, latency, error in samples if error is None)
+    errors = Counter(error for _, _, error in samples if error is not None)
+    histogram = Counter()
+    for value in latencies:
+        histogram[next(bound for bound in HISTOGRAM_BOUNDS_MS if value <= bound)] += 1
+    return {
+        "requests": len(samples),
+        "ok": len(latencies),
+        "throughput_rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        "error_rate": round(sum(errors.values()) / len(samples), 4) if samples else 0.0,
+        "errors": dict(errors),
+        "latency_ms": {
+            "mean": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+            **{f"p{q}": round(percentile(latencies, q), 2) for q in (50, 95, 99)},
+            "max": round(latencies[-1], 2) if latencies else 0.0,
+        },
+        "histogram_ms": {
+            ("inf" if bound == math.inf else f"{bound:g}"): histogram[bound] for bound in HISTOGRAM_BOUNDS_MS
+        },
+    }
+
+
+def summarize_run(mode: str, level: float, samples: List[Sample], elapsed: float) -> dict:
+    by_endpoint = defaultdict(list)
+    for sample in samples:
+        if sample[0] != "-":
+            by_endpoint[sample[0]].append(sample)
+    return {
+        "mode": mode,
+        "level": level,
+        "elapsed_s": round(elapsed, 3),
+        "all": summarize(samples, elapsed),
+        "endpoints": {name: summarize(items, elapsed) for name, items in sorted(by_endpoint.items())},
+    }
+
+
+def print_run(run: dict):
+    unit = "users" if run["mode"] == "closed" else "req/s offered"
+    print(f"\n## {run['mode']} loop: {run['level']:g} {unit} ({run['elapsed_s']:.1f}s)")
+    print(f"{'endpoint':<13}{'ok':>7}{'rps':>9}{'err%':>7}{'mean':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}")
+    for name, stats in [*run["endpoints"].items(), ("all", run["all"])]:
+        latency = stats["latency_ms"]
+        print(
+            f"{name:<13}{stats['ok']:>7}{stats['throughput_rps']:>9.1f}{stats['error_rate'] * 100:>7.2f}"
+            + "".join(f"{latency[key]:>9.2f}" for key in ("mean", "p50", "p95", "p99", "max"))
+        )
+    if run["all"]["errors"]:
+        print(f"errors: {run['all']['errors']}")
+
+    histogram = run["all"]["histogram_ms"]
+    peak = max(histogram.values()) or 1
+    previous = "0"
+    for bound, count in histogram.items():
+        if count:
+            print(f"  {previous:>5}~{bound:<5}ms {count:>7} {'#' * max(1, round(count / peak * 40))}")
+        previous = bound
+
+
+def print_saturation(runs: List[dict]):
+    """
+    단계별 결과에서 포화 지점 추정
+    - closed: 동시성을 늘려도 처리량 증가가 10% 미만인 첫 단계
+    - open: 처리량이 제공 부하의 95% 미만이거나 에러가 발생한 첫 단계
+    """
+    if len(runs) < 2:
+        return
+    for previous, run in zip(runs, runs[1:]):
+        stats = run["all"]
+        if run["mode"] == "closed":
+            saturated = stats["throughput_rps"] < previous["all"]["throughput_rps"] * 1.1
+        else:
+            saturated = stats["throughput_rps"] < run["level"] * 0.95 or stats["error_rate"] > 0
+        if saturated:
+            print(
+                f"\nSaturation near {run['mode']} level {run['level']:g}: "
+                f"{stats['throughput_rps']:.1f} req/s, p99 {stats['latency_ms']['p99']:.1f}ms "
+                f"(previous level {previous['level']:g}: {previous['all']['throughput_rps']:.1f} req/s)"
+            )
+            return
+    print("\nNo saturation within the tested levels")
+
+
+def compare(base_path: str, target_path: str):
+    with open(base_path, encoding="utf-8") as f:
+        base = json.load(f)
+    with open(target_path, encoding="utf-8") as f:
+        target = json.load(f)
+    print(f"base  : {base_path} ({base['meta'].get('git')}, {base['meta'].get('started_at')})")
+    print(f"target: {target_path} ({target['meta'].get('git')}, {target['meta'].get('started_at')})")
+
+    base_runs = {(run["mode"], run["level"]): run for run in base["runs"]}
+    keys = ("throughput_rps", "p50", "p95", "p99", "max", "error_rate")
+    print(f"\n{'run':<16}{'endpoint':<13}" + "".join(f"{key:>22}" for key in keys))
+    for run in target["runs"]:
+        old_run = base_runs.get((run["mode"], run["level"]))
+        if old_run is None:
+            continue
+        for name in [*run["endpoints"], "all"]:
+            new = run["endpoints"].get(name) if name != "all" else run["all"]
+            old = old_run["endpoints"].get(name) if name != "all" else old_run["all"]
+            if not new or not old:
+                continue
+            cells = []
+            for key in keys:
+                before = old[key] if key in old else old["latency_ms"][key]
+                after = new[key] if key in new else new["latency_ms"][key]
+                change = f"{(after - before) / before * 100:+.1f}%" if before else "-"
+                cells.append(f"{before:>8g} -> {after:<8g}{change:>5}")
+            print(f"{run['mode'] + ' ' + format(run['level'], 'g'):<16}{name:<13}" + "".join(f"{cell:>22}" for cell in cells))
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _levels(value: Optional[str]) -> List[float]:
+    return [float(item) for item in value.split(",")] if value else []
+
+
+async def run(args) -> dict:
+    concurrency_levels = _levels(args.concurrency)
+    rate_levels = _levels(args.rate)
+    connections = int(max(concurrency_levels + [args.max_in_flight]))
+    client = create_client(args.url, args.timeout, connections, args.accept_encoding)
+
+    results = {
+        "meta": {
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "git": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "target": args.url or "in-process",
+            "args": vars(args),
+        },
+        "runs": [],
+    }
+
+    async with client:
+        payloads = await build_payloads(client, args.payload, args.synthetic, args.seed)
+        workload = Workload(client, payloads, parse_mix(args.mix), args.upload_encoding, args.seed)
+        print(f"# target={results['meta']['target']} payloads={len(payloads)} mix={args.mix} upload={args.upload_encoding}")
+
+        for _ in range(args.warmup):
+            await workload.send()
+
+        for level in concurrency_levels:
+            samples, elapsed = await run_closed(workload, int(level), args.duration, args.requests)
+            results["runs"].append(summarize_run("closed", level, samples, elapsed))
+            print_run(results["runs"][-1])
+        if concurrency_levels:
+            print_saturation([item for item in results["runs"] if item["mode"] == "closed"])
+
+        for level in rate_levels:
+            samples, elapsed = await run_open(workload, level, args.duration, args.max_in_flight, args.seed)
+            results["runs"].append(summarize_run("open", level, samples, elapsed))
+            print_run(results["runs"][-1])
+        if rate_levels:
+            print_saturation([item for item in results["runs"] if item["mode"] == "open"])
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="대상 서버 (예: http://127.0.0.1:8000, 생략 시 in-process)")
+    parser.add_argument("--concurrency", help="closed loop 동시 사용자 수 (쉼표로 여러 단계)")
+    parser.add_argument("--rate", help="open loop 초당 도착 요청 수 (쉼표로 여러 단계)")
+    parser.add_argument("--duration", type=float, default=10.0, help="단계별 실행 시간 (초)")
+    parser.add_argument("--requests", type=int, help="closed loop 단계별 요청 수 (지정 시 --duration 대신 사용)")
+    parser.add_argument("--mix", default="upload-ocr:3,export/csv:1,export/json:1", help="엔드포인트:가중치 목록")
+    parser.add_argument("--payload", choices=["real", "synthetic", "mixed"], default="mixed")
+    parser.add_argument("--synthetic", type=int, default=50, help="샘플당 합성 변형 수")
+    parser.add_argument("--upload-encoding", choices=list(UPLOAD_ENCODINGS), default="none")
+    parser.add_argument("--accept-encoding", help="Accept-Encoding 헤더 (생략 시 httpx 기본값)")
+    parser.add_argument("--max-in-flight", type=int, default=256, help="open loop 최대 동시 요청 (초과 시 dropped)")
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "TARGET"), help="두 결과 파일 비교 후 종료")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+    if not args.concurrency and not args.rate:
+        args.concurrency = "1,4,16"
+
+    results = asyncio.run(run(args))
+    if args.output:
+        directory = os.path.dirname(args.output)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\nSaved results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
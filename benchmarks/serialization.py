@@ -0,0 +1,131 @@
+"""
+응답 직렬화 경로 벤치마크 (기존 JSONResponse + response_model 검증 vs ApiJSONResponse)
+
+실행 (프로젝트 루트에서):
+    python -m benchmarks.serialization --requests 5000
+"""
+import argparse
+import asyncio
+import time
+
+from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse
+
+from app.api.v1.ocr.dtos import WeighbridgeResponse
+from app.core.responses import ApiResponse, ApiJSONResponse
+
+SAMPLE = WeighbridgeResponse(
+    ticket_id=1,
+    company_name="정우리사이클링 (주)",
+    vehicle_number="5405",
+    date="2026-02-01",
+    in_time="11:33:00",
+    out_time="11:55:35",
+    total_weight=14080,
+    empty_weight=13950,
+    net_weight=130,
+    confidence_score=0.9108,
+)
+
+ERROR_DETAILS = {"details": [{"loc": ["query", "limit"], "msg": "Input should be greater than or equal to 1"}]}
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/legacy/success", response_model=ApiResponse[WeighbridgeResponse])
+    async def legacy_success():
+        return ApiResponse.success_response(data=SAMPLE)
+
+    @app.get("/fast/success", response_model=ApiResponse[WeighbridgeResponse])
+    async def fast_success():
+        return ApiJSONResponse(ApiResponse.success_response(data=SAMPLE))
+
+    @app.get("/legacy/error")
+    async def legacy_error():
+        return JSONResponse(
+            status_code=422,
+            content=ApiResponse.error_response(code="ERR_422", message="error", data=ERROR_DETAILS).model_dump(),
+        )
+
+    @app.get("/fast/error")
+    async def fast_error():
+        return ApiJSONResponse(
+            status_code=422,
+            content=ApiResponse.error_response(code="ERR_422", message="error", data=ERROR_DETAILS),
+        )
+
+    @app.get("/legacy/export")
+    async def legacy_export():
+        return Response(content=SAMPLE.model_dump_json(indent=2, exclude_none=True), media_type="application/json")
+
+    @app.get("/fast/export")
+    async def fast_export():
+        return ApiJSONResponse(SAMPLE.model_dump(exclude_none=True), indent=True)
+
+    return app
+
+
+def bench_asgi(app: FastAPI, path: str, requests: int) -> float:
+    """
+    TestClient의 스레드 전환 비용을 제외하기 위해 ASGI 앱을 이벤트 루프에서 직접 호출
+    """
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "",
+        "query_string": b"", "headers": [], "client": ("127.0.0.1", 1234), "server": ("127.0.0.1", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    async def run():
+        for _ in range(50):
+            await app(dict(scope), receive, send)
+        started = time.perf_counter()
+        for _ in range(requests):
+            await app(dict(scope), receive, send)
+        return (time.perf_counter() - started) / requests * 1e6
+
+    return asyncio.run(run())
+
+
+def bench_render(fn, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--iterations", type=int, default=50000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    envelope = ApiResponse.success_response(data=SAMPLE)
+    error = ApiResponse.error_response(code="ERR_422", message="error", data=ERROR_DETAILS)
+
+    print("# render only (us/op)")
+    print(f"success legacy : {bench_render(lambda: JSONResponse(envelope.model_dump()), args.iterations):8.2f}")
+    print(f"success fast   : {bench_render(lambda: ApiJSONResponse(envelope), args.iterations):8.2f}")
+    print(f"error   legacy : {bench_render(lambda: JSONResponse(error.model_dump()), args.iterations):8.2f}")
+    print(f"error   fast   : {bench_render(lambda: ApiJSONResponse(error), args.iterations):8.2f}")
+
+    print("# full ASGI request cycle (us/req)")
+    app = build_app()
+    for name in ("success", "error", "export"):
+        # 순서/워밍업 영향을 줄이기 위해 번갈아 실행 후 최소값 사용
+        rounds = [(bench_asgi(app, f"/legacy/{name}", args.requests), bench_asgi(app, f"/fast/{name}", args.requests)) for _ in range(args.rounds)]
+        legacy = min(r[0] for r in rounds)
+        fast = min(r[1] for r in rounds)
+        print(f"{name:<7} legacy : {legacy:8.1f}")
+        print(f"{name:<7} fast   : {fast:8.1f}  ({(1 - fast / legacy) * 100:.1f}% less time)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+단말 시나리오 지연시간 벤치마크 (/upload-ocr multipart 요청 vs WebSocket 세션)
+
+단말처럼 한 건씩 보내고 응답을 받은 뒤 다음 건을 보내는 순차 요청으로 측정합니다.
+로컬 uvicorn 서버를 백그라운드 스레드로 띄워 실제 네트워크 스택을 거칩니다.
+
+실행 (프로젝트 루트에서):
+    python -m benchmarks.websocket_latency --requests 500
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import tempfile
+import threading
+import time
+from typing import List
+
+import httpx
+import uvicorn
+from websockets.sync.client import connect
+
+SAMPLE_FILE_PATH = os.path.join(os.path.dirname(__file__), "../data/sample_03.json")
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(port: int) -> uvicorn.Server:
+    os.environ.setdefault("TICKET_DB_PATH", os.path.join(tempfile.mkdtemp(), "tickets.db"))
+    from app.main import app
+
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server
+
+
+def bench_http(base_url: str, content: bytes, requests: int) -> List[float]:
+    latencies = []
+    with httpx.Client(base_url=base_url) as client:
+        for i in range(requests):
+            started = time.perf_counter()
+            response = client.post("/api/v1/ocr/upload-ocr", files={"file": ("sample.json", content, "application/json")})
+            latencies.append(time.perf_counter() - started)
+            assert response.status_code == 200, response.text
+    return latencies
+
+
+def bench_websocket(ws_url: str, payload: dict, requests: int) -> List[float]:
+    latencies = []
+    with connect(ws_url) as ws:
+        for i in range(requests):
+            message = json.dumps({"id": i, "payload": payload})
+            started = time.perf_counter()
+            ws.send(message)
+            response = json.loads(ws.recv())
+            latencies.append(time.perf_counter() - started)
+            assert response["id"] == i and response["success"], response
+    return latencies
+
+
+def summarize(name: str, latencies: List[float]):
+    ms = sorted(value * 1000 for value in latencies)
+    quantiles = statistics.quantiles(ms, n=100)
+    print(
+        f"{name:<10} n={len(ms)} mean={statistics.mean(ms):.2f}ms p50={quantiles[49]:.2f}ms "
+        f"p95={quantiles[94]:.2f}ms p99={quantiles[98]:.2f}ms max={ms[-1]:.2f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=20)
+    args = parser.parse_args()
+
+    with open(SAMPLE_FILE_PATH, "rb") as f:
+        content = f.read()
+    payload = json.loads(content)
+
+    port = _free_port()
+    server = start_server(port)
+    base_url = f"http://127.0.0.1:{port}"
+    ws_url = f"ws://127.0.0.1:{port}/api/v1/ocr/ws"
+
+    bench_http(base_url, content, args.warmup)
+    bench_websocket(ws_url, payload, args.warmup)
+
+    summarize("upload-ocr", bench_http(base_url, content, args.requests))
+    summarize("websocket", bench_websocket(ws_url, payload, args.requests))
+
+    server.should_exit = True
+
+
+if __name__ == "__main__":
+    main()
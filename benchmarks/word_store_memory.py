@@ -0,0 +1,52 @@
+"""
+OCR 단어 표현별 메모리 사용량 비교 (OCRWord 모델 목록 vs OCRWordStore)
+
+실행 (프로젝트 루트에서):
+    python -m benchmarks.word_store_memory
+"""
+import glob
+import json
+import os
+import time
+import tracemalloc
+
+from app.api.v1.ocr.dtos import OCRPageDto
+from app.models import OCRWord, OCRWordStore
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "../data")
+
+
+def measure(build):
+    tracemalloc.start()
+    started = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - started
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current, elapsed
+
+
+def main():
+    # numpy 등 최초 호출 시의 1회성 할당이 측정에 포함되지 않도록 워밍업
+    OCRWordStore.from_words([{"text": "warmup", "boundingBox": {"vertices": [{"x": 0, "y": 0}]}}])
+
+    print(f"{'file':<16}{'words':>7}{'OCRWord list':>16}{'OCRWordStore':>16}{'saving':>9}{'convert':>12}")
+    for path in sorted(glob.glob(os.path.join(DATA_DIR, "sample_*.json"))):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        pages = [OCRPageDto(**page) for page in data.get("pages", [])]
+        words = [word for page in pages for word in page.words]
+
+        # 기존 도메인 표현: 단어마다 Pydantic 모델 + boundingBox dict 복사본
+        _, legacy_bytes, _ = measure(lambda: [OCRWord(**word.model_dump()) for word in words])
+        store, store_bytes, elapsed = measure(lambda: OCRWordStore.from_words(words))
+
+        print(
+            f"{os.path.basename(path):<16}{len(words):>7}{legacy_bytes / 1024:>14.1f}KB{store_bytes / 1024:>14.1f}KB"
+            f"{(1 - store_bytes / legacy_bytes) * 100:>8.1f}%{elapsed * 1000:>10.2f}ms"
+        )
+        assert len(store) == len(words)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+import os
+import tempfile
+
+# 테스트 실행 시 로컬 저장소 파일이 생성되지 않도록 임시 경로 사용 (app import 이전에 설정)
+_tmp_dir = tempfile.mkdtemp()
+os.environ.setdefault("TICKET_DB_PATH", os.path.join(_tmp_dir, "tickets.db"))
+os.environ.setdefault("TEMPLATE_STORE_PATH", os.path.join(_tmp_dir, "templates.json"))
@@ -0,0 +1,152 @@
+import asyncio
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.interceptors import AllocationTraceInterceptor
+from app.core.memory import AllocationTracer, allocation_tracer
+from app.core.responses import CustomException, ErrorStatus
+from app.main import app
+from app.services import NearDuplicateService
+
+ADMIN_HEADERS = {"X-Admin-Token": "secret"}
+
+
+@pytest.fixture
+def tracer():
+    tracer = AllocationTracer(max_snapshots=2)
+    tracer.start(frames=10)
+    yield tracer
+    tracer.stop()
+
+
+@pytest.fixture
+def admin_client(monkeypatch):
+    monkeypatch.setattr(settings, "admin_token", "secret")
+    allocation_tracer.start()
+    yield TestClient(app)
+    allocation_tracer.stop()
+
+
+def test_diff_attributes_growth_to_module(tracer):
+    service = NearDuplicateService()
+    base = tracer.take_snapshot("base")
+    # app.services.ocr 코드에서 할당되어 유지되는 객체는 해당 모듈 그룹의 증가로 집계되어야 함
+    retained = [service.fingerprint(f"계량증명서 차량번호 {i} 총중량 {i * 7} kg") for i in range(200)]
+    target = tracer.take_snapshot("target")
+
+    # module: numpy 내부 할당은 numpy로, caller: 이를 호출한 서비스 모듈로 집계
+    by_module = tracer.diff(base.snapshot_id, target.snapshot_id, group="module")
+    assert "numpy" in {stat.location for stat in by_module}
+    by_caller = tracer.diff(base.snapshot_id, target.snapshot_id, group="caller")
+    assert by_caller[0].location == "app.services.ocr"
+    assert by_caller[0].size_diff > 0
+
+    top = tracer.top(target.snapshot_id, group="lineno", limit=5)
+    assert len(top) == 5 and top[0].size >= top[-1].size
+    assert len(retained) == 200
+
+
+def test_snapshots_are_bounded(tracer):
+    ids = [tracer.take_snapshot().snapshot_id for _ in range(3)]
+    assert [info.snapshot_id for info in tracer.snapshots()] == ids[1:]
+    with pytest.raises(CustomException) as exc_info:
+        tracer.top(ids[0])
+    assert exc_info.value.error_status == ErrorStatus.SNAPSHOT_NOT_FOUND
+
+
+def test_request_peak_only_for_exclusive_requests(tracer):
+    token = tracer.request_started()
+    data = bytearray(1024 * 1024)
+    del data
+    tracer.request_finished("POST /upload", token)
+
+    first = tracer.request_started()
+    second = tracer.request_started()
+    tracer.request_finished("POST /upload", second)
+    tracer.request_finished("POST /upload", first)
+
+    [stat] = tracer.request_peaks()
+    assert stat.samples == 1 and stat.overlapped == 2
+    assert stat.max_peak >= 1024 * 1024
+
+
+def test_interceptor_records_route_template(tracer):
+    router = APIRouter()
+
+    @router.get("/items/{item_id}")
+    def item(item_id: int):
+        return {"size": len(bytearray(256 * 1024))}
+
+    test_app = FastAPI()
+    test_app.include_router(router, prefix="/api")
+    test_app.add_middleware(AllocationTraceInterceptor, tracer=tracer)
+    client = TestClient(test_app)
+    client.get("/api/items/1")
+    client.get("/api/items/2")
+
+    [stat] = tracer.request_peaks()
+    assert stat.route == "GET /api/items/{item_id}"
+    assert stat.samples == 2
+    assert stat.max_peak >= 256 * 1024
+
+
+def test_memory_endpoints_require_admin_token(monkeypatch):
+    client = TestClient(app)
+    monkeypatch.setattr(settings, "admin_token", None)
+    assert client.get("/api/v1/system/memory", headers=ADMIN_HEADERS).json()["status_code"] == "ADMIN_001"
+
+    monkeypatch.setattr(settings, "admin_token", "secret")
+    response = client.get("/api/v1/system/memory", headers={"X-Admin-Token": "wrong"})
+    assert response.status_code == 401
+    assert client.get("/api/v1/system/memory", headers=ADMIN_HEADERS).status_code == 200
+
+
+def test_memory_snapshot_endpoints(admin_client):
+    base = admin_client.post("/api/v1/system/memory/snapshots?label=before", headers=ADMIN_HEADERS).json()["data"]
+    assert base["label"] == "before"
+
+    status = admin_client.get("/api/v1/system/memory", headers=ADMIN_HEADERS).json()["data"]
+    assert status["tracing"] is True and status["traced_current"] > 0
+
+    top = admin_client.get(f"/api/v1/system/memory/snapshots/{base['snapshot_id']}/top?limit=5", headers=ADMIN_HEADERS)
+    assert top.status_code == 200 and len(top.json()["data"]) <= 5
+
+    diff = admin_client.get(f"/api/v1/system/memory/diff?base={base['snapshot_id']}", headers=ADMIN_HEADERS)
+    assert diff.status_code == 200
+    assert all("size_diff" in stat for stat in diff.json()["data"])
+
+    missing = admin_client.get("/api/v1/system/memory/snapshots/999999/top", headers=ADMIN_HEADERS)
+    assert missing.status_code == 404
+    assert missing.json()["status_code"] == "MEMORY_002"
+
+
+def test_memory_snapshot_endpoints_run_off_event_loop(admin_client, monkeypatch):
+    """스냅샷 생성 / 집계는 이벤트 루프가 아닌 스레드풀에서 실행"""
+    on_loop = []
+
+    def record(method):
+        def wrapper(*args, **kwargs):
+            try:
+                asyncio.get_running_loop()
+                on_loop.append(method.__name__)
+            except RuntimeError:
+                pass
+            return method(*args, **kwargs)
+        return wrapper
+
+    for name in ("take_snapshot", "top", "diff"):
+        monkeypatch.setattr(allocation_tracer, name, record(getattr(allocation_tracer, name)))
+
+    base = admin_client.post("/api/v1/system/memory/snapshots", headers=ADMIN_HEADERS).json()["data"]
+    assert admin_client.get(f"/api/v1/system/memory/snapshots/{base['snapshot_id']}/top", headers=ADMIN_HEADERS).status_code == 200
+    assert admin_client.get(f"/api/v1/system/memory/diff?base={base['snapshot_id']}", headers=ADMIN_HEADERS).status_code == 200
+    assert on_loop == []
+
+
+def test_snapshot_requires_tracing(monkeypatch):
+    monkeypatch.setattr(settings, "admin_token", "secret")
+    response = TestClient(app).post("/api/v1/system/memory/snapshots", headers=ADMIN_HEADERS)
+    assert response.status_code == 409
+    assert response.json()["status_code"] == "MEMORY_001"
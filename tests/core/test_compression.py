@@ -0,0 +1,127 @@
+import gzip
+import io
+import zlib
+
+import pytest
+import zstandard
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.compression import StreamCompressor, decompress_stream, negotiate_encoding, upload_encoding
+from app.core.interceptors import CompressionInterceptor
+from app.core.responses import CustomException, ErrorStatus
+
+PAYLOAD = b'{"words": [' + b",".join(b'{"text": "%d", "x": %d}' % (i, i) for i in range(2000)) + b"]}"
+
+
+def test_upload_encoding_by_extension():
+    assert upload_encoding("ticket.json") is None
+    assert upload_encoding("ticket.JSON.GZ") == "gzip"
+    assert upload_encoding("ticket.json.zst") == "zstd"
+    with pytest.raises(CustomException) as exc:
+        upload_encoding("ticket.gz")
+    assert exc.value.error_status is ErrorStatus.INVALID_FILE_EXTENSION
+
+
+@pytest.mark.parametrize("encoding, data", [
+    ("gzip", gzip.compress(PAYLOAD)),
+    ("zstd", zstandard.ZstdCompressor().compress(PAYLOAD)),
+])
+def test_decompress_stream_roundtrip(encoding, data):
+    assert decompress_stream(io.BytesIO(data), encoding, max_bytes=len(PAYLOAD)) == PAYLOAD
+
+
+@pytest.mark.parametrize("encoding, compress", [
+    ("gzip", gzip.compress),
+    ("zstd", zstandard.ZstdCompressor().compress),
+])
+def test_decompress_stream_rejects_bomb(encoding, compress):
+    bomb = compress(b"\0" * (4 * 1024 * 1024))
+    with pytest.raises(CustomException) as exc:
+        decompress_stream(io.BytesIO(bomb), encoding, max_bytes=1024 * 1024)
+    assert exc.value.error_status is ErrorStatus.DECOMPRESSED_TOO_LARGE
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "zstd"])
+def test_decompress_stream_rejects_corrupt(encoding):
+    with pytest.raises(CustomException) as exc:
+        decompress_stream(io.BytesIO(b"not compressed at all"), encoding, max_bytes=1024)
+    assert exc.value.error_status is ErrorStatus.INVALID_COMPRESSED_FILE
+
+
+def test_negotiate_encoding():
+    assert negotiate_encoding("gzip, deflate, br, zstd") == "zstd"
+    assert negotiate_encoding("gzip, zstd;q=0.5") == "gzip"
+    assert negotiate_encoding("zstd;q=0, gzip") == "gzip"
+    assert negotiate_encoding("*") == "zstd"
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding("") is None
+
+
+def test_stream_compressor_flushes_each_chunk():
+    compressor = StreamCompressor("gzip")
+    decompressor = zlib.decompressobj(31)
+    # 청크마다 flush 되므로 스트림 종료 전에도 지금까지의 데이터를 모두 해제할 수 있어야 함
+    assert decompressor.decompress(compressor.compress(b"line-1\n")) == b"line-1\n"
+    assert decompressor.decompress(compressor.compress(b"line-2\n")) == b"line-2\n"
+    decompressor.decompress(compressor.finish())
+    assert decompressor.eof
+
+
+def _make_client(**kwargs) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/large")
+    def large():
+        return Response(PAYLOAD, media_type="application/json")
+
+    @app.get("/small")
+    def small():
+        return PlainTextResponse("ok")
+
+    @app.get("/parquet")
+    def parquet():
+        return Response(PAYLOAD, media_type="application/vnd.apache.parquet")
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([PAYLOAD, PAYLOAD]), media_type="application/x-ndjson")
+
+    app.add_middleware(CompressionInterceptor, **kwargs)
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "zstd"])
+def test_interceptor_compresses_by_accept_encoding(encoding):
+    client = _make_client()
+    response = client.get("/large", headers={"Accept-Encoding": encoding})
+
+    assert response.headers["Content-Encoding"] == encoding
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert int(response.headers["Content-Length"]) < len(PAYLOAD) // 2
+    assert response.content == PAYLOAD
+
+
+def test_interceptor_streams_compressed_chunks():
+    response = _make_client().get("/stream", headers={"Accept-Encoding": "zstd"})
+
+    assert response.headers["Content-Encoding"] == "zstd"
+    assert "Content-Length" not in response.headers
+    assert response.content == PAYLOAD * 2
+
+
+@pytest.mark.parametrize("path, headers", [
+    ("/large", {"Accept-Encoding": "identity"}),
+    ("/small", {"Accept-Encoding": "gzip"}),
+    ("/parquet", {"Accept-Encoding": "gzip"}),
+])
+def test_interceptor_passes_through(path, headers):
+    response = _make_client().get(path, headers=headers)
+    assert "Content-Encoding" not in response.headers
+
+
+def test_interceptor_disabled():
+    response = _make_client(enabled=False).get("/large", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in response.headers
+    assert response.content == PAYLOAD
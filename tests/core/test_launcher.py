@@ -0,0 +1,51 @@
+import threading
+
+from app.launcher import PreforkLauncher
+
+
+def _make_launcher() -> PreforkLauncher:
+    return PreforkLauncher("127.0.0.1", 0, workers=2, report_interval=0)
+
+
+def test_worker_snapshot_is_a_copy():
+    launcher = _make_launcher()
+    launcher._add_worker(101, 0)
+    launcher._add_worker(102, 1)
+
+    snapshot = launcher.worker_snapshot()
+    assert snapshot == {"worker-0": 101, "worker-1": 102}
+
+    launcher._remove_worker(101)
+    launcher._add_worker(103, 0)
+    assert snapshot == {"worker-0": 101, "worker-1": 102}
+    assert launcher.worker_snapshot() == {"worker-0": 103, "worker-1": 102}
+
+
+def test_worker_snapshot_while_workers_change():
+    """메인 스레드가 워커를 재시작(회수 / spawn)하는 동안 리포터 스레드에서 조회해도 안전"""
+    launcher = _make_launcher()
+    for pid in range(1000):
+        launcher._add_worker(pid, pid)
+
+    stop = threading.Event()
+    errors = []
+
+    def report():
+        try:
+            while not stop.is_set():
+                launcher.worker_snapshot()
+        except Exception as e:
+            errors.append(e)
+
+    reporter = threading.Thread(target=report)
+    reporter.start()
+    try:
+        for pid in range(1000, 20000):
+            launcher._remove_worker(pid - 1000)
+            launcher._add_worker(pid, pid % 1000)
+    finally:
+        stop.set()
+        reporter.join()
+
+    assert errors == []
+    assert len(launcher.worker_snapshot()) == 1000
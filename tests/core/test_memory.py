@@ -0,0 +1,31 @@
+import os
+import sys
+import pytest
+from app.core.memory import read_process_memory, child_pids
+
+def test_read_current_process_memory():
+    usage = read_process_memory()
+    assert usage.pid == os.getpid()
+    assert usage.rss > 0
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="/proc 기반 조회는 Linux 전용")
+def test_read_forked_child_memory():
+    """fork 직후 자식은 부모 페이지 대부분을 공유"""
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(write_fd)
+        os.read(read_fd, 1)
+        os._exit(0)
+
+    try:
+        os.close(read_fd)
+        assert pid in child_pids()
+        usage = read_process_memory(pid)
+        assert usage.rss > 0
+        assert usage.pss is not None and usage.pss <= usage.rss
+        assert usage.shared > 0
+    finally:
+        os.write(write_fd, b"x")
+        os.close(write_fd)
+        os.waitpid(pid, 0)
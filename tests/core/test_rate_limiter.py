@@ -0,0 +1,84 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.interceptors import RateLimitInterceptor
+from app.core.interceptors.rate_limiter import rejected_counter
+
+
+def _make_client(rules, **kwargs) -> TestClient:
+    app = FastAPI()
+
+    @app.post("/api/v1/ocr/upload-ocr")
+    def upload():
+        return {"ok": True}
+
+    @app.post("/api/v1/ocr/export/csv")
+    def export():
+        return {"ok": True}
+
+    @app.get("/api/v1/ocr/tickets")
+    def tickets():
+        return {"ok": True}
+
+    app.add_middleware(RateLimitInterceptor, rules=rules, **kwargs)
+    return TestClient(app)
+
+
+def test_rejects_over_burst_with_envelope():
+    client = _make_client({"parse": (0.001, 2), "export": (0.001, 2)})
+    before = rejected_counter.value(policy="parse")
+
+    assert client.post("/api/v1/ocr/upload-ocr").status_code == 200
+    assert client.post("/api/v1/ocr/upload-ocr").status_code == 200
+    response = client.post("/api/v1/ocr/upload-ocr")
+
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    res_json = response.json()
+    assert res_json["success"] is False
+    assert res_json["status_code"] == "RATE_001"
+    assert rejected_counter.value(policy="parse") == before + 1
+
+
+def test_separate_budgets_per_policy_and_client():
+    client = _make_client({"parse": (0.001, 1), "export": (0.001, 1)}, api_keys=["terminal-a"])
+
+    assert client.post("/api/v1/ocr/upload-ocr").status_code == 200
+    assert client.post("/api/v1/ocr/upload-ocr").status_code == 429
+    # 내보내기 경로는 별도 버킷
+    assert client.post("/api/v1/ocr/export/csv").status_code == 200
+    # 등록된 API Key는 별도 클라이언트로 취급
+    assert client.post("/api/v1/ocr/upload-ocr", headers={"X-API-Key": "terminal-a"}).status_code == 200
+    # 제한 대상이 아닌 경로는 통과
+    for _ in range(5):
+        assert client.get("/api/v1/ocr/tickets").status_code == 200
+
+
+def test_unknown_api_keys_fall_back_to_ip():
+    """등록되지 않은 API Key를 요청마다 바꿔도 IP 버킷을 공유하여 우회할 수 없음"""
+    client = _make_client({"parse": (0.001, 2), "export": (0.001, 2)}, api_keys=["terminal-a"])
+
+    statuses = [
+        client.post("/api/v1/ocr/upload-ocr", headers={"X-API-Key": f"random-{i}"}).status_code
+        for i in range(4)
+    ]
+    assert statuses == [200, 200, 429, 429]
+
+
+def test_tokens_refill_over_time():
+    client = _make_client({"parse": (1e9, 1), "export": (1e9, 1)})
+    for _ in range(20):
+        assert client.post("/api/v1/ocr/upload-ocr").status_code == 200
+
+
+def test_disabled():
+    client = _make_client({"parse": (0.001, 1), "export": (0.001, 1)}, enabled=False)
+    for _ in range(5):
+        assert client.post("/api/v1/ocr/upload-ocr").status_code == 200
+
+
+def test_idle_buckets_evicted():
+    limiter = RateLimitInterceptor(app=None, rules={"parse": (1e9, 1)}, max_buckets=10)
+    for i in range(100):
+        assert limiter._acquire("parse", f"ip:10.0.0.{i}") is None
+    assert len(limiter._buckets) <= 10
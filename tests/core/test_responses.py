@@ -0,0 +1,31 @@
+import json
+from fastapi.testclient import TestClient
+from app.main import app
+from app.core.responses import ApiResponse, ApiJSONResponse
+
+client = TestClient(app)
+
+def test_api_json_response_renders_envelope():
+    response = ApiJSONResponse(ApiResponse.success_response(data={"total_weight": 14080, "company_name": "정우리사이클링 (주)"}))
+    body = json.loads(response.body)
+
+    assert response.media_type == "application/json"
+    assert body["success"] is True
+    assert body["data"]["company_name"] == "정우리사이클링 (주)"
+
+def test_api_json_response_non_serializable_data():
+    """검증 에러 상세처럼 직렬화 불가능한 값이 포함되어도 문자열로 변환"""
+    response = ApiJSONResponse(ApiResponse.error_response(code="ERR_422", message="error", data={"ctx": ValueError("bad")}))
+    assert json.loads(response.body)["data"]["ctx"] == "bad"
+
+def test_api_json_response_indent():
+    response = ApiJSONResponse({"a": 1}, indent=True)
+    assert response.body == b'{\n  "a": 1\n}'
+
+def test_validation_error_envelope():
+    """RequestValidationError 경로도 동일한 엔벨로프로 응답"""
+    response = client.get("/api/v1/ocr/tickets", params={"limit": 0})
+    assert response.status_code == 422
+    res_json = response.json()
+    assert res_json["success"] is False
+    assert res_json["status_code"] == "ERR_422"
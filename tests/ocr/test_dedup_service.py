@@ -0,0 +1,188 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.api.v1.ocr import controller
+from app.repositories import TicketRepository
+from app.services import NearDuplicateService
+
+client = TestClient(app)
+DATA_DIR = os.path.join(os.path.dirname(__file__), "../../data")
+
+def _text(name: str) -> str:
+    with open(os.path.join(DATA_DIR, name), encoding="utf-8") as f:
+        return json.load(f)["text"]
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def service(clock):
+    return NearDuplicateService(threshold=0.7, window_sec=600, clock=clock)
+
+def test_detects_noisy_rescan(service):
+    """OCR 잡음만 다른 재촬영 텍스트는 원본으로 매칭"""
+    text = _text("sample_01.json")
+    service.add(service.fingerprint(text), ticket_id=1)
+
+    rescan = text.replace("계 량 증 명 서", "게 량 증 명 서").replace("kg", "k9", 1)
+    assert service.find(service.fingerprint(rescan)) == 1
+
+def test_same_template_different_ticket_not_duplicate(service):
+    """같은 양식이라도 중량/시각이 다른 계근지는 중복이 아님"""
+    text = _text("sample_01.json")
+    service.add(service.fingerprint(text), ticket_id=1)
+
+    other = (
+        text.replace("05:26:18 12,480", "14:02:51 23,910")
+        .replace("05:36:01 7,470", "14:19:44 9,630")
+        .replace("5,010", "14,280")
+        .replace("8713", "3391")
+        .replace("05:37:55", "14:21:07")
+    )
+    assert service.find(service.fingerprint(other)) is None
+    assert service.find(service.fingerprint(_text("sample_02.json"))) is None
+
+def test_time_window_eviction(service, clock):
+    """시간 창이 지난 항목은 인덱스에서 제거"""
+    fingerprint = service.fingerprint(_text("sample_03.json"))
+    service.add(fingerprint, ticket_id=7)
+    assert service.find(fingerprint) == 7
+
+    clock.now += 601
+    assert service.find(fingerprint) is None
+    assert len(service) == 0
+    assert service._buckets == {}
+
+def test_reservation_blocks_until_confirmed(service):
+    """예약된 원본과 겹치는 요청은 원본 ID가 확정될 때까지 대기"""
+    fingerprint = service.fingerprint(_text("sample_01.json"))
+    original_id, reservation = service.find_or_reserve(fingerprint)
+    assert original_id is None and reservation is not None
+    assert service.find(fingerprint) is None
+
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(service.find_or_reserve(fingerprint)))
+    waiter.start()
+    time.sleep(0.05)
+    assert waiter.is_alive()
+
+    service.confirm(reservation, ticket_id=42)
+    waiter.join(timeout=5)
+    assert results == [(42, None)]
+    assert service.find(fingerprint) == 42
+
+def test_released_reservation_is_taken_over(service, clock):
+    """원본 처리 실패로 취소된 예약은 대기 중인 요청이 새로 예약"""
+    fingerprint = service.fingerprint(_text("sample_01.json"))
+    _, reservation = service.find_or_reserve(fingerprint)
+
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(service.find_or_reserve(fingerprint)))
+    waiter.start()
+    time.sleep(0.05)
+    service.release(reservation)
+    waiter.join(timeout=5)
+
+    (original_id, retaken), = results
+    assert original_id is None and retaken not in (None, reservation)
+    assert len(service) == 1
+
+    # 취소된 항목이 순서 큐에 남아 있어도 만료 처리가 정상 동작
+    clock.now += 601
+    assert service.find(fingerprint) is None
+    assert len(service) == 0
+
+def test_pending_timeout_processes_as_new(clock):
+    """예약이 pending_timeout 안에 확정되지 않으면 중복 판정 없이 처리"""
+    service = NearDuplicateService(pending_timeout=0.01, clock=clock)
+    fingerprint = service.fingerprint(_text("sample_01.json"))
+    service.find_or_reserve(fingerprint)
+    assert service.find_or_reserve(fingerprint) == (None, None)
+
+def test_upload_flags_duplicate(monkeypatch):
+    """flag 모드: 재업로드된 계근지는 파싱/저장 후 duplicate_of에 원본 ID 표시"""
+    monkeypatch.setattr(controller.ingest_service, "dedup_service", NearDuplicateService())
+    with open(os.path.join(DATA_DIR, "sample_04.json"), "rb") as f:
+        content = f.read()
+
+    first = client.post("/api/v1/ocr/upload-ocr", files={"file": ("a.json", content, "application/json")}).json()["data"]
+    second = client.post("/api/v1/ocr/upload-ocr", files={"file": ("b.json", content, "application/json")}).json()["data"]
+
+    assert first["duplicate_of"] is None
+    assert second["duplicate_of"] == first["ticket_id"]
+    assert second["ticket_id"] != first["ticket_id"]
+    assert controller.ticket_repository.find_by_id(second["ticket_id"]).duplicate_of == first["ticket_id"]
+
+def test_batch_upload_skip_mode(monkeypatch):
+    """skip 모드: 배치 내 중복은 저장하지 않고 원본을 duplicate_of와 함께 반환"""
+    monkeypatch.setattr(controller.ingest_service, "dedup_service", NearDuplicateService())
+    monkeypatch.setattr(controller.ingest_service, "dedup_mode", "skip")
+    files = []
+    for name in ("sample_01.json", "sample_02.json", "sample_01.json"):
+        with open(os.path.join(DATA_DIR, name), "rb") as f:
+            files.append(("files", (name, f.read(), "application/json")))
+
+    response = client.post("/api/v1/ocr/upload-ocr/batch", files=files)
+    assert response.status_code == 200
+    first, second, duplicate = response.json()["data"]
+
+    assert first["duplicate_of"] is None and second["duplicate_of"] is None
+    assert duplicate["ticket_id"] is None
+    assert duplicate["duplicate_of"] == first["ticket_id"]
+    assert duplicate["total_weight"] == first["total_weight"]
+
+def test_repository_migrates_duplicate_of_column(tmp_path):
+    """duplicate_of 컬럼이 없는 기존 DB 파일도 열 때 컬럼을 추가"""
+    db_path = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE tickets (id INTEGER PRIMARY KEY AUTOINCREMENT, company_name TEXT, product_name TEXT, "
+                 "vehicle_number TEXT, date TEXT NOT NULL DEFAULT '', in_time TEXT, out_time TEXT, total_weight INTEGER, "
+                 "empty_weight INTEGER, net_weight INTEGER, confidence_score REAL NOT NULL DEFAULT 0, "
+                 "uncertain INTEGER NOT NULL DEFAULT 0, created_at TEXT)")
+    conn.execute("INSERT INTO tickets (vehicle_number, date) VALUES ('5405', '2026-02-01')")
+    conn.commit()
+    conn.close()
+
+    repository = TicketRepository(db_path)
+    assert repository.find_by_id(1).duplicate_of is None
+    assert repository.find_by_id(repository.save(repository.find_by_id(1).model_copy(update={"duplicate_of": 1}))).duplicate_of == 1
+    repository.close()
+
+def test_concurrent_stream_duplicates_point_to_first_original(monkeypatch):
+    """동시에 처리되는 같은 계근지는 하나만 원본으로 저장되고 나머지는 그 원본을 가리킴"""
+    monkeypatch.setattr(controller.ingest_service, "dedup_service", NearDuplicateService())
+    parse = controller.parser_service.parse
+
+    def slow_parse(*args, **kwargs):
+        # 앞선 문서의 파싱이 끝나기 전에 다음 문서의 중복 검사가 실행되도록 지연
+        time.sleep(0.05)
+        return parse(*args, **kwargs)
+
+    monkeypatch.setattr(controller.parser_service, "parse", slow_parse)
+    with open(os.path.join(DATA_DIR, "sample_02.json"), encoding="utf-8") as f:
+        document = json.dumps(json.load(f), ensure_ascii=False).encode()
+
+    response = client.post("/api/v1/ocr/stream/ndjson", content=(document + b"\n") * 4)
+    assert response.status_code == 200
+    tickets = [line["data"] for line in map(json.loads, response.text.splitlines())]
+
+    originals = [ticket for ticket in tickets if ticket["duplicate_of"] is None]
+    assert len(originals) == 1
+    assert all(
+        ticket["duplicate_of"] == originals[0]["ticket_id"] for ticket in tickets if ticket is not originals[0]
+    )
@@ -1,9 +1,13 @@
 import pytest
 from fastapi.testclient import TestClient
 from app.main import app
+from app.core.config import settings
 import os
 import csv
 import io
+import json
+import gzip
+import zstandard
 
 client = TestClient(app)
 
@@ -55,6 +59,65 @@ def test_upload_ocr_invalid_json_content():
     assert res_json["success"] is False
     assert res_json["status_code"] == "FILE_002"
 
+@pytest.mark.parametrize("filename, compress", [
+    ("sample.json.gz", gzip.compress),
+    ("sample.json.zst", zstandard.ZstdCompressor().compress),
+])
+def test_upload_ocr_compressed_file(filename, compress):
+    """[POST] /api/v1/ocr/upload-ocr gzip / zstd 압축 파일 업로드 테스트"""
+    if not os.path.exists(SAMPLE_FILE_PATH):
+        pytest.skip(f"Sample file not found at {SAMPLE_FILE_PATH}")
+
+    with open(SAMPLE_FILE_PATH, "rb") as f:
+        content = compress(f.read())
+    response = client.post(
+        "/api/v1/ocr/upload-ocr",
+        files={"file": (filename, content, "application/octet-stream")}
+    )
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert data["vehicle_number"] == "5405"
+    assert data["total_weight"] == 14080
+
+def test_upload_ocr_malformed_bounding_box():
+    """[POST] /api/v1/ocr/upload-ocr 좌표가 null / 범위 초과인 단어도 파싱"""
+    payload = {
+        "text": "총중량 : 14,080 kg",
+        "pages": [{"text": "총중량 : 14,080 kg", "words": [
+            {"text": "총중량", "boundingBox": {"vertices": [{"x": None, "y": 10 ** 12}]}},
+        ]}],
+    }
+    response = client.post(
+        "/api/v1/ocr/upload-ocr",
+        files={"file": ("malformed.json", json.dumps(payload).encode(), "application/json")}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["data"]["total_weight"] == 14080
+
+def test_upload_ocr_decompression_bomb(monkeypatch):
+    """[POST] /api/v1/ocr/upload-ocr 해제 크기 제한 초과 테스트"""
+    monkeypatch.setattr(settings, "upload_max_decompressed_bytes", 1024 * 1024)
+    bomb = gzip.compress(b" " * (8 * 1024 * 1024))
+    response = client.post(
+        "/api/v1/ocr/upload-ocr",
+        files={"file": ("bomb.json.gz", bomb, "application/gzip")}
+    )
+
+    assert response.status_code == 413
+    assert response.json()["status_code"] == "FILE_004"
+
+def test_upload_ocr_corrupt_compressed_file():
+    """[POST] /api/v1/ocr/upload-ocr 손상된 압축 파일 테스트"""
+    response = client.post(
+        "/api/v1/ocr/upload-ocr",
+        files={"file": ("broken.json.zst", b"not zstd", "application/zstd")}
+    )
+
+    assert response.status_code == 400
+    assert response.json()["status_code"] == "FILE_003"
+
 def test_export_csv_success():
     """[POST] /api/v1/ocr/export/csv 성공 테스트"""
     if not os.path.exists(SAMPLE_FILE_PATH):
@@ -97,3 +160,11 @@ def test_export_json_success():
     res_json = response.json()
     assert res_json["vehicle_number"] == "5405"
     assert res_json["total_weight"] == 14080
+
+def test_metrics_endpoint():
+    """[GET] /api/v1/system/metrics Prometheus 텍스트 포맷"""
+    response = client.get("/api/v1/system/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "ocr_parse_deadline_exceeded_total" in response.text
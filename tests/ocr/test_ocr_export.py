@@ -5,6 +5,11 @@ import json
 import os
 import csv
 import io
+import datetime
+import pyarrow as pa
+import pyarrow.parquet as pq
+from app.models import WeighbridgeTicket
+from app.services import TicketExportService
 
 client = TestClient(app)
 SAMPLE_FILE_PATH = os.path.join(os.path.dirname(__file__), "../../data/sample_03.json")
@@ -51,3 +56,90 @@ def test_export_json_success():
     res_json = response.json()
     assert res_json["vehicle_number"] == "5405"
     assert res_json["total_weight"] == 14080
+
+def test_export_parquet_success():
+    """[POST] /api/v1/ocr/export/parquet 성공 테스트 (다중 파일 업로드)"""
+    if not os.path.exists(SAMPLE_FILE_PATH):
+        pytest.skip(f"Sample file not found at {SAMPLE_FILE_PATH}")
+
+    with open(SAMPLE_FILE_PATH, "rb") as f:
+        content = f.read()
+
+    response = client.post(
+        "/api/v1/ocr/export/parquet",
+        files=[
+            ("files", ("sample_a.json", content, "application/json")),
+            ("files", ("sample_b.json", content, "application/json")),
+        ]
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.apache.parquet"
+    assert "attachment; filename=weighbridge_tickets.parquet" in response.headers["content-disposition"]
+
+    # Parquet 내용 검증 (타입 포함)
+    table = pq.read_table(io.BytesIO(response.content))
+    assert table.num_rows == 2
+    assert table.schema.field("total_weight").type == pa.int64()
+    assert table.schema.field("date").type == pa.date32()
+    assert pa.types.is_dictionary(table.schema.field("vehicle_number").type)
+
+    rows = table.to_pylist()
+    assert rows[0]["vehicle_number"] == "5405"
+    assert rows[0]["total_weight"] == 14080
+    assert rows[0]["date"] == datetime.date(2026, 2, 1)
+
+def test_export_parquet_spooled_to_disk(monkeypatch):
+    """[POST] /api/v1/ocr/export/parquet 결과가 spool 한도를 넘으면 임시 파일을 거쳐 스트리밍"""
+    if not os.path.exists(SAMPLE_FILE_PATH):
+        pytest.skip(f"Sample file not found at {SAMPLE_FILE_PATH}")
+
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "export_spool_max_bytes", 1)
+
+    with open(SAMPLE_FILE_PATH, "rb") as f:
+        content = f.read()
+
+    response = client.post(
+        "/api/v1/ocr/export/parquet",
+        files=[("files", (f"sample_{i}.json", content, "application/json")) for i in range(3)],
+    )
+
+    assert response.status_code == 200
+    table = pq.read_table(io.BytesIO(response.content))
+    assert table.num_rows == 3
+    assert table.column("total_weight").to_pylist() == [14080] * 3
+
+
+def test_export_parquet_weight_beyond_int32():
+    """[POST] /api/v1/ocr/export/parquet int32 범위를 넘는 중량도 배치 전체를 실패시키지 않고 보존"""
+    document = json.dumps({"text": "총중량 : 9,999,999,999 kg\n공차중량 : 10,000 kg"}, ensure_ascii=False).encode()
+    response = client.post(
+        "/api/v1/ocr/export/parquet",
+        files=[("files", ("huge.json", document, "application/json"))],
+    )
+
+    assert response.status_code == 200
+    table = pq.read_table(io.BytesIO(response.content))
+    assert table.column("total_weight").to_pylist() == [9_999_999_999]
+
+
+def test_export_service_row_groups(tmp_path):
+    """TicketExportService row group 분할 및 시간 타입 변환 테스트"""
+    tickets = [
+        WeighbridgeTicket(vehicle_number="5405", date="2026-02-01", in_time="11:33:00", total_weight=14080 + i)
+        for i in range(5)
+    ]
+    tickets.append(WeighbridgeTicket(date="잘못된 날짜", in_time=None))
+
+    path = tmp_path / "tickets.parquet"
+    rows = TicketExportService(row_group_size=2).write_parquet(iter(tickets), str(path))
+
+    parquet_file = pq.ParquetFile(path)
+    assert rows == 6
+    assert parquet_file.num_row_groups == 3
+
+    result = parquet_file.read().to_pylist()
+    assert result[0]["in_time"] == datetime.time(11, 33, 0)
+    assert result[4]["total_weight"] == 14084
+    assert result[5]["date"] is None
@@ -1,5 +1,6 @@
 import pytest
-from app.services.ocr.ocr_service import OCRParserService
+import time
+from app.services.ocr.ocr_service import OCRParserService, deadline_hits
 from app.models.ocr.models import OCRInput
 
 @pytest.fixture
@@ -156,3 +157,59 @@ def test_company_name_extraction(parser_service):
         res4 = parser_service.parse(OCRInput(text=text4))
         if res4.company_name:
             assert "삼성전자" in res4.company_name
+
+def test_parse_deadline_exceeded(parser_service):
+    """
+    [처리 시간 예산] 예산 초과 시 남은 단계를 건너뛰고 부분 결과 반환
+    """
+    original = parser_service._extract_company
+
+    def slow_company(text, should_run=None):
+        time.sleep(0.05)
+        return original(text, should_run)
+
+    parser_service._extract_company = slow_company
+    text = """
+    총중량 : 25,000 kg
+    공차중량 : 10,000 kg
+    상호 : (주) 테스트컴퍼니
+    품명 : 고철
+    """
+    before = deadline_hits.value()
+    result = parser_service.parse(OCRInput(text=text), budget_ms=20)
+
+    assert result.total_weight == 25000
+    assert result.company_name == "(주) 테스트컴퍼니"
+    assert result.product_name is None
+    assert result.uncertain is True
+    assert result.skipped_stages == ["product", "cross_validation"]
+    assert deadline_hits.value() == before + 1
+
+def test_parse_deadline_skips_company_ner():
+    """
+    [처리 시간 예산] 업체명 추출 중 예산을 초과하면 NER 단계를 건너뛰고 skipped_stages에 기록
+    """
+    service = OCRParserService()
+    service.nlp = lambda text: pytest.fail("NER must be skipped after the deadline")
+
+    def slow_corporate_name(text):
+        time.sleep(0.05)
+        return None
+
+    service._match_corporate_name = slow_corporate_name
+    result = service.parse(OCRInput(text="총중량 : 25,000 kg"), budget_ms=20)
+
+    assert result.company_name is None
+    assert result.skipped_stages[0] == "company_ner"
+    assert result.uncertain is True
+
+def test_parse_within_budget(parser_service):
+    result = parser_service.parse(OCRInput(text="총중량 : 25,000 kg"), budget_ms=60_000)
+    assert result.skipped_stages == []
+    assert result.uncertain is False
+
+def test_parse_budget_exhausted_before_start():
+    service = OCRParserService(budget_ms=1e-9)
+    result = service.parse(OCRInput(text="총중량 : 25,000 kg"))
+    assert result.total_weight is None
+    assert result.skipped_stages[0] == "weight"
@@ -0,0 +1,131 @@
+import asyncio
+import json
+import os
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.models.ocr.models import WeighbridgeTicket
+from app.services import NDJSONStreamService
+from app.core.responses import CustomException, ErrorStatus
+
+client = TestClient(app)
+SAMPLE_FILE_PATH = os.path.join(os.path.dirname(__file__), "../../data/sample_03.json")
+
+def _echo_handler(line: bytes) -> WeighbridgeTicket:
+    data = json.loads(line)
+    if "error" in data:
+        raise CustomException(ErrorStatus.VALIDATION_ERROR)
+    return WeighbridgeTicket(vehicle_number=data["vehicle"])
+
+async def _collect(service, chunks):
+    async def gen():
+        for chunk in chunks:
+            yield chunk
+    return [item async for item in service.process(gen())]
+
+def test_stream_splits_lines_across_chunks():
+    """청크 경계와 무관하게 줄 단위로 처리"""
+    service = NDJSONStreamService(_echo_handler, max_in_flight=2)
+    chunks = [b'{"vehicle": "54', b'05"}\n{"vehi', b'cle": "8713"}\n\n{"error": 1}\n{"vehicle": "1234"}']
+    results = asyncio.run(_collect(service, chunks))
+
+    by_seq = dict(results)
+    assert sorted(by_seq) == [0, 1, 2, 3]
+    assert by_seq[0].vehicle_number == "5405"
+    assert by_seq[1].vehicle_number == "8713"
+    assert isinstance(by_seq[2], CustomException)
+    assert by_seq[3].vehicle_number == "1234"
+
+def test_stream_reports_unexpected_handler_errors():
+    """CustomException이 아닌 에러도 해당 순번의 에러로 전달되고 슬롯이 반환되어 스트림이 멈추지 않음"""
+    service = NDJSONStreamService(_echo_handler, max_in_flight=2)
+    chunks = [b"not json\n" * 3, b'{"vehicle": "5405"}\n', b'{"missing": 1}\n']
+    results = asyncio.run(asyncio.wait_for(_collect(service, chunks), timeout=5))
+
+    by_seq = dict(results)
+    assert sorted(by_seq) == [0, 1, 2, 3, 4]
+    for seq in (0, 1, 2, 4):
+        assert by_seq[seq].error_status is ErrorStatus.INTERNAL_SERVER_ERROR
+    assert by_seq[3].vehicle_number == "5405"
+
+def test_stream_yields_before_body_completes():
+    """다음 문서를 보내기 전에 이전 문서 결과를 받을 수 있음 (본문 버퍼링 없음)"""
+    service = NDJSONStreamService(_echo_handler)
+
+    async def run():
+        first_result = asyncio.Event()
+
+        async def body():
+            yield b'{"vehicle": "5405"}\n'
+            await asyncio.wait_for(first_result.wait(), timeout=5)
+            yield b'{"vehicle": "8713"}\n'
+
+        received = []
+        async for seq, ticket in service.process(body()):
+            received.append(ticket.vehicle_number)
+            first_result.set()
+        return received
+
+    assert asyncio.run(run()) == ["5405", "8713"]
+
+def test_stream_bounded_in_flight():
+    """동시 처리 문서 수가 max_in_flight를 넘지 않음"""
+    active = {"now": 0, "max": 0}
+
+    def slow_handler(line: bytes) -> WeighbridgeTicket:
+        active["now"] += 1
+        active["max"] = max(active["max"], active["now"])
+        import time
+        time.sleep(0.01)
+        active["now"] -= 1
+        return WeighbridgeTicket()
+
+    service = NDJSONStreamService(slow_handler, max_in_flight=3)
+    results = asyncio.run(_collect(service, [b"{}\n" * 20]))
+
+    assert len(results) == 20
+    assert active["max"] <= 3
+
+def test_stream_line_too_long():
+    service = NDJSONStreamService(_echo_handler, max_line_bytes=20)
+    results = dict(asyncio.run(_collect(service, [b'{"vehicle": "5405"}\n', b"x" * 30])))
+
+    assert results[0].vehicle_number == "5405"
+    assert results[1].error_status == ErrorStatus.STREAM_LINE_TOO_LONG
+
+@pytest.mark.parametrize("chunks", [
+    [b'{"vehicle": "5405"}\n' + b"x" * 100 + b"\n"],
+    [b'{"vehicle": "5405"}\n' + b"x" * 15, b"x" * 15 + b"\n"],
+    [b'{"vehicle": "5405"}\n' + b"x" * 15, b"x" * 15],
+])
+def test_stream_line_too_long_checked_on_complete_line(chunks):
+    """한 청크 안에서 끝나는 줄, 여러 청크에 걸친 줄의 마지막 조각까지 합친 길이도 검사"""
+    service = NDJSONStreamService(_echo_handler, max_line_bytes=20)
+    results = dict(asyncio.run(_collect(service, chunks)))
+
+    assert results[0].vehicle_number == "5405"
+    assert results[1].error_status == ErrorStatus.STREAM_LINE_TOO_LONG
+
+def test_stream_ndjson_endpoint():
+    """[POST] /api/v1/ocr/stream/ndjson 문서별 결과 스트리밍"""
+    if not os.path.exists(SAMPLE_FILE_PATH):
+        pytest.skip(f"Sample file not found at {SAMPLE_FILE_PATH}")
+
+    with open(SAMPLE_FILE_PATH, "rb") as f:
+        document = json.dumps(json.load(f), ensure_ascii=False).encode()
+
+    def body():
+        yield document + b"\n"
+        yield b"invalid json\n"
+        yield document
+
+    response = client.post("/api/v1/ocr/stream/ndjson", content=body())
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = {line["seq"]: line for line in map(json.loads, response.text.splitlines())}
+    assert sorted(lines) == [0, 1, 2]
+    assert lines[0]["success"] is True
+    assert lines[0]["data"]["vehicle_number"] == "5405"
+    assert lines[1]["status_code"] == "FILE_002"
+    assert lines[2]["data"]["total_weight"] == 14080
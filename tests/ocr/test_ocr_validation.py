@@ -0,0 +1,97 @@
+import pytest
+import numpy as np
+from app.models.ocr.models import WeighbridgeTicket
+from app.services.ocr.validation_service import (
+    BatchValidationService,
+    FLAG_WEIGHT_MISMATCH,
+    FLAG_TARE_DEVIATION,
+    FLAG_TIME_ORDER,
+)
+
+@pytest.fixture
+def validation_service():
+    return BatchValidationService()
+
+def _ticket(**kwargs):
+    defaults = dict(vehicle_number="5405", total_weight=14080, empty_weight=13950, net_weight=130,
+                    in_time="11:33:00", out_time="11:55:35")
+    defaults.update(kwargs)
+    return WeighbridgeTicket(**defaults)
+
+def test_weight_consistency(validation_service):
+    """
+    [중량 정합성] 총중량 - 공차중량 != 실중량 (허용 오차 초과)
+    """
+    tickets = [
+        _ticket(),
+        _ticket(net_weight=400),
+        _ticket(total_weight=None),  # 누락값은 검증 대상 아님
+    ]
+    flags = validation_service.check(tickets)
+
+    assert flags[0] == 0
+    assert flags[1] & FLAG_WEIGHT_MISMATCH
+    assert flags[2] == 0
+
+def test_tare_deviation_per_vehicle(validation_service):
+    """
+    [공차 편차] 같은 차량의 공차중량이 평소와 크게 다른 경우
+    """
+    tickets = [_ticket(vehicle_number="5405", empty_weight=w, total_weight=w + 130) for w in (13950, 13900, 14000, 13980)]
+    tickets.append(_ticket(vehicle_number="5405", empty_weight=9000, total_weight=9130))
+    # 운행 횟수가 적은 차량은 판정하지 않음
+    tickets.append(_ticket(vehicle_number="8713", empty_weight=7470, total_weight=7600))
+
+    flags = validation_service.check(tickets)
+
+    assert not (flags[:4] & FLAG_TARE_DEVIATION).any()
+    assert flags[4] & FLAG_TARE_DEVIATION
+    assert flags[5] == 0
+
+def test_time_ordering(validation_service):
+    """
+    [시간 순서] 체류시간이 비정상적인 경우 (출고시간이 입고시간보다 빠르면 다음날 출고로 계산)
+    """
+    tickets = [
+        _ticket(),
+        _ticket(in_time="11:55:35", out_time="11:33:00"),
+        _ticket(in_time="11:33:00", out_time="11:33:10"),
+        _ticket(in_time="11:33:00", out_time=None),
+    ]
+    flags = validation_service.check(tickets)
+
+    assert flags[0] == 0
+    assert flags[1] & FLAG_TIME_ORDER
+    assert flags[2] & FLAG_TIME_ORDER
+    assert flags[3] == 0
+
+def test_time_ordering_across_midnight(validation_service):
+    """
+    [시간 순서] 자정을 넘긴 운행은 정상, 8자를 넘는 시각 문자열은 잘라서 읽지 않음
+    """
+    tickets = [
+        _ticket(in_time="23:50:00", out_time="00:10:00"),
+        _ticket(in_time="23:59:30", out_time="00:00:00"),
+        _ticket(in_time="11:33:00", out_time="11:55:35123"),
+        _ticket(in_time="11:33:00", out_time="11:33:0012"),
+    ]
+    flags = validation_service.check(tickets)
+
+    assert flags[0] == 0
+    assert flags[1] & FLAG_TIME_ORDER  # 30초 체류
+    assert flags[2] == 0 and flags[3] == 0  # 형식 오류는 검증 대상 아님
+
+def test_validate_marks_uncertain(validation_service):
+    """
+    이상치만 uncertain=True로 표시되고 원본은 변경되지 않음
+    """
+    tickets = [_ticket(), _ticket(net_weight=400)]
+    result = validation_service.validate(tickets)
+
+    assert result[0].uncertain is False
+    assert result[1].uncertain is True
+    assert tickets[1].uncertain is False
+
+def test_empty_batch(validation_service):
+    assert validation_service.validate([]) == []
+    assert isinstance(validation_service.check([]), np.ndarray)
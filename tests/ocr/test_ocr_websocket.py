@@ -0,0 +1,49 @@
+import json
+import os
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+from app.main import app
+from app.core.config import settings
+
+client = TestClient(app)
+SAMPLE_FILE_PATH = os.path.join(os.path.dirname(__file__), "../../data/sample_03.json")
+WS_PATH = "/api/v1/ocr/ws"
+
+@pytest.fixture
+def sample_payload():
+    if not os.path.exists(SAMPLE_FILE_PATH):
+        pytest.skip(f"Sample file not found at {SAMPLE_FILE_PATH}")
+    with open(SAMPLE_FILE_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+def test_websocket_parse_with_correlation_id(sample_payload):
+    """[WS] /api/v1/ocr/ws 세션 내 여러 메시지 처리 및 상관관계 ID 매칭"""
+    with client.websocket_connect(WS_PATH) as ws:
+        ws.send_text(json.dumps({"id": "truck-1", "payload": sample_payload}))
+        ws.send_text(json.dumps({"id": "truck-2", "payload": sample_payload}))
+        responses = {msg["id"]: msg for msg in (ws.receive_json(), ws.receive_json())}
+
+    assert set(responses) == {"truck-1", "truck-2"}
+    assert responses["truck-1"]["success"] is True
+    assert responses["truck-1"]["data"]["vehicle_number"] == "5405"
+    assert responses["truck-2"]["data"]["total_weight"] == 14080
+
+def test_websocket_invalid_messages():
+    """잘못된 메시지는 세션을 끊지 않고 에러 응답"""
+    with client.websocket_connect(WS_PATH) as ws:
+        ws.send_text("not json")
+        assert ws.receive_json()["status_code"] == "FILE_002"
+
+        ws.send_text(json.dumps({"id": 7, "payload": {"confidence": 0.9}}))
+        response = ws.receive_json()
+        assert response["id"] == 7
+        assert response["status_code"] == "ERR_422"
+
+def test_websocket_idle_timeout(monkeypatch):
+    """유휴 타임아웃 시 1001 코드로 종료"""
+    monkeypatch.setattr(settings, "ws_idle_timeout", 0.1)
+    with client.websocket_connect(WS_PATH) as ws:
+        with pytest.raises(WebSocketDisconnect) as exc_info:
+            ws.receive_json()
+    assert exc_info.value.code == 1001
@@ -0,0 +1,120 @@
+import json
+import os
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.core.geo import KDTree, bounding_box, haversine_m, to_unit_vectors
+from app.models import OCRInput, WeighbridgeTicket
+from app.repositories import TicketRepository
+from app.services import OCRParserService, SiteRegistry
+
+client = TestClient(app)
+DATA_DIR = os.path.join(os.path.dirname(__file__), "../../data")
+
+def _load(name: str) -> OCRInput:
+    with open(os.path.join(DATA_DIR, name), encoding="utf-8") as f:
+        data = json.load(f)
+    return OCRInput(**{key: data[key] for key in ("text", "pages", "confidence")})
+
+@pytest.fixture
+def registry():
+    return SiteRegistry.from_file(os.path.join(DATA_DIR, "sites.json"), max_distance_m=1000)
+
+def test_extract_coordinates_and_resolve_site(registry):
+    """계근지 하단 좌표를 추출하고 가장 가까운 계량소로 판정"""
+    parser = OCRParserService(site_registry=registry)
+
+    ticket = parser.parse(_load("sample_01.json"))
+    assert (ticket.latitude, ticket.longitude) == (37.105317, 127.375673)
+    assert ticket.site_id == "DONGWOO-BIO"
+
+    assert parser.parse(_load("sample_02.json")).site_id == "JANGWON-CNS"
+
+    # 좌표가 없는 계근지
+    ticket = parser.parse(_load("sample_03.json"))
+    assert ticket.latitude is None and ticket.site_id is None
+
+def test_site_out_of_range(registry):
+    assert registry.resolve(37.105317, 127.375673) == "DONGWOO-BIO"
+    # 약 1.1km 떨어진 좌표는 판정하지 않음
+    assert registry.resolve(37.115317, 127.375673) is None
+    site, distance = registry.nearest(37.115317, 127.375673)
+    assert site.site_id == "DONGWOO-BIO"
+    assert distance == pytest.approx(haversine_m(37.105317, 127.375673, 37.115317, 127.375673), rel=1e-6)
+
+def test_empty_registry(tmp_path):
+    registry = SiteRegistry.from_file(str(tmp_path / "missing.json"))
+    assert len(registry) == 0
+    assert registry.resolve(37.1, 127.3) is None
+
+def test_kdtree_matches_brute_force():
+    rng = np.random.default_rng(0)
+    points = to_unit_vectors(rng.uniform(33, 38.5, 2000), rng.uniform(125, 130, 2000))
+    tree = KDTree(points)
+    for _ in range(200):
+        query = to_unit_vectors(rng.uniform(33, 38.5), rng.uniform(125, 130))
+        index, _ = tree.nearest(query)
+        assert index == int(np.argmin(((points - query) ** 2).sum(axis=1)))
+
+def test_find_nearby(tmp_path):
+    """반경 내 티켓만 가까운 순으로 조회"""
+    repository = TicketRepository(str(tmp_path / "tickets.db"))
+    near_id, far_id, _ = repository.save_all([
+        WeighbridgeTicket(vehicle_number="1111", latitude=37.1055, longitude=127.3757, site_id="DONGWOO-BIO"),
+        WeighbridgeTicket(vehicle_number="2222", latitude=37.1100, longitude=127.3757),
+        WeighbridgeTicket(vehicle_number="3333", latitude=37.718114, longitude=126.844940),
+    ])
+
+    found = repository.find_nearby(37.105317, 127.375673, radius_m=1000)
+    assert [ticket.ticket_id for ticket, _ in found] == [near_id, far_id]
+    assert found[0][1] < found[1][1] <= 1000
+    assert repository.find_nearby(37.105317, 127.375673, radius_m=1000, limit=1)[0][0].ticket_id == near_id
+
+    tickets, _ = repository.find(site_id="DONGWOO-BIO")
+    assert [ticket.ticket_id for ticket in tickets] == [near_id]
+
+    plan = " ".join(row[3] for row in repository._reader().execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM tickets WHERE latitude BETWEEN 37 AND 38 AND longitude BETWEEN 127 AND 128"
+    ))
+    assert "idx_tickets_location" in plan
+    repository.close()
+
+def test_bounding_box_splits_at_antimeridian():
+    """경도 범위가 ±180을 넘으면 두 구간으로 분할"""
+    _, _, lon_ranges = bounding_box(0.0, 179.99, 5000)
+    assert len(lon_ranges) == 2
+    (east_min, east_max), (west_min, west_max) = lon_ranges
+    assert east_max == 180.0 and 179.9 < east_min < 179.99
+    assert west_min == -180.0 and -180.0 < west_max < -179.9
+
+    assert bounding_box(37.1, 127.3, 5000)[2] == [pytest.approx((127.2437, 127.3563), abs=1e-3)]
+
+def test_find_nearby_across_antimeridian(tmp_path):
+    """날짜변경선 건너편의 티켓도 반경 내면 조회"""
+    repository = TicketRepository(str(tmp_path / "tickets.db"))
+    west_id, east_id, _ = repository.save_all([
+        WeighbridgeTicket(vehicle_number="1111", latitude=-16.5, longitude=-179.995),
+        WeighbridgeTicket(vehicle_number="2222", latitude=-16.5, longitude=179.99),
+        WeighbridgeTicket(vehicle_number="3333", latitude=-16.5, longitude=179.5),
+    ])
+
+    found = repository.find_nearby(-16.5, 179.998, radius_m=2000)
+    assert [ticket.ticket_id for ticket, _ in found] == [west_id, east_id]
+    assert all(distance <= 2000 for _, distance in found)
+    repository.close()
+
+def test_nearby_endpoint():
+    with open(os.path.join(DATA_DIR, "sample_01.json"), "rb") as f:
+        uploaded = client.post("/api/v1/ocr/upload-ocr", files={"file": ("sample.json", f, "application/json")}).json()["data"]
+    assert uploaded["site_id"] == "DONGWOO-BIO"
+
+    response = client.get("/api/v1/ocr/tickets/nearby", params={"latitude": 37.1053, "longitude": 127.3756, "radius_m": 500})
+    assert response.status_code == 200
+    items = response.json()["data"]
+    assert uploaded["ticket_id"] in [item["ticket_id"] for item in items]
+    assert all(item["distance_m"] <= 500 for item in items)
+
+    assert client.get("/api/v1/ocr/tickets/nearby", params={"latitude": 91, "longitude": 127}).status_code == 422
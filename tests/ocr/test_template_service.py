@@ -0,0 +1,104 @@
+import copy
+import json
+import os
+
+import pytest
+
+from app.models import OCRInput
+from app.services import OCRParserService, LayoutTemplateService
+from app.services.ocr.template_service import template_lookups
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), "../../data")
+
+def _load(name: str) -> dict:
+    with open(os.path.join(DATA_DIR, name), encoding="utf-8") as f:
+        data = json.load(f)
+    return {key: data[key] for key in ("text", "pages", "confidence")}
+
+def _rescan(data: dict, replacements: dict, dx: int = 30, dy: int = -20, scale: float = 1.05) -> dict:
+    """같은 양식의 다른 계근지: 단어 치환 + 촬영 위치/배율 변경"""
+    data = copy.deepcopy(data)
+    for word in data["pages"][0]["words"]:
+        word["text"] = replacements.get(word["text"], word["text"])
+        for vertex in word["boundingBox"]["vertices"]:
+            vertex["x"] = int(vertex["x"] * scale + dx)
+            vertex["y"] = int(vertex["y"] * scale + dy)
+    data["text"] = " ".join(word["text"] for word in data["pages"][0]["words"])
+    return data
+
+@pytest.fixture
+def template_service(tmp_path):
+    return LayoutTemplateService(str(tmp_path / "templates.json"))
+
+def test_learns_template_from_verified_parse(template_service):
+    """중량 정합성이 맞는 파싱 결과만 템플릿으로 학습"""
+    parser = OCRParserService(template_service=template_service)
+    parser.parse(OCRInput(**_load("sample_03.json")))
+    assert len(template_service) == 1
+
+    # 라벨 기반 추출 값의 정합성이 맞지 않는 문서는 학습하지 않음
+    parser.parse(OCRInput(**_load("sample_01.json")))
+    assert len(template_service) == 1
+
+def test_template_hit_extracts_by_region(template_service):
+    """라벨이 깨져도 학습된 영역에서 중량을 읽어 크기순 추정 오류를 피함"""
+    parser = OCRParserService(template_service=template_service)
+    parser.parse(OCRInput(**_load("sample_03.json")))
+    hits = template_lookups.value(result="hit")
+
+    # 실중량이 공차중량보다 큰 계근지 (크기순 추정이면 공차/실중량이 뒤바뀜)
+    rescan = _rescan(_load("sample_03.json"), {
+        "14,080": "21,310", "13,950": "7,440", "130": "13,870",
+        "총": "종", "공차중량": "공자증랑", "실": "싈", "5405": "8120",
+    })
+    ticket = parser.parse(OCRInput(**rescan))
+
+    assert template_lookups.value(result="hit") == hits + 1
+    assert (ticket.total_weight, ticket.empty_weight, ticket.net_weight) == (21310, 7440, 13870)
+    assert ticket.vehicle_number == "8120"
+    assert ticket.company_name == "정우리사이클링 (주)"
+
+    generic = OCRParserService().parse(OCRInput(**rescan))
+    assert (generic.empty_weight, generic.net_weight) == (13870, 7440)
+
+def test_fallback_weights_are_not_learned(template_service):
+    """크기순 Fallback 중량(공차/실중량 뒤바뀜)으로는 학습하지 않아 이후 정상 스캔이 오염되지 않음"""
+    parser = OCRParserService(template_service=template_service)
+    garbled = _rescan(_load("sample_03.json"), {
+        "14,080": "21,310", "13,950": "7,440", "130": "13,870",
+        "총": "종", "공차중량": "공자증랑", "실": "싈",
+    })
+    parser.parse(OCRInput(**garbled))
+    assert len(template_service) == 0
+
+    ticket = parser.parse(OCRInput(**_load("sample_03.json")))
+    assert (ticket.total_weight, ticket.empty_weight, ticket.net_weight) == (14080, 13950, 130)
+
+    ticket = parser.parse(OCRInput(**_load("sample_03.json")))
+    assert (ticket.total_weight, ticket.empty_weight, ticket.net_weight) == (14080, 13950, 130)
+
+def test_template_miss_for_other_layout(template_service):
+    parser = OCRParserService(template_service=template_service)
+    parser.parse(OCRInput(**_load("sample_03.json")))
+    misses = template_lookups.value(result="miss")
+
+    ticket = parser.parse(OCRInput(**_load("sample_04.json")))
+    assert template_lookups.value(result="miss") == misses + 1
+    assert ticket.total_weight == 14230
+
+def test_inconsistent_template_weights_fall_back(template_service):
+    """영역에서 읽은 중량의 정합성이 맞지 않으면 일반 경로로 추출"""
+    parser = OCRParserService(template_service=template_service)
+    parser.parse(OCRInput(**_load("sample_03.json")))
+
+    fields = parser._parse_template_fields({"total_weight": "21,310", "empty_weight": "7,440", "net_weight": "999", "date": "2026-02-01"})
+    assert "total_weight" not in fields and "net_weight" not in fields
+    assert fields["date"] == "2026-02-01"
+
+def test_templates_persist(tmp_path):
+    store_path = str(tmp_path / "templates.json")
+    OCRParserService(template_service=LayoutTemplateService(store_path)).parse(OCRInput(**_load("sample_03.json")))
+
+    reloaded = LayoutTemplateService(store_path)
+    assert len(reloaded) == 1
+    assert reloaded.match(OCRInput(**_load("sample_03.json")).pages[0].words) is not None
@@ -0,0 +1,103 @@
+import pytest
+import os
+from fastapi.testclient import TestClient
+from app.main import app
+from app.models.ocr.models import WeighbridgeTicket
+from app.repositories import TicketRepository
+from app.core.responses import CustomException
+
+client = TestClient(app)
+SAMPLE_FILE_PATH = os.path.join(os.path.dirname(__file__), "../../data/sample_03.json")
+
+@pytest.fixture
+def repository(tmp_path):
+    repo = TicketRepository(str(tmp_path / "tickets.db"), batch_size=3)
+    yield repo
+    repo.close()
+
+def _ticket(vehicle_number="5405", date="2026-02-01", **kwargs):
+    return WeighbridgeTicket(vehicle_number=vehicle_number, date=date, total_weight=14080, **kwargs)
+
+def test_save_and_find_by_id(repository):
+    """단일 저장 후 ID로 조회"""
+    ticket_id = repository.save(_ticket(company_name="정우리사이클링 (주)", uncertain=True))
+    stored = repository.find_by_id(ticket_id)
+
+    assert stored.ticket_id == ticket_id
+    assert stored.company_name == "정우리사이클링 (주)"
+    assert stored.total_weight == 14080
+    assert stored.uncertain is True
+    assert repository.find_by_id(ticket_id + 100) is None
+
+def test_wal_mode(repository):
+    mode = repository._writer.execute("PRAGMA journal_mode").fetchone()[0]
+    assert mode == "wal"
+
+def test_save_all_batches(repository):
+    """batch_size 단위 일괄 저장 및 ID 순서 보장"""
+    ids = repository.save_all(_ticket(date=f"2026-02-{day:02d}") for day in range(1, 8))
+    assert len(ids) == 7
+    assert ids == sorted(ids)
+
+def test_find_with_filters_and_keyset_pagination(repository):
+    """차량번호 + 날짜 범위 필터, 커서로 전체 페이지 순회"""
+    repository.save_all([_ticket(date=f"2026-02-{day:02d}") for day in range(1, 11)])
+    repository.save_all([_ticket(vehicle_number="8713", date="2026-02-05")])
+    repository.save_all([_ticket(date="2026-03-01"), _ticket(date=None)])
+
+    collected = []
+    cursor = None
+    while True:
+        items, cursor = repository.find(
+            vehicle_number="5405", date_from="2026-02-01", date_to="2026-02-28", cursor=cursor, limit=4
+        )
+        collected.extend(items)
+        if cursor is None:
+            break
+
+    assert [t.date for t in collected] == [f"2026-02-{day:02d}" for day in range(1, 11)]
+    assert all(t.vehicle_number == "5405" for t in collected)
+
+def test_find_invalid_cursor(repository):
+    with pytest.raises(CustomException):
+        repository.find(cursor="not-a-cursor")
+
+def test_upload_persists_and_query_endpoint():
+    """[POST] /upload-ocr 저장 후 [GET] /tickets 조회"""
+    if not os.path.exists(SAMPLE_FILE_PATH):
+        pytest.skip(f"Sample file not found at {SAMPLE_FILE_PATH}")
+
+    with open(SAMPLE_FILE_PATH, "rb") as f:
+        upload = client.post("/api/v1/ocr/upload-ocr", files={"file": ("sample.json", f, "application/json")})
+    ticket_id = upload.json()["data"]["ticket_id"]
+    assert ticket_id is not None
+
+    response = client.get(
+        "/api/v1/ocr/tickets",
+        params={"vehicle_number": "5405", "date_from": "2026-02-01", "date_to": "2026-02-28", "limit": 1000}
+    )
+    assert response.status_code == 200
+    res_json = response.json()
+    assert res_json["success"] is True
+    assert ticket_id in [item["ticket_id"] for item in res_json["data"]["items"]]
+
+def test_query_endpoint_invalid_cursor():
+    response = client.get("/api/v1/ocr/tickets", params={"cursor": "@@@"})
+    assert response.status_code == 400
+    assert response.json()["status_code"] == "TICKET_001"
+
+def test_batch_upload_endpoint():
+    """[POST] /upload-ocr/batch 일괄 저장"""
+    if not os.path.exists(SAMPLE_FILE_PATH):
+        pytest.skip(f"Sample file not found at {SAMPLE_FILE_PATH}")
+
+    with open(SAMPLE_FILE_PATH, "rb") as f:
+        content = f.read()
+    response = client.post(
+        "/api/v1/ocr/upload-ocr/batch",
+        files=[("files", ("a.json", content, "application/json")), ("files", ("b.json", content, "application/json"))]
+    )
+    assert response.status_code == 200
+    items = response.json()["data"]
+    assert len(items) == 2
+    assert items[0]["ticket_id"] < items[1]["ticket_id"]
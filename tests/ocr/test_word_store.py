@@ -0,0 +1,79 @@
+import json
+import os
+import pytest
+import numpy as np
+from app.api.v1.ocr.dtos import OCRPageDto
+from app.models import OCRInput, OCRPage, OCRWordStore
+
+SAMPLE_FILE_PATH = os.path.join(os.path.dirname(__file__), "../../data/sample_04.json")
+
+WORDS = [
+    {"text": "총중량", "boundingBox": {"vertices": [{"x": 10, "y": 20}, {"x": 50, "y": 20}, {"x": 50, "y": 40}, {"x": 10, "y": 40}]}, "confidence": 0.9},
+    {"text": "14,080", "boundingBox": {"vertices": [{"x": 60, "y": 21}, {"x": 120, "y": 19}]}, "confidence": 0.8},
+    {"text": "kg"},
+]
+
+def test_from_words_columns():
+    """단어 목록 -> 텍스트 버퍼/오프셋, 좌표 배열 변환"""
+    store = OCRWordStore.from_words(WORDS)
+
+    assert len(store) == 3
+    assert store.text == "총중량14,080kg"
+    assert store.words == ["총중량", "14,080", "kg"]
+    assert store.word(1) == "14,080"
+    assert store.xs.shape == (3, 4) and store.xs.dtype == np.int32
+    assert store.xs[0].tolist() == [10, 50, 50, 10]
+    assert store.has_box().tolist() == [True, False, False]
+    assert store.confidence[2] == 0.0
+
+def test_bounds_ignore_missing_vertices():
+    bounds = OCRWordStore.from_words(WORDS).bounds()
+    assert bounds[0].tolist() == [10, 20, 50, 40]
+    assert bounds[1].tolist() == [60, 19, 120, 21]
+
+def test_to_words_round_trip():
+    restored = OCRWordStore.from_words(WORDS).to_words()
+    assert restored[0]["boundingBox"] == WORDS[0]["boundingBox"]
+    assert restored[2]["boundingBox"] is None
+
+def test_page_dto_conversion():
+    """OCRPageDto(요청) -> OCRPage(도메인) 변환 시 단어는 OCRWordStore로 적재"""
+    if not os.path.exists(SAMPLE_FILE_PATH):
+        pytest.skip(f"Sample file not found at {SAMPLE_FILE_PATH}")
+
+    with open(SAMPLE_FILE_PATH, encoding="utf-8") as f:
+        data = json.load(f)
+    page_dto = OCRPageDto(**data["pages"][0])
+
+    page = OCRPage(**page_dto.model_dump())
+    assert isinstance(page.words, OCRWordStore)
+    assert page.words.words == [word.text for word in page_dto.words]
+    assert page.words.nbytes() < len(json.dumps(data["pages"][0]["words"]))
+
+    # DTO 객체에서 직접 변환
+    assert OCRWordStore.from_words(page_dto.words).words == page.words.words
+
+def test_ocr_input_default_pages():
+    ocr_input = OCRInput(text="총중량 : 14,080 kg", pages=[{"text": "p"}])
+    assert len(ocr_input.pages[0].words) == 0
+
+def test_malformed_vertices_are_treated_as_missing():
+    """검증되지 않은 boundingBox 값(null, 문자열, 범위 초과)은 500 대신 누락 좌표 / int32 범위로 처리"""
+    store = OCRWordStore.from_words([
+        {"text": "a", "boundingBox": {"vertices": [{"x": None, "y": 1}, {"x": "abc", "y": 2}, {"x": "7", "y": 3.5}, "bad"]}},
+        {"text": "b", "boundingBox": {"vertices": [{"x": 10 ** 12, "y": -10 ** 12}] * 4}},
+        {"text": "c", "boundingBox": {"vertices": {"x": 1}}},
+        {"text": "d", "boundingBox": ["x"]},
+    ])
+    assert store.has_box().tolist() == [False, True, False, False]
+    assert store.xs[0, 2] == 7 and store.ys[0, 2] == 3
+    assert store.xs[1, 0] == np.iinfo(np.int32).max
+    assert store.to_words()[0]["boundingBox"]["vertices"][:2] == [{"y": 1}, {"y": 2}]
+
+def test_negative_one_is_a_real_coordinate():
+    """-1 좌표(이미지 경계 밖)는 누락 좌표와 구분"""
+    vertices = [{"x": -1, "y": -1}, {"x": 5, "y": -1}, {"x": 5, "y": 4}, {"x": -1, "y": 4}]
+    store = OCRWordStore.from_words([{"text": "a", "boundingBox": {"vertices": vertices}}])
+    assert store.has_box().tolist() == [True]
+    assert store.bounds()[0].tolist() == [-1, -1, 5, 4]
+    assert store.to_words()[0]["boundingBox"]["vertices"] == vertices